@@ -0,0 +1,185 @@
+##########################################
+### Import needed general dependencies ###
+##########################################
+# Add paths for internal modules
+# Import dependencies
+from pathlib import Path
+from sys import path
+# Get the shared active projects folder
+active_projects_folder = Path(__file__).parent.parent
+# Get the shared parent folder
+parent_folder = active_projects_folder.parent
+# Get the shared infrastructure folder
+infrastructure_folder = parent_folder.joinpath("infrastructure")
+# Add the needed paths
+path.insert(0, str(infrastructure_folder.joinpath("board_games")))
+path.insert(0, str(infrastructure_folder.joinpath("common_needs")))
+
+# Built-in modules
+from math import log, log10, sqrt
+from statistics import mean, median
+from time import process_time
+from typing import Any
+
+# Internal modules
+from catan_generator_engine import CatanGeneratorEngine
+
+
+#####################################################
+### Define shared settings for adaptive proposals ###
+#####################################################
+# Define the default (skew_power, normalize_type) settings the controller chooses between
+# Note: infinite skew powers are left out, since they always propose the same few swaps and stall far above every finite setting once those are rejected
+DEFAULT_ADAPTIVE_SETTINGS = [(0, "static"), (1, "static"), (2, "static"), (4, "static"), (8, "static"), (2, "dynamic")]
+
+# Define the smallest mean squared error used when measuring relative reductions (avoids the log of zero once a perfect tiling is reached)
+MIN_TRACKED_MEAN_SQUARED_ERROR = 1e-300
+
+
+############################################
+### Define the adaptive controller class ###
+############################################
+# Note: the controller is an analysis tool for seeing how each proposal setting performs over the phases of a run, not a replacement for a fixed setting
+#       It treats each setting as an arm of a discounted UCB bandit, running swaps in windows of a fixed number of proposals with a single setting each
+#       The reward of a window is its relative MSE reduction per proposal, i.e. log(MSE before / MSE after) / proposals, which stays comparable as the
+#       MSE shrinks and (unlike a reward per CPU-second over a window of a few milliseconds) isn't dominated by timing noise
+#       Older rewards are discounted so that the preferred setting can change between the early and late phases of a run
+#       Every window is logged as a decision (including its CPU time) so the schedule chosen can be analyzed afterwards
+#       Measured over 24-48 seeds of Seafarers: 8 Wide, the finite settings end within about the seed-to-seed noise of each other and neither the
+#       controller nor a fixed early/late schedule beats the best fixed setting, so compareSettings should be used to pick the fixed setting for real runs
+class CatanAdaptiveController:
+	### Initialize the class ###
+	def __init__(self, settings:list = None, window_size:int = 300, discount:float = 0.97, exploration_weight:float = 0.3):
+		# Verify the inputs
+		settings = DEFAULT_ADAPTIVE_SETTINGS if settings is None else settings
+		assert type(settings) == list and len(settings) > 0, "CatanAdaptiveController::__init__: Provided value for 'settings' must be a non-empty list object"
+		for skew_power, normalize_type in settings:
+			assert 0 <= skew_power, "CatanAdaptiveController::__init__: Provided value for 'settings' must contain only non-negative skew powers"
+			assert normalize_type in ["static", "dynamic"], "CatanAdaptiveController::__init__: Provided value for 'settings' must contain only 'static' or 'dynamic' normalize types"
+		assert type(window_size) == int and window_size > 0, "CatanAdaptiveController::__init__: Provided value for 'window_size' must be a positive int object"
+		assert 0 < discount and discount <= 1, "CatanAdaptiveController::__init__: Provided value for 'discount' must be > 0 and <= 1"
+		assert 0 <= exploration_weight, "CatanAdaptiveController::__init__: Provided value for 'exploration_weight' must be non-negative"
+
+		# Store the provided values
+		self.settings = list(settings)
+		self.n_settings = len(settings)
+		self.window_size = window_size
+		self.discount = discount
+		self.exploration_weight = exploration_weight
+
+		# Initialize the storage
+		self.discounted_counts = [0 for _ in range(self.n_settings)]
+		self.discounted_rewards = [0 for _ in range(self.n_settings)]
+		self.decisions = []
+
+	### Define functions for choosing settings and learning from results ###
+	def selectSetting(self) -> int:
+		# Return the index of the setting to use for the next window (trying each setting once before using the UCB scores)
+		for setting_index in range(self.n_settings):
+			if self.discounted_counts[setting_index] == 0:
+				return setting_index
+
+		# Scale the exploration bonus by the spread of the observed rewards so that the bandit is independent of the units of the reward
+		mean_rewards = [self.discounted_rewards[setting_index] / self.discounted_counts[setting_index] for setting_index in range(self.n_settings)]
+		reward_scale = max(mean_rewards) - min(mean_rewards)
+		total_count = sum(self.discounted_counts)
+		scores = [mean_rewards[setting_index] + self.exploration_weight * reward_scale * sqrt(2 * log(max(total_count, 1)) / self.discounted_counts[setting_index]) for setting_index in range(self.n_settings)]
+		return scores.index(max(scores))
+
+	def recordWindow(self, setting_index:int, reward:float):
+		# Discount all previous results and add the reward of the latest window
+		for other_index in range(self.n_settings):
+			self.discounted_counts[other_index] *= self.discount
+			self.discounted_rewards[other_index] *= self.discount
+		self.discounted_counts[setting_index] += 1
+		self.discounted_rewards[setting_index] += reward
+
+	### Define the function which runs an engine under the controller ###
+	def runSwaps(self, engine:Any, n_steps:int) -> list:
+		# Perform the needed number of swap steps on a CatanGeneratorEngine, switching its setting every window, return the pre-swap MSE of each step
+		# Verify the inputs
+		assert type(n_steps) == int and n_steps >= 0, "CatanAdaptiveController::runSwaps: Provided value for 'n_steps' must be a non-negative int object"
+
+		# Run the windows
+		pre_mean_squared_errors = []
+		step_index = 0
+		while step_index < n_steps:
+			# Apply the selected setting to the engine
+			setting_index = self.selectSetting()
+			engine.skew_power, engine.normalize_type = self.settings[setting_index]
+			n_window_steps = min(self.window_size, n_steps - step_index)
+
+			# Run the window, timing only the swaps themselves
+			start_mean_squared_error = engine.mean_squared_error
+			n_acceptances = 0
+			step = engine.step
+			start_time = process_time()
+			for _ in range(n_window_steps):
+				pre_mean_squared_errors.append(engine.mean_squared_error)
+				if step() == True:
+					n_acceptances += 1
+			cpu_seconds = max(process_time() - start_time, 1e-9)
+
+			# Score the window and log the decision
+			end_mean_squared_error = engine.mean_squared_error
+			reward = log(max(start_mean_squared_error, MIN_TRACKED_MEAN_SQUARED_ERROR) / max(end_mean_squared_error, MIN_TRACKED_MEAN_SQUARED_ERROR)) / n_window_steps
+			self.recordWindow(setting_index = setting_index, reward = reward)
+			decision = {}
+			decision["step_index"] = step_index
+			decision["n_steps"] = n_window_steps
+			decision["skew_power"] = self.settings[setting_index][0]
+			decision["normalize_type"] = self.settings[setting_index][1]
+			decision["acceptance_rate"] = n_acceptances / n_window_steps
+			decision["start_mean_squared_error"] = start_mean_squared_error
+			decision["end_mean_squared_error"] = end_mean_squared_error
+			decision["improvement_per_proposal"] = (start_mean_squared_error - end_mean_squared_error) / n_window_steps
+			decision["cpu_seconds"] = cpu_seconds
+			decision["reward"] = reward
+			self.decisions.append(decision)
+			step_index += n_window_steps
+
+		# Return the results
+		return pre_mean_squared_errors
+
+	def getDecisions(self) -> list:
+		# Return the log of every window run so far, in order
+		return [dict(decision) for decision in self.decisions]
+
+
+######################################################################
+### Define the function comparing the controller to fixed settings ###
+######################################################################
+def compareSettings(game_mode:str, n_steps:int, seeds:list, settings:list = None, controller_settings:dict = None) -> list:
+	# Run every fixed setting and the controller for the same seeds and number of steps, return a summary of the final MSEs of each, best first
+	# Note: the mean of log10(MSE) is the score used for ranking, since the final MSEs spread over orders of magnitude between seeds
+	# Verify the inputs
+	assert type(n_steps) == int and n_steps > 0, "compareSettings: Provided value for 'n_steps' must be a positive int object"
+	assert len(seeds) > 0, "compareSettings: Provided value for 'seeds' must be non-empty"
+	settings = DEFAULT_ADAPTIVE_SETTINGS if settings is None else settings
+	controller_settings = {} if controller_settings is None else controller_settings
+
+	# Run every fixed setting and then the controller (None stands for the controller)
+	all_summaries = []
+	for setting in list(settings) + [None]:
+		final_mean_squared_errors = []
+		start_time = process_time()
+		for seed in seeds:
+			if setting is None:
+				engine = CatanGeneratorEngine(game_mode = game_mode, reject_flag = True, seed = seed)
+				CatanAdaptiveController(settings = settings, **controller_settings).runSwaps(engine = engine, n_steps = n_steps)
+			else:
+				engine = CatanGeneratorEngine(game_mode = game_mode, skew_power = setting[0], reject_flag = True, normalize_type = setting[1], seed = seed)
+				engine.runSwaps(n_steps = n_steps)
+			final_mean_squared_errors.append(engine.getMeanSquaredError())
+
+		# Summarize the results of this setting
+		summary = {}
+		summary["setting"] = "adaptive" if setting is None else setting
+		summary["median_mean_squared_error"] = median(final_mean_squared_errors)
+		summary["mean_log10_mean_squared_error"] = mean([log10(max(value, MIN_TRACKED_MEAN_SQUARED_ERROR)) for value in final_mean_squared_errors])
+		summary["cpu_seconds"] = process_time() - start_time
+		all_summaries.append(summary)
+
+	# Return the results
+	all_summaries.sort(key = lambda summary: summary["mean_log10_mean_squared_error"])
+	return all_summaries
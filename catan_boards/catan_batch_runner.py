@@ -0,0 +1,183 @@
+##########################################
+### Import needed general dependencies ###
+##########################################
+# Built-in modules
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+from json import dump, load
+from os import cpu_count, environ
+from pathlib import Path
+from subprocess import STDOUT, run
+from sys import executable
+from time import perf_counter
+
+
+#############################################
+### Define shared settings for batch jobs ###
+#############################################
+# Define the script run by each workflow (relative to this folder)
+SCRIPT_PER_WORKFLOW = {
+	"efficiency_database": "catan_create_efficiency_database.py",
+	"dimensional_analysis": "catan_dimensional_analysis.py"
+}
+
+# Define the settings each workflow receives unless a job overrides them (nothing is opened or shown on a display-less node)
+DEFAULT_SETTINGS_PER_WORKFLOW = {
+	"efficiency_database": {"open_flag": False},
+	"dimensional_analysis": {"show_flag": False}
+}
+
+# Define the setting through which each workflow limits its own worker processes (if it has one), which is set to the thread limit of each job
+WORKER_SETTING_PER_WORKFLOW = {
+	"dimensional_analysis": "n_workers"
+}
+
+# Define the environment variables which limit the threads of numerical libraries (and, from Python 3.13, the default size of multiprocessing pools) within a job
+THREAD_LIMIT_VARIABLES = ["OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "NUMEXPR_NUM_THREADS", "PYTHON_CPU_COUNT"]
+
+# Define the default number of threads each job may use, so that concurrent jobs which parallelize internally don't oversubscribe the cores
+DEFAULT_THREADS_PER_JOB = 1
+
+# Define the names of the files written to the folder of each job
+JOB_CONFIG_NAME = "job_config.json"
+JOB_LOG_NAME = "job.log"
+BATCH_SUMMARY_NAME = "batch_summary.json"
+
+
+################################################
+### Define the functions used by the scripts ###
+################################################
+def parseJobArguments(default_settings:dict, path_names:list) -> dict:
+	# Return the default settings of a script overridden by a job config (--config) and any paths given on the command line (e.g. --results_path)
+	# Note: a job config is a json file of the form {"settings": {...}, "paths": {...}}, as written by runJob
+	#       Paths which are given nowhere are returned as None, in which case the script falls back to a file dialog
+	# Parse the command line
+	parser = ArgumentParser()
+	parser.add_argument("--config", default = None, help = "json job config holding 'settings' and 'paths'")
+	for path_name in path_names:
+		parser.add_argument("--" + path_name, default = None)
+	arguments = parser.parse_args()
+
+	# Override the defaults with the job config (if provided)
+	settings = dict(default_settings)
+	paths = {path_name: None for path_name in path_names}
+	if arguments.config is not None:
+		with open(arguments.config, "r") as config_file:
+			job_config = load(config_file)
+		for key, value in job_config.get("settings", {}).items():
+			assert key in default_settings, "parseJobArguments: Job config setting '" + key + "' is not a setting of this script"
+			settings[key] = value
+		for path_name, path_value in job_config.get("paths", {}).items():
+			assert path_name in path_names, "parseJobArguments: Job config path '" + path_name + "' is not a path of this script"
+			paths[path_name] = path_value
+
+	# Override the paths with any given on the command line and return the results
+	for path_name in path_names:
+		if getattr(arguments, path_name) is not None:
+			paths[path_name] = getattr(arguments, path_name)
+	settings.update(paths)
+	return settings
+
+
+########################################################
+### Define the functions for running batches of jobs ###
+########################################################
+def expandJobs(manifest:dict) -> list:
+	# Return the list of jobs in a manifest, expanding any sweeps (i.e. lists of values per setting) into one job per combination
+	# Note: a manifest has the form {"output_folder": str, "max_workers": int, "n_threads_per_job": int, "jobs": [{"name": str, "workflow": str, "settings": {...}, "paths": {...}, "sweep": {...}}]}
+	#       Paths may contain "{output_folder}" and "{name}", which are replaced by the output folder of the batch and the name of the job
+	#       A job may also set its own "n_threads_per_job", which otherwise comes from the manifest (and then DEFAULT_THREADS_PER_JOB)
+	# Verify the inputs
+	assert type(manifest) == dict and type(manifest.get("jobs")) == list, "expandJobs: Provided value for 'manifest' must be a dict object with a list of jobs"
+
+	# Expand each job
+	all_jobs = []
+	for job in manifest["jobs"]:
+		assert job.get("workflow") in SCRIPT_PER_WORKFLOW, "expandJobs: The workflow of each job must be one of " + ", ".join(SCRIPT_PER_WORKFLOW)
+		assert type(job.get("name")) == str and len(job["name"]) > 0, "expandJobs: Each job must have a non-empty name"
+		n_threads = job.get("n_threads_per_job", manifest.get("n_threads_per_job", DEFAULT_THREADS_PER_JOB))
+		assert type(n_threads) == int and n_threads > 0, "expandJobs: The number of threads per job must be a positive int object"
+		sweep = job.get("sweep", {})
+		sweep_keys = sorted(sweep)
+		for sweep_values in product(*[sweep[key] for key in sweep_keys]):
+			# Get the name and settings of this combination
+			name = job["name"] + "".join(["_" + key + "_" + str(value) for key, value in zip(sweep_keys, sweep_values)])
+			settings = dict(DEFAULT_SETTINGS_PER_WORKFLOW[job["workflow"]])
+			if job["workflow"] in WORKER_SETTING_PER_WORKFLOW:
+				settings[WORKER_SETTING_PER_WORKFLOW[job["workflow"]]] = n_threads
+			settings.update(job.get("settings", {}))
+			settings.update(dict(zip(sweep_keys, sweep_values)))
+			paths = {path_name: str(path_value).replace("{output_folder}", str(manifest.get("output_folder", "."))).replace("{name}", name) for path_name, path_value in job.get("paths", {}).items()}
+			all_jobs.append({"name": name, "workflow": job["workflow"], "settings": settings, "paths": paths, "n_threads": n_threads})
+
+	# Make sure every job writes to its own folder
+	all_names = [job["name"] for job in all_jobs]
+	assert len(set(all_names)) == len(all_names), "expandJobs: Every expanded job must have a unique name"
+	return all_jobs
+
+def runJob(job:dict, output_folder:str) -> dict:
+	# Run a single job as a separate process inside its own folder (holding its config, log and any relative outputs), return a summary of the run
+	# Create the folder of the job and write its config
+	job_folder = Path(output_folder).joinpath(job["name"]).resolve()
+	job_folder.mkdir(parents = True, exist_ok = True)
+	config_path = job_folder.joinpath(JOB_CONFIG_NAME)
+	with open(config_path, "w") as config_file:
+		dump({"settings": job["settings"], "paths": job["paths"]}, config_file, indent = 4)
+
+	# Run the script without a display and limited to the threads of the job, sending its output to the log of the job
+	script_path = Path(__file__).parent.joinpath(SCRIPT_PER_WORKFLOW[job["workflow"]]).resolve()
+	environment = dict(environ)
+	environment["MPLBACKEND"] = "Agg"
+	for variable_name in THREAD_LIMIT_VARIABLES:
+		environment[variable_name] = str(job.get("n_threads", DEFAULT_THREADS_PER_JOB))
+	start_time = perf_counter()
+	with open(job_folder.joinpath(JOB_LOG_NAME), "w") as log_file:
+		return_code = run([executable, str(script_path), "--config", str(config_path)], cwd = str(job_folder), stdout = log_file, stderr = STDOUT, env = environment).returncode
+
+	# Return the results
+	return {"name": job["name"], "workflow": job["workflow"], "return_code": return_code, "seconds": perf_counter() - start_time, "job_folder": str(job_folder)}
+
+def runManifest(manifest_path:str, max_workers:int = None) -> list:
+	# Run every job of a manifest file, up to max_workers at a time (defaulting to the manifest's value and then the number of cores divided by the most threads of any job), return the job summaries
+	# Note: a job which can't be run at all (e.g. its folder can't be written) is recorded as failed with its error, so the rest of the batch still runs
+	# Load the manifest and expand its jobs
+	manifest_path = Path(manifest_path).resolve()
+	with open(manifest_path, "r") as manifest_file:
+		manifest = load(manifest_file)
+	output_folder = Path(manifest.get("output_folder", manifest_path.parent.joinpath(manifest_path.stem))).resolve()
+	manifest["output_folder"] = str(output_folder)
+	all_jobs = expandJobs(manifest = manifest)
+	if max_workers is None:
+		max_workers = manifest.get("max_workers", max(1, (cpu_count() or 1) // max([job["n_threads"] for job in all_jobs], default = 1)))
+	assert type(max_workers) == int and max_workers > 0, "runManifest: The number of workers must be a positive int object"
+
+	# Run the jobs concurrently (each job is its own process, so threads are only used to wait on them)
+	output_folder.mkdir(parents = True, exist_ok = True)
+	with ThreadPoolExecutor(max_workers = max_workers) as executor:
+		all_futures = [executor.submit(runJob, job, str(output_folder)) for job in all_jobs]
+		all_summaries = []
+		for job, future in zip(all_jobs, all_futures):
+			try:
+				summary = future.result()
+			except Exception as exception:
+				summary = {"name": job["name"], "workflow": job["workflow"], "return_code": None, "seconds": 0, "job_folder": str(output_folder.joinpath(job["name"])), "error": repr(exception)}
+			print(("DONE   " if summary["return_code"] == 0 else "FAILED ") + summary["name"] + " (" + str(round(summary["seconds"], 1)) + " seconds)")
+			all_summaries.append(summary)
+
+	# Save and return the summaries
+	with open(output_folder.joinpath(BATCH_SUMMARY_NAME), "w") as summary_file:
+		dump(all_summaries, summary_file, indent = 4)
+	return all_summaries
+
+
+if __name__ == "__main__":
+	# Run the manifest given on the command line
+	parser = ArgumentParser(description = "Run a manifest of catan_boards workflows concurrently without any dialogs")
+	parser.add_argument("manifest_path", help = "json manifest listing the jobs to run")
+	parser.add_argument("--max_workers", type = int, default = None, help = "number of jobs to run at once (defaults to the manifest's value, then the number of cores divided by the threads per job)")
+	arguments = parser.parse_args()
+	all_summaries = runManifest(manifest_path = arguments.manifest_path, max_workers = arguments.max_workers)
+	n_failed = len([summary for summary in all_summaries if summary["return_code"] != 0])
+	print(str(len(all_summaries) - n_failed) + " of " + str(len(all_summaries)) + " jobs succeeded")
+	raise SystemExit(1 if n_failed > 0 else 0)
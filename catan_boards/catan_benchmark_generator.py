@@ -0,0 +1,225 @@
+##########################################
+### Import needed general dependencies ###
+##########################################
+# Add paths for internal modules
+# Import dependencies
+from pathlib import Path
+from sys import path
+# Get the shared active projects folder
+active_projects_folder = Path(__file__).parent.parent
+# Get the shared parent folder
+parent_folder = active_projects_folder.parent
+# Get the shared infrastructure folder
+infrastructure_folder = parent_folder.joinpath("infrastructure")
+# Add the needed paths
+path.insert(0, str(infrastructure_folder.joinpath("board_games")))
+path.insert(0, str(infrastructure_folder.joinpath("common_needs")))
+
+# Built-in modules
+from json import dump, load
+from platform import platform, python_version
+from statistics import median
+from time import perf_counter
+from typing import Any, Callable
+
+# External modules
+import matplotlib
+matplotlib.use("Agg")
+
+# Internal modules
+from catan_board_generator import ALL_GAME_MODES, CATAN_BEVEL_ATTITUDE, CATAN_BEVEL_SIZE, CATAN_SUN_ANGLE, CATAN_SUN_ATTITUDE, CatanGeneratorTiling
+from catan_generator_engine import CatanGeneratorEngine
+
+
+###################################################
+### Define parameters related to the benchmarks ###
+###################################################
+# Define the fixed random seed to use for every measurement
+seed = 0
+
+# Game modes to benchmark
+all_game_modes = ALL_GAME_MODES
+
+# Swap settings to benchmark (every combination is measured)
+all_skew_powers = [0, 1, 2, float("inf")]
+all_reject_flags = [True, False]
+all_normalize_types = ["static", "dynamic"]
+
+# Render settings to benchmark
+all_dpis = [50, 100, 200]
+
+# Number of repeats per measurement (the median is recorded) and operations per repeat
+n_repeats = 5
+n_constructions_per_repeat = 5
+n_entropy_calls_per_repeat = 200
+n_swaps_per_repeat = 200
+n_overwrites_per_repeat = 100
+
+# Baseline settings
+baseline_path = Path(__file__).parent.joinpath("catan_benchmark_baseline.json")
+update_baseline_flag = False
+regression_tolerance = 0.25
+
+
+####################################################
+### Define the helper functions for benchmarking ###
+####################################################
+def timeOperation(operation:Callable, n_operations:int, setup:Callable = None) -> float:
+	# Return the median time per operation (in seconds) over the needed number of repeats
+	# Initialize the list of per-operation times
+	seconds_per_operation = []
+
+	# Time each repeat separately so that outliers can be discarded via the median
+	for _ in range(n_repeats):
+		# Run the untimed setup (if needed)
+		if setup is not None:
+			setup()
+
+		# Time the needed number of operations
+		start_time = perf_counter()
+		for _ in range(n_operations):
+			operation()
+		end_time = perf_counter()
+
+		# Store the time per operation
+		seconds_per_operation.append((end_time - start_time) / n_operations)
+
+	# Return the median value
+	return median(seconds_per_operation)
+
+def createMetric(value:float, unit:str, higher_is_better_flag:bool) -> dict:
+	# Create the dictionary stored for each benchmark metric
+	return {"value": value, "unit": unit, "higher_is_better": higher_is_better_flag}
+
+def getSwapMetricName(skew_power:Any, reject_flag:bool, normalize_type:str, prefix:str = "swapTiles") -> str:
+	# Create the metric name associated with a combination of swap settings
+	return prefix + "[skew_power=" + str(skew_power) + ",reject_flag=" + str(reject_flag) + ",normalize_type=" + normalize_type + "]"
+
+def benchmarkGameMode(game_mode:str) -> dict:
+	# Run all benchmarks for a single game mode and return a dictionary of metrics
+	# Initialize the dictionary of metrics
+	metrics = {}
+
+	# Benchmark the construction of new tilings
+	seconds = timeOperation(operation = lambda: CatanGeneratorTiling(game_mode = game_mode, seed = seed),
+							n_operations = n_constructions_per_repeat)
+	metrics["construction"] = createMetric(value = seconds, unit = "seconds", higher_is_better_flag = False)
+
+	# Benchmark the computation of entropy values
+	tiling = CatanGeneratorTiling(game_mode = game_mode, seed = seed)
+	seconds = timeOperation(operation = tiling.computeEntropyPerTileType, n_operations = n_entropy_calls_per_repeat)
+	metrics["computeEntropyPerTileType"] = createMetric(value = seconds, unit = "seconds", higher_is_better_flag = False)
+
+	# Benchmark swapping for each combination of settings, always starting from the same seeded tiling
+	for skew_power in all_skew_powers:
+		for reject_flag in all_reject_flags:
+			for normalize_type in all_normalize_types:
+				# Create a holder so that the setup can replace the tiling before each repeat
+				holder = {}
+				setup = lambda: holder.update(tiling = CatanGeneratorTiling(game_mode = game_mode, seed = seed))
+				operation = lambda: holder["tiling"].swapTiles(skew_power = skew_power, reject_flag = reject_flag, normalize_type = normalize_type)
+
+				# Time the swaps and store as steps per second
+				seconds = timeOperation(operation = operation, n_operations = n_swaps_per_repeat, setup = setup)
+				metric_name = getSwapMetricName(skew_power = skew_power, reject_flag = reject_flag, normalize_type = normalize_type)
+				metrics[metric_name] = createMetric(value = 1 / seconds, unit = "steps per second", higher_is_better_flag = True)
+
+				# Time the same swaps using the trusted engine for comparison
+				setup = lambda: holder.update(engine = CatanGeneratorEngine(game_mode = game_mode, skew_power = skew_power, reject_flag = reject_flag, normalize_type = normalize_type, seed = seed))
+				operation = lambda: holder["engine"].runSwaps(n_steps = n_swaps_per_repeat)
+				seconds = timeOperation(operation = operation, n_operations = 1, setup = setup) / n_swaps_per_repeat
+				metric_name = getSwapMetricName(skew_power = skew_power, reject_flag = reject_flag, normalize_type = normalize_type, prefix = "CatanGeneratorEngine.runSwaps")
+				metrics[metric_name] = createMetric(value = 1 / seconds, unit = "steps per second", higher_is_better_flag = True)
+
+	# Benchmark overwriting the tiling with a fixed tiling
+	tiling = CatanGeneratorTiling(game_mode = game_mode, seed = seed)
+	fixed_tile_per_polygon = tiling.getTilePerPolygon()
+	seconds = timeOperation(operation = lambda: tiling.overwriteTiling(tile_per_polygon = list(fixed_tile_per_polygon)),
+							n_operations = n_overwrites_per_repeat)
+	metrics["overwriteTiling"] = createMetric(value = seconds, unit = "seconds", higher_is_better_flag = False)
+
+	# Benchmark rendering at each dpi value
+	tiling.preprocessAllBevelInfo(bevel_attitude = CATAN_BEVEL_ATTITUDE, bevel_size = CATAN_BEVEL_SIZE)
+	tiling.preprocessAllSunInfo(sun_angle = CATAN_SUN_ANGLE, sun_attitude = CATAN_SUN_ATTITUDE)
+	for dpi in all_dpis:
+		seconds = timeOperation(operation = lambda: tiling.render(dpi = dpi), n_operations = 1)
+		metrics["render[dpi=" + str(dpi) + "]"] = createMetric(value = seconds, unit = "seconds", higher_is_better_flag = False)
+	tiling.closeFigures()
+
+	# Return the results
+	return metrics
+
+def findRegressions(baseline_results:dict, current_results:dict, tolerance:float) -> list:
+	# Compare current results to baseline results and return a list of descriptions of any regressions
+	# Initialize the list of regressions
+	regressions = []
+
+	# Compare every metric present in both sets of results
+	for game_mode in current_results:
+		# Skip game modes which have no baseline
+		if game_mode not in baseline_results:
+			continue
+
+		for metric_name in current_results[game_mode]:
+			# Skip metrics which have no baseline
+			if metric_name not in baseline_results[game_mode]:
+				continue
+
+			# Get the needed values
+			baseline_value = baseline_results[game_mode][metric_name]["value"]
+			current_value = current_results[game_mode][metric_name]["value"]
+
+			# Compute the relative slowdown (positive means worse) given the direction of the metric
+			if current_results[game_mode][metric_name]["higher_is_better"] == True:
+				slowdown = baseline_value / current_value - 1
+			else:
+				slowdown = current_value / baseline_value - 1
+
+			# Store a description of the regression (if needed)
+			if slowdown > tolerance:
+				regressions.append(game_mode + " :: " + metric_name + " regressed by " + str(round(100 * slowdown, 1)) + "% (" + str(baseline_value) + " -> " + str(current_value) + ")")
+
+	# Return the results
+	return regressions
+
+
+#########################################################################
+### Create the code inside __main__ so that multiprocessing will work ###
+#########################################################################
+if __name__ == "__main__":
+	####################################################
+	### Run the benchmarks for the needed game modes ###
+	####################################################
+	# Initialize the dictionary of results
+	current_results = {}
+
+	# Run the benchmarks for each game mode and display progress
+	for game_mode in all_game_modes:
+		print("Benchmarking '" + game_mode + "'")
+		current_results[game_mode] = benchmarkGameMode(game_mode = game_mode)
+		for metric_name, metric in current_results[game_mode].items():
+			print("    " + metric_name + " ---> " + str(metric["value"]) + " " + metric["unit"])
+
+
+	################################################################
+	### Compare to the baseline and save the results (if needed) ###
+	################################################################
+	# Create the metadata stored alongside the results
+	metadata = {"seed": seed, "n_repeats": n_repeats, "platform": platform(), "python_version": python_version()}
+
+	if update_baseline_flag == True or baseline_path.exists() == False:
+		# Save the current results as the new baseline
+		with open(baseline_path, "w") as baseline_file:
+			dump({"metadata": metadata, "results": current_results}, baseline_file, indent = 4)
+		print("Saved new baseline to '" + str(baseline_path) + "'")
+	else:
+		# Load the baseline results
+		with open(baseline_path, "r") as baseline_file:
+			baseline_results = load(baseline_file)["results"]
+
+		# Find the regressions and fail (if needed)
+		regressions = findRegressions(baseline_results = baseline_results, current_results = current_results, tolerance = regression_tolerance)
+		for regression in regressions:
+			print("REGRESSION: " + regression)
+		assert len(regressions) == 0, "Benchmarks found " + str(len(regressions)) + " regression(s) beyond a tolerance of " + str(regression_tolerance)
+		print("No regressions found relative to '" + str(baseline_path) + "'")
@@ -0,0 +1,214 @@
+##########################################
+### Import needed general dependencies ###
+##########################################
+# Add paths for internal modules
+# Import dependencies
+from pathlib import Path
+from sys import path
+# Get the shared active projects folder
+active_projects_folder = Path(__file__).parent.parent
+# Get the shared parent folder
+parent_folder = active_projects_folder.parent
+# Get the shared infrastructure folder
+infrastructure_folder = parent_folder.joinpath("infrastructure")
+# Add the needed paths
+path.insert(0, str(infrastructure_folder.joinpath("board_games")))
+path.insert(0, str(infrastructure_folder.joinpath("common_needs")))
+
+# Internal modules
+from catan_board_core import ALL_GAME_MODES, ALL_TILE_TYPES, ROW_COUNTS_PER_MODE, computeHexLayout
+
+
+##################################################
+### Define functions for common layout regions ###
+##################################################
+def computeCoastPolygons(game_mode:str) -> list:
+	# Return the indices of the polygons on the outer edge of the layout (i.e. those with fewer than six neighbors)
+	# Verify the inputs
+	assert game_mode in ALL_GAME_MODES, "computeCoastPolygons: Provided value for 'game_mode' must be contained in the list ALL_GAME_MODES"
+
+	# Find the needed polygons and return them
+	neighbor_indices_per_polygon = computeHexLayout(row_counts = ROW_COUNTS_PER_MODE[game_mode])["neighbor_indices_per_polygon"]
+	return [polygon_index for polygon_index in range(len(neighbor_indices_per_polygon)) if len(neighbor_indices_per_polygon[polygon_index]) < 6]
+
+
+#######################################
+### Define the constraint set class ###
+#######################################
+# Note: rules come in three kinds, each checked without rescanning the board
+#       1) forbidden polygons per tile type, stored as per-polygon masks so that CatanGeneratorEngine samples only swaps which respect them
+#       2) separated tile type pairs (e.g. no gold next to gold), stored as an incremental violation counter checked in O(degree) per swap
+#       3) a minimum fraction of land tiles in the largest connected land region, only rechecked by swaps which move water
+#       A constraint set holds per-tiling state once attached, so each engine needs its own instance
+class CatanConstraintSet:
+	### Initialize the class ###
+	def __init__(self, game_mode:str, forbidden_polygons_per_type:dict = None, separated_type_pairs:list = None, min_land_connectivity:float = None):
+		# Verify the inputs
+		assert game_mode in ALL_GAME_MODES, "CatanConstraintSet::__init__: Provided value for 'game_mode' must be contained in the list ALL_GAME_MODES"
+		forbidden_polygons_per_type = {} if forbidden_polygons_per_type is None else forbidden_polygons_per_type
+		separated_type_pairs = [] if separated_type_pairs is None else separated_type_pairs
+		for tile_type in forbidden_polygons_per_type:
+			assert tile_type in ALL_TILE_TYPES, "CatanConstraintSet::__init__: Provided value for 'forbidden_polygons_per_type' must only have valid tile types as keys"
+		for tile_type_1, tile_type_2 in separated_type_pairs:
+			assert tile_type_1 in ALL_TILE_TYPES and tile_type_2 in ALL_TILE_TYPES, "CatanConstraintSet::__init__: Provided value for 'separated_type_pairs' must only contain pairs of valid tile types"
+		if min_land_connectivity is not None:
+			assert 0 < min_land_connectivity and min_land_connectivity <= 1, "CatanConstraintSet::__init__: If provided, value for 'min_land_connectivity' must be > 0 and <= 1"
+
+		# Store the provided values along with the shared adjacency
+		self.game_mode = game_mode
+		self.n_polygons = sum(ROW_COUNTS_PER_MODE[game_mode])
+		self.neighbor_indices_per_polygon = [computeHexLayout(row_counts = ROW_COUNTS_PER_MODE[game_mode])["neighbor_indices_per_polygon"][polygon_index] for polygon_index in range(self.n_polygons)]
+		self.allowed_flag_per_type = {}
+		for tile_type in ALL_TILE_TYPES:
+			forbidden_polygons = set(forbidden_polygons_per_type.get(tile_type, []))
+			self.allowed_flag_per_type[tile_type] = [polygon_index not in forbidden_polygons for polygon_index in range(self.n_polygons)]
+		self.separated_type_pairs = [tuple(type_pair) for type_pair in separated_type_pairs]
+		self.min_land_connectivity = min_land_connectivity
+
+	### Define functions for binding the rules to the codes of an engine ###
+	def attach(self, needed_tile_types:list, code_per_polygon:list):
+		# Encode the rules using the tile codes of a tiling and build the per-pair candidate lists used for sampling legal swaps
+		# Note: candidate_indices[code_1][code_2] holds the polygons holding code_1 at which code_2 is allowed (i.e. which may receive code_2 in a swap)
+		# Store the per-code masks and the separation matrix
+		self.n_types = len(needed_tile_types)
+		self.allowed_flags_per_polygon = [[self.allowed_flag_per_type[tile_type][polygon_index] for tile_type in needed_tile_types] for polygon_index in range(self.n_polygons)]
+		self.separated_flags = [[False for _ in range(self.n_types)] for _ in range(self.n_types)]
+		for tile_type_1, tile_type_2 in self.separated_type_pairs:
+			if tile_type_1 in needed_tile_types and tile_type_2 in needed_tile_types:
+				self.separated_flags[needed_tile_types.index(tile_type_1)][needed_tile_types.index(tile_type_2)] = True
+				self.separated_flags[needed_tile_types.index(tile_type_2)][needed_tile_types.index(tile_type_1)] = True
+		self.water_code = needed_tile_types.index("water") if "water" in needed_tile_types else None
+
+		# Build the candidate lists along with the position of each polygon in each of its lists
+		self.candidate_indices = [[[] for _ in range(self.n_types)] for _ in range(self.n_types)]
+		self.candidate_position_per_polygon = [[None for _ in range(self.n_types)] for _ in range(self.n_polygons)]
+		for polygon_index in range(self.n_polygons):
+			self.addCandidate(polygon_index = polygon_index, code = code_per_polygon[polygon_index])
+
+		# Count the current violations of the separation rules
+		self.n_separation_violations = sum([self.countSeparationViolationsAt(code_per_polygon = code_per_polygon, polygon_index = polygon_index, code = code_per_polygon[polygon_index]) for polygon_index in range(self.n_polygons)]) // 2
+
+	def addCandidate(self, polygon_index:int, code:int):
+		# Add a polygon holding a code to the candidate lists of every code allowed at it
+		for target_code in range(self.n_types):
+			if self.allowed_flags_per_polygon[polygon_index][target_code] == True:
+				self.candidate_position_per_polygon[polygon_index][target_code] = len(self.candidate_indices[code][target_code])
+				self.candidate_indices[code][target_code].append(polygon_index)
+
+	def removeCandidate(self, polygon_index:int, code:int):
+		# Remove a polygon holding a code from its candidate lists (moving the last entry of each list into its slot)
+		for target_code in range(self.n_types):
+			position = self.candidate_position_per_polygon[polygon_index][target_code]
+			if position is not None:
+				candidates = self.candidate_indices[code][target_code]
+				last_polygon_index = candidates.pop()
+				if last_polygon_index != polygon_index:
+					candidates[position] = last_polygon_index
+					self.candidate_position_per_polygon[last_polygon_index][target_code] = position
+				self.candidate_position_per_polygon[polygon_index][target_code] = None
+
+	def restoreCandidates(self, candidate_indices:list):
+		# Restore the order of the candidate lists (e.g. from an engine snapshot) so that sampling continues exactly as before
+		self.candidate_indices = [[list(candidates) for candidates in candidates_per_code] for candidates_per_code in candidate_indices]
+		for target_code in range(self.n_types):
+			for code in range(self.n_types):
+				for position, polygon_index in enumerate(self.candidate_indices[code][target_code]):
+					self.candidate_position_per_polygon[polygon_index][target_code] = position
+
+	### Define functions for checking and applying swaps ###
+	def countSeparationViolationsAt(self, code_per_polygon:list, polygon_index:int, code:int) -> int:
+		# Count the neighbors of a polygon whose codes may not sit next to the provided code
+		separated_flags = self.separated_flags[code]
+		return sum([1 for neighbor_polygon_index in self.neighbor_indices_per_polygon[polygon_index] if separated_flags[code_per_polygon[neighbor_polygon_index]] == True])
+
+	def computeSeparationDelta(self, code_per_polygon:list, polygon_index_1:int, polygon_index_2:int) -> int:
+		# Return the change in the number of separation violations caused by swapping two polygons (in O(degree))
+		code_1 = code_per_polygon[polygon_index_1]
+		code_2 = code_per_polygon[polygon_index_2]
+		before = self.countSeparationViolationsAt(code_per_polygon, polygon_index_1, code_1) + self.countSeparationViolationsAt(code_per_polygon, polygon_index_2, code_2)
+		code_per_polygon[polygon_index_1] = code_2
+		code_per_polygon[polygon_index_2] = code_1
+		after = self.countSeparationViolationsAt(code_per_polygon, polygon_index_1, code_2) + self.countSeparationViolationsAt(code_per_polygon, polygon_index_2, code_1)
+		code_per_polygon[polygon_index_1] = code_1
+		code_per_polygon[polygon_index_2] = code_2
+		return after - before
+
+	def computeLandConnectivity(self, code_per_polygon:list) -> float:
+		# Return the fraction of land polygons in the largest connected region of land
+		land_flags = [code != self.water_code for code in code_per_polygon]
+		n_land = sum(land_flags)
+		visited_flags = [False for _ in range(self.n_polygons)]
+		largest_region_size = 0
+		for start_index in range(self.n_polygons):
+			if land_flags[start_index] == True and visited_flags[start_index] == False:
+				visited_flags[start_index] = True
+				stack = [start_index]
+				region_size = 0
+				while len(stack) > 0:
+					polygon_index = stack.pop()
+					region_size += 1
+					for neighbor_polygon_index in self.neighbor_indices_per_polygon[polygon_index]:
+						if land_flags[neighbor_polygon_index] == True and visited_flags[neighbor_polygon_index] == False:
+							visited_flags[neighbor_polygon_index] = True
+							stack.append(neighbor_polygon_index)
+				largest_region_size = max(largest_region_size, region_size)
+		return largest_region_size / max(n_land, 1)
+
+	def breaksLandConnectivity(self, code_per_polygon:list, polygon_index_1:int, polygon_index_2:int) -> bool:
+		# Return whether swapping two polygons would leave too little of the land connected (only rechecked when water moves)
+		if self.min_land_connectivity is None or self.water_code not in [code_per_polygon[polygon_index_1], code_per_polygon[polygon_index_2]]:
+			return False
+		code_1 = code_per_polygon[polygon_index_1]
+		code_per_polygon[polygon_index_1] = code_per_polygon[polygon_index_2]
+		code_per_polygon[polygon_index_2] = code_1
+		broken_flag = self.computeLandConnectivity(code_per_polygon) < self.min_land_connectivity
+		code_per_polygon[polygon_index_2] = code_per_polygon[polygon_index_1]
+		code_per_polygon[polygon_index_1] = code_1
+		return broken_flag
+
+	def isSwapLegal(self, code_per_polygon:list, polygon_index_1:int, polygon_index_2:int) -> bool:
+		# Return whether swapping two polygons respects the masks and doesn't add separation violations or break the land connectivity
+		code_1 = code_per_polygon[polygon_index_1]
+		code_2 = code_per_polygon[polygon_index_2]
+		if self.allowed_flags_per_polygon[polygon_index_1][code_2] == False or self.allowed_flags_per_polygon[polygon_index_2][code_1] == False:
+			return False
+		if self.computeSeparationDelta(code_per_polygon, polygon_index_1, polygon_index_2) > 0:
+			return False
+		return self.breaksLandConnectivity(code_per_polygon, polygon_index_1, polygon_index_2) == False
+
+	def updateDueToSwap(self, code_per_polygon:list, polygon_index_1:int, polygon_index_2:int, separation_delta:int):
+		# Update the candidate lists and violation counter after two polygons swapped codes (code_per_polygon already holds the new codes)
+		code_1 = code_per_polygon[polygon_index_2]
+		code_2 = code_per_polygon[polygon_index_1]
+		self.removeCandidate(polygon_index = polygon_index_1, code = code_1)
+		self.removeCandidate(polygon_index = polygon_index_2, code = code_2)
+		self.addCandidate(polygon_index = polygon_index_1, code = code_2)
+		self.addCandidate(polygon_index = polygon_index_2, code = code_1)
+		self.n_separation_violations += separation_delta
+
+	### Define functions for measuring and repairing a full tiling ###
+	def computeViolationScore(self, code_per_polygon:list) -> float:
+		# Return a non-negative score which is zero exactly when every rule is satisfied
+		n_mask_violations = sum([1 for polygon_index in range(self.n_polygons) if self.allowed_flags_per_polygon[polygon_index][code_per_polygon[polygon_index]] == False])
+		n_separation_violations = sum([self.countSeparationViolationsAt(code_per_polygon, polygon_index, code_per_polygon[polygon_index]) for polygon_index in range(self.n_polygons)]) // 2
+		connectivity_deficit = 0 if self.min_land_connectivity is None else max(self.min_land_connectivity - self.computeLandConnectivity(code_per_polygon), 0)
+		return n_mask_violations + n_separation_violations + connectivity_deficit
+
+	def repairTiling(self, code_per_polygon:list, random_state:object, max_attempts:int = 100000) -> list:
+		# Randomly swap polygons, keeping any swap which doesn't raise the violation score, until every rule is satisfied (return the repaired codes)
+		code_per_polygon = list(code_per_polygon)
+		score = self.computeViolationScore(code_per_polygon)
+		for _ in range(max_attempts):
+			if score == 0:
+				return code_per_polygon
+			polygon_index_1, polygon_index_2 = random_state.randint(self.n_polygons, size = 2)
+			if code_per_polygon[polygon_index_1] == code_per_polygon[polygon_index_2]:
+				continue
+			code_per_polygon[polygon_index_1], code_per_polygon[polygon_index_2] = code_per_polygon[polygon_index_2], code_per_polygon[polygon_index_1]
+			new_score = self.computeViolationScore(code_per_polygon)
+			if new_score <= score:
+				score = new_score
+			else:
+				code_per_polygon[polygon_index_1], code_per_polygon[polygon_index_2] = code_per_polygon[polygon_index_2], code_per_polygon[polygon_index_1]
+		assert score == 0, "CatanConstraintSet::repairTiling: Unable to find a tiling satisfying every rule within the allowed number of attempts"
+		return code_per_polygon
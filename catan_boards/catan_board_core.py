@@ -0,0 +1,561 @@
+##########################################
+### Import needed general dependencies ###
+##########################################
+# Add paths for internal modules
+# Import dependencies
+from pathlib import Path
+from sys import path
+# Get the shared active projects folder
+active_projects_folder = Path(__file__).parent.parent
+# Get the shared parent folder
+parent_folder = active_projects_folder.parent
+# Get the shared infrastructure folder
+infrastructure_folder = parent_folder.joinpath("infrastructure")
+# Add the needed paths
+path.insert(0, str(infrastructure_folder.joinpath("common_needs")))
+
+# Built-in modules
+from math import cos, log2, pi, sin, sqrt
+from typing import Any
+
+# Internal modules
+from type_helper import isNumeric
+
+# External modules
+from numpy import array, int32, ones, random, uint32
+
+# Note: this module is the lean simulation core shared by the tiling class, the engine and every batch tool
+#       It deliberately imports nothing related to rendering or the GUI (those live in catan_board_generator.py) so that worker processes start quickly
+#       scipy is only imported when ring adjacency is first needed
+
+
+#####################################################
+### Define important shared settings for the game ###
+#####################################################
+# Define the lists of keys shared between multiple dictionaries
+ALL_GAME_MODES = ["Original: 5 Wide", "Original: 6 Wide", "Seafarers: 6 Wide", "Seafarers: 7 Wide", "Seafarers: 8 Wide", "Seafarers: 9 Wide", "Seafarers: 10 Wide"]
+PREDEFINED_GAME_MODES = list(ALL_GAME_MODES)
+ALL_TILE_TYPES = ["brick", "sheep", "stone", "wheat", "wood", "desert", "gold", "water"]
+
+# Define a dictionary of tile count per row for each game mode
+ROW_COUNTS_PER_MODE = {
+	"Original: 5 Wide": [3, 4, 5, 4, 3],				# 19 total
+	"Original: 6 Wide": [3, 4, 5, 6, 5, 4, 3],			# 30 total
+	"Seafarers: 6 Wide": [4, 5, 6, 5, 6, 5, 4],			# 35 total
+	"Seafarers: 7 Wide": [5, 6, 7, 6, 7, 6, 5],			# 42 total
+	"Seafarers: 8 Wide": [6, 7, 8, 7, 8, 7, 6],			# 49 total
+	"Seafarers: 9 Wide": [7, 8, 9, 8, 9, 8, 7],			# 56 total
+	"Seafarers: 10 Wide": [8, 9, 10, 9, 10, 9, 8]		# 63 total
+}
+
+# Define a dictionary of tile count per type for each game mode
+TILE_COUNTS_PER_MODE = {
+	"Original: 5 Wide": {			# 19 total, 18 with numbers
+		"brick": 3,
+		"sheep": 4,
+		"stone": 3,
+		"wheat": 4,
+		"wood": 4,
+		"desert": 1,
+		"gold": 0,
+		"water": 0
+	},
+	"Original: 6 Wide": {			# 30 total, 28 with numbers
+		"brick": 5,
+		"sheep": 6,
+		"stone": 5,
+		"wheat": 6,
+		"wood": 6,
+		"desert": 2,
+		"gold": 0,
+		"water": 0
+	},
+	"Seafarers: 6 Wide": {			# 35 total, 24 with numbers
+		"brick": 4,
+		"sheep": 5,
+		"stone": 4,
+		"wheat": 4,
+		"wood": 5,
+		"desert": 1,
+		"gold": 2,
+		"water": 10
+	},
+	"Seafarers: 7 Wide": {			# 42 total, 25 with numbers
+		"brick": 4,
+		"sheep": 5,
+		"stone": 4,
+		"wheat": 5,
+		"wood": 5,
+		"desert": 1,
+		"gold": 2,
+		"water": 16
+	},
+	"Seafarers: 8 Wide": {			# 49 total, 27 with numbers
+		"brick": 5,
+		"sheep": 5,
+		"stone": 5,
+		"wheat": 5,
+		"wood": 5,
+		"desert": 2,
+		"gold": 2,
+		"water": 20
+	},
+	"Seafarers: 9 Wide": {			# 56 total, 30 with numbers
+		"brick": 5,
+		"sheep": 6,
+		"stone": 5,
+		"wheat": 6,
+		"wood": 6,
+		"desert": 2,
+		"gold": 2,
+		"water": 24
+	},
+	"Seafarers: 10 Wide": {			# 63 total, 33 with numbers
+		"brick": 6,
+		"sheep": 6,
+		"stone": 6,
+		"wheat": 6,
+		"wood": 6,
+		"desert": 3,
+		"gold": 3,
+		"water": 27
+	}
+}
+
+# Define a dictionary of number counts for each game mode
+NUMBER_COUNTS_PER_MODE = {
+	"Original: 5 Wide": {			# 20 total
+		2: 1,
+		3: 2,
+		4: 2,
+		5: 2,
+		6: 2,
+		8: 2,
+		9: 2,
+		10: 2,
+		11: 2,
+		12: 1
+	},
+	"Original: 6 Wide": {			# 28 total
+		2: 2,
+		3: 3,
+		4: 3,
+		5: 3,
+		6: 3,
+		8: 3,
+		9: 3,
+		10: 3,
+		11: 3,
+		12: 2
+	},
+	"Seafarers: 6 Wide": {			# 26 total
+		2: 2,
+		3: 2,
+		4: 3,
+		5: 3,
+		6: 3,
+		8: 3,
+		9: 3,
+		10: 3,
+		11: 2,
+		12: 2
+	},
+	"Seafarers: 7 Wide": {			# 28 total
+		2: 2,
+		3: 3,
+		4: 3,
+		5: 3,
+		6: 3,
+		8: 3,
+		9: 3,
+		10: 3,
+		11: 3,
+		12: 2
+	},
+	"Seafarers: 8 Wide": {			# 28 total
+		2: 2,
+		3: 3,
+		4: 3,
+		5: 3,
+		6: 3,
+		8: 3,
+		9: 3,
+		10: 3,
+		11: 3,
+		12: 2
+	},
+	"Seafarers: 9 Wide": {			# 32 total
+		2: 2,
+		3: 3,
+		4: 4,
+		5: 4,
+		6: 3,
+		8: 3,
+		9: 4,
+		10: 4,
+		11: 3,
+		12: 2
+	},
+	"Seafarers: 10 Wide": {			# 34 total
+		2: 2,
+		3: 3,
+		4: 4,
+		5: 4,
+		6: 4,
+		8: 4,
+		9: 4,
+		10: 4,
+		11: 3,
+		12: 2
+	}
+}
+
+# Define the target efficiency values for each game mode and tile type
+# Initialize the dictionary
+TARGET_EFFICIENCY_PER_TUPLE = {}
+# Add information for brick
+TARGET_EFFICIENCY_PER_TUPLE[("Original: 5 Wide", "brick")] = 0.9
+TARGET_EFFICIENCY_PER_TUPLE[("Original: 6 Wide", "brick")] = 0.9
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 6 Wide", "brick")] = 0.85
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 7 Wide", "brick")] = 0.85
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 8 Wide", "brick")] = 0.85
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 9 Wide", "brick")] = 0.85
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 10 Wide", "brick")] = 0.85
+# Add information for sheep
+TARGET_EFFICIENCY_PER_TUPLE[("Original: 5 Wide", "sheep")] = 0.9
+TARGET_EFFICIENCY_PER_TUPLE[("Original: 6 Wide", "sheep")] = 0.9
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 6 Wide", "sheep")] = 0.85
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 7 Wide", "sheep")] = 0.85
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 8 Wide", "sheep")] = 0.85
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 9 Wide", "sheep")] = 0.85
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 10 Wide", "sheep")] = 0.85
+# Add information for stone
+TARGET_EFFICIENCY_PER_TUPLE[("Original: 5 Wide", "stone")] = 0.85
+TARGET_EFFICIENCY_PER_TUPLE[("Original: 6 Wide", "stone")] = 0.85
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 6 Wide", "stone")] = 0.8
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 7 Wide", "stone")] = 0.8
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 8 Wide", "stone")] = 0.8
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 9 Wide", "stone")] = 0.8
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 10 Wide", "stone")] = 0.8
+# Add information for wheat
+TARGET_EFFICIENCY_PER_TUPLE[("Original: 5 Wide", "wheat")] = 0.9
+TARGET_EFFICIENCY_PER_TUPLE[("Original: 6 Wide", "wheat")] = 0.9
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 6 Wide", "wheat")] = 0.85
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 7 Wide", "wheat")] = 0.85
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 8 Wide", "wheat")] = 0.85
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 9 Wide", "wheat")] = 0.85
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 10 Wide", "wheat")] = 0.85
+# Add information for wood
+TARGET_EFFICIENCY_PER_TUPLE[("Original: 5 Wide", "wood")] = 0.9
+TARGET_EFFICIENCY_PER_TUPLE[("Original: 6 Wide", "wood")] = 0.9
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 6 Wide", "wood")] = 0.85
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 7 Wide", "wood")] = 0.85
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 8 Wide", "wood")] = 0.85
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 9 Wide", "wood")] = 0.85
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 10 Wide", "wood")] = 0.85
+# Add information for desert
+TARGET_EFFICIENCY_PER_TUPLE[("Original: 5 Wide", "desert")] = 0.8
+TARGET_EFFICIENCY_PER_TUPLE[("Original: 6 Wide", "desert")] = 0.8
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 6 Wide", "desert")] = 0.5
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 7 Wide", "desert")] = 0.5
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 8 Wide", "desert")] = 0.5
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 9 Wide", "desert")] = 0.5
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 10 Wide", "desert")] = 0.5
+# Add information for gold
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 6 Wide", "gold")] = 0.4
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 7 Wide", "gold")] = 0.4
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 8 Wide", "gold")] = 0.4
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 9 Wide", "gold")] = 0.3
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 10 Wide", "gold")] = 0.3
+# Add information for water
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 6 Wide", "water")] = 0.4
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 7 Wide", "water")] = 0.6
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 8 Wide", "water")] = 0.6
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 9 Wide", "water")] = 0.6
+TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 10 Wide", "water")] = 0.6
+
+# Define the cache of layout symmetries for each game mode (filled on first use)
+SYMMETRY_PERMUTATIONS_PER_MODE = {}
+
+# Define the cache of ring adjacency matrices for each game mode (filled on first use and extended when more rings are needed)
+RING_ADJACENCY_PER_MODE = {}
+
+# Define a marginal Shannon entropy function
+def computeMarginalEntropy(prob_value:Any) -> float:
+	# Compute the marginal Shannon entropy associated with a probability value
+	# Verify the inputs
+	assert isNumeric(prob_value, include_numpy_flag = True) == True, "computeMarginalEntropy: Provided value for 'prob_value' must be numeric"
+	assert 0 <= prob_value and prob_value <= 1, "computeMarginalEntropy: Provided value for 'prob_value' must be >= 0 and <= 1"
+
+	# Compute the needed value and return it
+	if prob_value in [0, 1]:
+		return 0
+	else:
+		return prob_value * log2(1 / prob_value)
+
+
+###################################################
+### Define functions for parametric hex layouts ###
+###################################################
+def computeHexLayout(row_counts:list) -> dict:
+	# Compute the polygon centers and adjacency of a layout given its tile count per row, in time linear in the number of polygons
+	# Verify the inputs
+	assert type(row_counts) == list and len(row_counts) > 0, "computeHexLayout: Provided value for 'row_counts' must be a non-empty list object"
+	for row_count in row_counts:
+		assert type(row_count) == int and row_count > 0, "computeHexLayout: Provided value for 'row_counts' must contain only positive int objects"
+
+	# Create the lists of x-value and y-value shifts associated with each polygon, also index polygons by their grid position
+	# Note: x_shift = sqrt(3) * (col_index - row_count / 2), so 2 * col_index - row_count is an exact integer key for the x-value
+	x_shift_per_polygon = []
+	y_shift_per_polygon = []
+	polygon_index_per_position = {}
+	for row_index in range(len(row_counts)):
+		y_shift = 3 / 2 * row_index
+		for col_index in range(row_counts[row_index]):
+			x_shift = sqrt(3) * (col_index - row_counts[row_index] / 2)
+			polygon_index_per_position[(row_index, 2 * col_index - row_counts[row_index])] = len(x_shift_per_polygon)
+			x_shift_per_polygon.append(x_shift)
+			y_shift_per_polygon.append(y_shift)
+
+	# Determine the indices adjacent to each polygon by looking up the six possible neighboring grid positions
+	# Note: neighbors are a distance of sqrt(3) apart, i.e. 2 integer x-units in the same row or 1 integer x-unit in an adjacent row
+	neighbor_offsets = [(0, -2), (0, 2), (-1, -1), (-1, 1), (1, -1), (1, 1)]
+	neighbor_indices_per_polygon = {}
+	for (row_index, x_key), polygon_index in polygon_index_per_position.items():
+		neighbor_indices = []
+		for row_offset, x_offset in neighbor_offsets:
+			neighbor_position = (row_index + row_offset, x_key + x_offset)
+			if neighbor_position in polygon_index_per_position:
+				neighbor_indices.append(polygon_index_per_position[neighbor_position])
+		neighbor_indices_per_polygon[polygon_index] = sorted(neighbor_indices)
+
+	# Return the results
+	return {"x_shift_per_polygon": x_shift_per_polygon, "y_shift_per_polygon": y_shift_per_polygon, "neighbor_indices_per_polygon": neighbor_indices_per_polygon}
+
+def computeSymmetryPermutations(row_counts:list) -> list:
+	# Compute the polygon index permutations (including the identity) under which the layout is unchanged, i.e. its rotations and reflections
+	# Get the polygon centers relative to the center of the layout
+	hex_layout = computeHexLayout(row_counts = row_counts)
+	n_polygons = len(hex_layout["x_shift_per_polygon"])
+	x_center = sum(hex_layout["x_shift_per_polygon"]) / n_polygons
+	y_center = sum(hex_layout["y_shift_per_polygon"]) / n_polygons
+	all_centers = [(hex_layout["x_shift_per_polygon"][polygon_index] - x_center, hex_layout["y_shift_per_polygon"][polygon_index] - y_center) for polygon_index in range(n_polygons)]
+
+	# Index the polygons by their rounded centers so that transformed centers can be looked up
+	polygon_index_per_center = {(round(x_value, 6), round(y_value, 6)): polygon_index for polygon_index, (x_value, y_value) in enumerate(all_centers)}
+
+	# Try each rotation by a multiple of 60 degrees, both with and without a reflection across the x-axis
+	symmetry_permutations = []
+	for reflect_flag in [False, True]:
+		for rotation_index in range(6):
+			# Get the rotation matrix entries
+			angle = rotation_index * pi / 3
+			cos_value = cos(angle)
+			sin_value = sin(angle)
+
+			# Map each polygon center and keep the permutation only if every center lands on another center
+			permutation = []
+			for x_value, y_value in all_centers:
+				if reflect_flag == True:
+					y_value = -y_value
+				mapped_center = (round(cos_value * x_value - sin_value * y_value, 6), round(sin_value * x_value + cos_value * y_value, 6))
+				if mapped_center not in polygon_index_per_center:
+					break
+				permutation.append(polygon_index_per_center[mapped_center])
+			if len(permutation) == n_polygons:
+				symmetry_permutations.append(permutation)
+
+	# Return the results
+	return symmetry_permutations
+
+def computeRingAdjacency(row_counts:list, n_rings:int) -> list:
+	# Compute a sparse adjacency matrix for each ring of a layout, where ring k links every pair of polygons exactly k steps apart
+	# Verify the inputs
+	assert type(n_rings) == int and n_rings > 0, "computeRingAdjacency: Provided value for 'n_rings' must be a positive int object"
+
+	# Import scipy only when first needed (keeping it out of the start-up of every worker)
+	from scipy.sparse import csr_matrix, identity
+
+	# Build the sparse adjacency matrix of the immediate neighbors
+	neighbor_indices_per_polygon = computeHexLayout(row_counts = row_counts)["neighbor_indices_per_polygon"]
+	n_polygons = len(neighbor_indices_per_polygon)
+	row_indices = [polygon_index for polygon_index in range(n_polygons) for _ in neighbor_indices_per_polygon[polygon_index]]
+	col_indices = [neighbor_index for polygon_index in range(n_polygons) for neighbor_index in neighbor_indices_per_polygon[polygon_index]]
+	adjacency = csr_matrix((ones(len(row_indices), dtype = int32), (row_indices, col_indices)), shape = (n_polygons, n_polygons))
+
+	# Grow the reachable sets one step at a time, keeping only the newly reached polygons as each ring
+	reached = identity(n_polygons, dtype = int32, format = "csr")
+	ring_adjacencies = []
+	for _ in range(n_rings):
+		next_reached = ((reached + reached @ adjacency) > 0).astype(int32)
+		ring_adjacency = (next_reached - reached).tocsr()
+		ring_adjacency.eliminate_zeros()
+		ring_adjacencies.append(ring_adjacency)
+		reached = next_reached
+
+	# Return the results
+	return ring_adjacencies
+
+def getRingNeighborIndices(game_mode:str, n_rings:int) -> list:
+	# Return the sorted indices of the polygons in each ring around each polygon of a game mode, i.e. result[ring_index][polygon_index] for rings 1 to n_rings
+	# Verify the inputs
+	assert game_mode in ALL_GAME_MODES, "getRingNeighborIndices: Provided value for 'game_mode' must be contained in the list ALL_GAME_MODES"
+	assert type(n_rings) == int and n_rings > 0, "getRingNeighborIndices: Provided value for 'n_rings' must be a positive int object"
+
+	# Compute the ring adjacency matrices once per game mode (recomputing only if more rings are needed)
+	if game_mode not in RING_ADJACENCY_PER_MODE or len(RING_ADJACENCY_PER_MODE[game_mode]) < n_rings:
+		RING_ADJACENCY_PER_MODE[game_mode] = computeRingAdjacency(row_counts = ROW_COUNTS_PER_MODE[game_mode], n_rings = n_rings)
+
+	# Read the neighbor lists off the compressed rows
+	neighbor_indices_per_ring = []
+	for ring_adjacency in RING_ADJACENCY_PER_MODE[game_mode][:n_rings]:
+		indptr = ring_adjacency.indptr
+		indices = ring_adjacency.indices
+		neighbor_indices_per_ring.append([sorted(indices[indptr[polygon_index]:indptr[polygon_index + 1]].tolist()) for polygon_index in range(ring_adjacency.shape[0])])
+	return neighbor_indices_per_ring
+
+def canonicalizeTiling(game_mode:str, tile_per_polygon:list) -> list:
+	# Return the representative of the tiling under the symmetries of its game mode, i.e. the lexicographically smallest tile code sequence
+	# Verify the inputs
+	assert game_mode in ALL_GAME_MODES, "canonicalizeTiling: Provided value for 'game_mode' must be contained in the list ALL_GAME_MODES"
+	assert len(tile_per_polygon) == sum(ROW_COUNTS_PER_MODE[game_mode]), "canonicalizeTiling: Provided value for 'tile_per_polygon' must have one entry per polygon of the game mode"
+
+	# Compute the symmetries of the game mode once and reuse them afterwards
+	if game_mode not in SYMMETRY_PERMUTATIONS_PER_MODE:
+		SYMMETRY_PERMUTATIONS_PER_MODE[game_mode] = computeSymmetryPermutations(row_counts = ROW_COUNTS_PER_MODE[game_mode])
+
+	# Find the transformed tiling with the smallest sequence of tile codes
+	# Note: polygon permutation[i] receives the tile of polygon i under the symmetry
+	code_per_tile = {tile_type: code for code, tile_type in enumerate(ALL_TILE_TYPES)}
+	best_codes = None
+	for permutation in SYMMETRY_PERMUTATIONS_PER_MODE[game_mode]:
+		transformed_codes = [0] * len(tile_per_polygon)
+		for polygon_index, tile_type in enumerate(tile_per_polygon):
+			transformed_codes[permutation[polygon_index]] = code_per_tile[tile_type]
+		if best_codes is None or transformed_codes < best_codes:
+			best_codes = transformed_codes
+
+	# Return the results as tile types
+	return [ALL_TILE_TYPES[code] for code in best_codes]
+
+def distributeCountsByProportion(n_total:int, proportion_per_key:dict) -> dict:
+	# Split a total count into integer counts per key which follow the provided proportions (using the largest remainder method)
+	# Verify the inputs
+	assert type(n_total) == int and n_total >= 0, "distributeCountsByProportion: Provided value for 'n_total' must be a non-negative int object"
+	assert type(proportion_per_key) == dict and len(proportion_per_key) > 0, "distributeCountsByProportion: Provided value for 'proportion_per_key' must be a non-empty dict object"
+	for value in proportion_per_key.values():
+		assert isNumeric(value, include_numpy_flag = True) == True and value >= 0, "distributeCountsByProportion: Provided value for 'proportion_per_key' must have non-negative numeric values"
+	normalizer = sum(list(proportion_per_key.values()))
+	assert normalizer > 0, "distributeCountsByProportion: Provided value for 'proportion_per_key' must have at least one positive value"
+
+	# Assign the floor of each exact share, then hand the remaining counts to the keys with the largest remainders
+	exact_share_per_key = {key: n_total * proportion_per_key[key] / normalizer for key in proportion_per_key}
+	count_per_key = {key: int(exact_share_per_key[key]) for key in proportion_per_key}
+	n_remaining = n_total - sum(list(count_per_key.values()))
+	for key in sorted(proportion_per_key, key = lambda key: count_per_key[key] - exact_share_per_key[key])[:n_remaining]:
+		count_per_key[key] += 1
+
+	# Return the results
+	return count_per_key
+
+def interpolateTargetEfficiencies(tile_counts:dict) -> dict:
+	# Interpolate target efficiency values for a new tile distribution from the predefined game modes, using the water fraction as the abscissa
+	# Compute the water fraction of the new tile distribution
+	water_fraction = tile_counts["water"] / sum(list(tile_counts.values()))
+
+	# Interpolate piecewise linearly (clamping at the ends) over the predefined game modes which use each tile type
+	target_efficiency_per_type = {}
+	for tile_type in ALL_TILE_TYPES:
+		# Collect the water fraction and target efficiency of each predefined game mode using this tile type, averaging repeated water fractions
+		targets_per_fraction = {}
+		for game_mode in PREDEFINED_GAME_MODES:
+			if (game_mode, tile_type) in TARGET_EFFICIENCY_PER_TUPLE:
+				mode_water_fraction = TILE_COUNTS_PER_MODE[game_mode]["water"] / sum(ROW_COUNTS_PER_MODE[game_mode])
+				targets_per_fraction.setdefault(mode_water_fraction, []).append(TARGET_EFFICIENCY_PER_TUPLE[(game_mode, tile_type)])
+		all_fractions = sorted(targets_per_fraction)
+		all_targets = [sum(targets_per_fraction[fraction]) / len(targets_per_fraction[fraction]) for fraction in all_fractions]
+
+		# Interpolate the target at the needed water fraction
+		if water_fraction <= all_fractions[0]:
+			target_efficiency_per_type[tile_type] = all_targets[0]
+		elif water_fraction >= all_fractions[-1]:
+			target_efficiency_per_type[tile_type] = all_targets[-1]
+		else:
+			for fraction_index in range(len(all_fractions) - 1):
+				fraction_1 = all_fractions[fraction_index]
+				fraction_2 = all_fractions[fraction_index + 1]
+				if fraction_1 <= water_fraction and water_fraction <= fraction_2:
+					weight = (water_fraction - fraction_1) / (fraction_2 - fraction_1)
+					target_efficiency_per_type[tile_type] = (1 - weight) * all_targets[fraction_index] + weight * all_targets[fraction_index + 1]
+					break
+
+	# Return the results
+	return target_efficiency_per_type
+
+def createGameMode(game_mode:str, tile_proportions:dict, row_counts:list = None, hex_radius:int = None, target_efficiency_per_type:dict = None) -> str:
+	# Register a new game mode built from row counts or a hex radius plus tile proportions, return the name of the game mode
+	# Verify the inputs
+	assert type(game_mode) == str and len(game_mode) > 0, "createGameMode: Provided value for 'game_mode' must be a non-empty str object"
+	assert game_mode not in ALL_GAME_MODES, "createGameMode: Provided value for 'game_mode' must not already be contained in the list ALL_GAME_MODES"
+	assert type(tile_proportions) == dict, "createGameMode: Provided value for 'tile_proportions' must be a dict object"
+	for tile_type in tile_proportions:
+		assert tile_type in ALL_TILE_TYPES, "createGameMode: Provided value for 'tile_proportions' must only have valid tile types as keys"
+	assert (row_counts is None) != (hex_radius is None), "createGameMode: Exactly one of 'row_counts' and 'hex_radius' must be provided"
+	if hex_radius is not None:
+		assert type(hex_radius) == int and hex_radius > 0, "createGameMode: If provided, value for 'hex_radius' must be a positive int object"
+	if target_efficiency_per_type is not None:
+		assert type(target_efficiency_per_type) == dict, "createGameMode: If provided, value for 'target_efficiency_per_type' must be a dict object"
+
+	# Get the tile count per row (a hex of radius r has rows of r + 1, ..., 2r + 1, ..., r + 1 tiles)
+	if hex_radius is not None:
+		row_counts = [2 * hex_radius + 1 - abs(row_index - hex_radius) for row_index in range(2 * hex_radius + 1)]
+	n_polygons = sum(row_counts)
+
+	# Compute the tile counts from the proportions
+	full_tile_proportions = {tile_type: tile_proportions.get(tile_type, 0) for tile_type in ALL_TILE_TYPES}
+	tile_counts = distributeCountsByProportion(n_total = n_polygons, proportion_per_key = full_tile_proportions)
+	assert len([tile_type for tile_type in ALL_TILE_TYPES if tile_counts[tile_type] > 0]) >= 2, "createGameMode: Provided value for 'tile_proportions' must result in at least 2 tile types being used"
+
+	# Scale the number distribution of the largest predefined game mode to the tiles which receive numbers
+	n_numbered_tiles = n_polygons - tile_counts["desert"] - tile_counts["water"]
+	number_counts = distributeCountsByProportion(n_total = n_numbered_tiles, proportion_per_key = NUMBER_COUNTS_PER_MODE["Seafarers: 10 Wide"])
+
+	# Get the target efficiency values, interpolating any which weren't provided
+	interpolated_target_per_type = interpolateTargetEfficiencies(tile_counts = tile_counts)
+	if target_efficiency_per_type is not None:
+		interpolated_target_per_type.update(target_efficiency_per_type)
+
+	# Register the new game mode in all of the shared dictionaries
+	ALL_GAME_MODES.append(game_mode)
+	ROW_COUNTS_PER_MODE[game_mode] = list(row_counts)
+	TILE_COUNTS_PER_MODE[game_mode] = tile_counts
+	NUMBER_COUNTS_PER_MODE[game_mode] = number_counts
+	for tile_type in ALL_TILE_TYPES:
+		if tile_counts[tile_type] > 0:
+			TARGET_EFFICIENCY_PER_TUPLE[(game_mode, tile_type)] = interpolated_target_per_type[tile_type]
+
+	# Return the name of the game mode
+	return game_mode
+
+
+#######################################################
+### Define functions for serializing random streams ###
+#######################################################
+def snapshotRandomState(random_state:random.RandomState) -> dict:
+	# Return a JSON-serializable copy of the full state of a random stream
+	# Verify the inputs
+	assert type(random_state) == random.RandomState, "snapshotRandomState: Provided value for 'random_state' must be a numpy RandomState object"
+
+	# Convert the state tuple to plain values and return it
+	bit_generator_name, keys, position, has_gauss, cached_gaussian = random_state.get_state()
+	return {"bit_generator": bit_generator_name, "keys": [int(key) for key in keys], "position": int(position), "has_gauss": int(has_gauss), "cached_gaussian": float(cached_gaussian)}
+
+def restoreRandomState(random_snapshot:dict) -> random.RandomState:
+	# Create a random stream which continues exactly where the one passed to snapshotRandomState left off
+	# Verify the inputs
+	assert type(random_snapshot) == dict, "restoreRandomState: Provided value for 'random_snapshot' must be a dict object"
+
+	# Create the random stream and set its state
+	random_state = random.RandomState()
+	random_state.set_state((random_snapshot["bit_generator"], array(random_snapshot["keys"], dtype = uint32), random_snapshot["position"], random_snapshot["has_gauss"], random_snapshot["cached_gaussian"]))
+	return random_state
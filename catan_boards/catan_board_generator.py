@@ -16,21 +16,28 @@ path.insert(0, str(infrastructure_folder.joinpath("board_games")))
 path.insert(0, str(infrastructure_folder.joinpath("common_needs")))
 
 # Built-in modules
-from math import log2, sqrt
-from typing import Any
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+from math import log2
+from queue import Empty, Queue
+from threading import Event, Thread
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
 
 # Internal modules
-from Board import Board
+from catan_board_core import ALL_GAME_MODES, ALL_TILE_TYPES, NUMBER_COUNTS_PER_MODE, PREDEFINED_GAME_MODES, RING_ADJACENCY_PER_MODE, ROW_COUNTS_PER_MODE, SYMMETRY_PERMUTATIONS_PER_MODE, TARGET_EFFICIENCY_PER_TUPLE, TILE_COUNTS_PER_MODE, canonicalizeTiling, computeHexLayout, computeMarginalEntropy, computeRingAdjacency, computeSymmetryPermutations, createGameMode, distributeCountsByProportion, getRingNeighborIndices, interpolateTargetEfficiencies, restoreRandomState, snapshotRandomState
 from color_helper import RGB
-from Polygon import HEXAGON_REGULAR_TALL
 from privacy_helper import privacyDecorator
-from tkinter_helper import createCanvas, createRectangle, createWindow
-from type_helper import isListWithStringEntries, isNumeric, tolerantlyCompare
+from type_helper import isListWithStringEntries, isNumeric
 
 # External modules
 from numpy import random
-from PIL import Image
+if TYPE_CHECKING:
+	from PIL import Image
 
+# Note: the simulation core (game settings, layouts and game modes) lives in catan_board_core.py and is re-exported here for existing callers
+#       The Board and Polygon rendering modules are only imported when a tiling is first rendered, and the tkinter and PIL GUI modules only when the GUI is created
+#       The GUI renders boards in a separate process using the non-GUI Agg backend, since matplotlib figures must not be created off the Tk thread
 
 
 #####################################################
@@ -42,247 +49,6 @@ CATAN_BEVEL_SIZE = 0.1
 CATAN_SUN_ANGLE = 120
 CATAN_SUN_ATTITUDE = 35
 
-# Define the lists of keys shared between multiple dictionaries
-ALL_GAME_MODES = ["Original: 5 Wide", "Original: 6 Wide", "Seafarers: 6 Wide", "Seafarers: 7 Wide", "Seafarers: 8 Wide", "Seafarers: 9 Wide", "Seafarers: 10 Wide"]
-ALL_TILE_TYPES = ["brick", "sheep", "stone", "wheat", "wood", "desert", "gold", "water"]
-
-# Define a dictionary of tile count per row for each game mode
-ROW_COUNTS_PER_MODE = {
-	"Original: 5 Wide": [3, 4, 5, 4, 3],				# 19 total
-	"Original: 6 Wide": [3, 4, 5, 6, 5, 4, 3],			# 30 total
-	"Seafarers: 6 Wide": [4, 5, 6, 5, 6, 5, 4],			# 35 total
-	"Seafarers: 7 Wide": [5, 6, 7, 6, 7, 6, 5],			# 42 total
-	"Seafarers: 8 Wide": [6, 7, 8, 7, 8, 7, 6],			# 49 total
-	"Seafarers: 9 Wide": [7, 8, 9, 8, 9, 8, 7],			# 56 total
-	"Seafarers: 10 Wide": [8, 9, 10, 9, 10, 9, 8]		# 63 total
-}
-
-# Define a dictionary of tile count per type for each game mode
-TILE_COUNTS_PER_MODE = {
-	"Original: 5 Wide": {			# 19 total, 18 with numbers
-		"brick": 3,
-		"sheep": 4,
-		"stone": 3,
-		"wheat": 4,
-		"wood": 4,
-		"desert": 1,
-		"gold": 0,
-		"water": 0
-	},
-	"Original: 6 Wide": {			# 30 total, 28 with numbers
-		"brick": 5,
-		"sheep": 6,
-		"stone": 5,
-		"wheat": 6,
-		"wood": 6,
-		"desert": 2,
-		"gold": 0,
-		"water": 0
-	},
-	"Seafarers: 6 Wide": {			# 35 total, 24 with numbers
-		"brick": 4,
-		"sheep": 5,
-		"stone": 4,
-		"wheat": 4,
-		"wood": 5,
-		"desert": 1,
-		"gold": 2,
-		"water": 10
-	},
-	"Seafarers: 7 Wide": {			# 42 total, 25 with numbers
-		"brick": 4,
-		"sheep": 5,
-		"stone": 4,
-		"wheat": 5,
-		"wood": 5,
-		"desert": 1,
-		"gold": 2,
-		"water": 16
-	},
-	"Seafarers: 8 Wide": {			# 49 total, 27 with numbers
-		"brick": 5,
-		"sheep": 5,
-		"stone": 5,
-		"wheat": 5,
-		"wood": 5,
-		"desert": 2,
-		"gold": 2,
-		"water": 20
-	},
-	"Seafarers: 9 Wide": {			# 56 total, 30 with numbers
-		"brick": 5,
-		"sheep": 6,
-		"stone": 5,
-		"wheat": 6,
-		"wood": 6,
-		"desert": 2,
-		"gold": 2,
-		"water": 24
-	},
-	"Seafarers: 10 Wide": {			# 63 total, 33 with numbers
-		"brick": 6,
-		"sheep": 6,
-		"stone": 6,
-		"wheat": 6,
-		"wood": 6,
-		"desert": 3,
-		"gold": 3,
-		"water": 27
-	}
-}
-
-# Define a dictionary of number counts for each game mode
-NUMBER_COUNTS_PER_MODE = {
-	"Original: 5 Wide": {			# 20 total
-		2: 1,
-		3: 2,
-		4: 2,
-		5: 2,
-		6: 2,
-		8: 2,
-		9: 2,
-		10: 2,
-		11: 2,
-		12: 1
-	},
-	"Original: 6 Wide": {			# 28 total
-		2: 2,
-		3: 3,
-		4: 3,
-		5: 3,
-		6: 3,
-		8: 3,
-		9: 3,
-		10: 3,
-		11: 3,
-		12: 2
-	},
-	"Seafarers: 6 Wide": {			# 26 total
-		2: 2,
-		3: 2,
-		4: 3,
-		5: 3,
-		6: 3,
-		8: 3,
-		9: 3,
-		10: 3,
-		11: 2,
-		12: 2
-	},
-	"Seafarers: 7 Wide": {			# 28 total
-		2: 2,
-		3: 3,
-		4: 3,
-		5: 3,
-		6: 3,
-		8: 3,
-		9: 3,
-		10: 3,
-		11: 3,
-		12: 2
-	},
-	"Seafarers: 8 Wide": {			# 28 total
-		2: 2,
-		3: 3,
-		4: 3,
-		5: 3,
-		6: 3,
-		8: 3,
-		9: 3,
-		10: 3,
-		11: 3,
-		12: 2
-	},
-	"Seafarers: 9 Wide": {			# 32 total
-		2: 2,
-		3: 3,
-		4: 4,
-		5: 4,
-		6: 3,
-		8: 3,
-		9: 4,
-		10: 4,
-		11: 3,
-		12: 2
-	},
-	"Seafarers: 10 Wide": {			# 34 total
-		2: 2,
-		3: 3,
-		4: 4,
-		5: 4,
-		6: 4,
-		8: 4,
-		9: 4,
-		10: 4,
-		11: 3,
-		12: 2
-	}
-}
-
-# Define the target efficiency values for each game mode and tile type
-# Initialize the dictionary
-TARGET_EFFICIENCY_PER_TUPLE = {}
-# Add information for brick
-TARGET_EFFICIENCY_PER_TUPLE[("Original: 5 Wide", "brick")] = 0.9
-TARGET_EFFICIENCY_PER_TUPLE[("Original: 6 Wide", "brick")] = 0.9
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 6 Wide", "brick")] = 0.85
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 7 Wide", "brick")] = 0.85
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 8 Wide", "brick")] = 0.85
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 9 Wide", "brick")] = 0.85
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 10 Wide", "brick")] = 0.85
-# Add information for sheep
-TARGET_EFFICIENCY_PER_TUPLE[("Original: 5 Wide", "sheep")] = 0.9
-TARGET_EFFICIENCY_PER_TUPLE[("Original: 6 Wide", "sheep")] = 0.9
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 6 Wide", "sheep")] = 0.85
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 7 Wide", "sheep")] = 0.85
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 8 Wide", "sheep")] = 0.85
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 9 Wide", "sheep")] = 0.85
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 10 Wide", "sheep")] = 0.85
-# Add information for stone
-TARGET_EFFICIENCY_PER_TUPLE[("Original: 5 Wide", "stone")] = 0.85
-TARGET_EFFICIENCY_PER_TUPLE[("Original: 6 Wide", "stone")] = 0.85
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 6 Wide", "stone")] = 0.8
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 7 Wide", "stone")] = 0.8
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 8 Wide", "stone")] = 0.8
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 9 Wide", "stone")] = 0.8
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 10 Wide", "stone")] = 0.8
-# Add information for wheat
-TARGET_EFFICIENCY_PER_TUPLE[("Original: 5 Wide", "wheat")] = 0.9
-TARGET_EFFICIENCY_PER_TUPLE[("Original: 6 Wide", "wheat")] = 0.9
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 6 Wide", "wheat")] = 0.85
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 7 Wide", "wheat")] = 0.85
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 8 Wide", "wheat")] = 0.85
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 9 Wide", "wheat")] = 0.85
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 10 Wide", "wheat")] = 0.85
-# Add information for wood
-TARGET_EFFICIENCY_PER_TUPLE[("Original: 5 Wide", "wood")] = 0.9
-TARGET_EFFICIENCY_PER_TUPLE[("Original: 6 Wide", "wood")] = 0.9
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 6 Wide", "wood")] = 0.85
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 7 Wide", "wood")] = 0.85
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 8 Wide", "wood")] = 0.85
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 9 Wide", "wood")] = 0.85
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 10 Wide", "wood")] = 0.85
-# Add information for desert
-TARGET_EFFICIENCY_PER_TUPLE[("Original: 5 Wide", "desert")] = 0.8
-TARGET_EFFICIENCY_PER_TUPLE[("Original: 6 Wide", "desert")] = 0.8
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 6 Wide", "desert")] = 0.5
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 7 Wide", "desert")] = 0.5
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 8 Wide", "desert")] = 0.5
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 9 Wide", "desert")] = 0.5
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 10 Wide", "desert")] = 0.5
-# Add information for gold
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 6 Wide", "gold")] = 0.4
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 7 Wide", "gold")] = 0.4
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 8 Wide", "gold")] = 0.4
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 9 Wide", "gold")] = 0.3
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 10 Wide", "gold")] = 0.3
-# Add information for water
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 6 Wide", "water")] = 0.4
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 7 Wide", "water")] = 0.6
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 8 Wide", "water")] = 0.6
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 9 Wide", "water")] = 0.6
-TARGET_EFFICIENCY_PER_TUPLE[("Seafarers: 10 Wide", "water")] = 0.6
-
 # Define the colors used for each tile
 COLOR_PER_TILE = {
 	"brick": RGB((180, 60, 30)),
@@ -300,18 +66,9 @@ CIRCLE_COLOR = RGB((210, 170, 110))
 LOW_PROB_NUMBER_COLOR = RGB((0, 0, 0))
 HIGH_PROB_NUMBER_COLOR = RGB((200, 0, 0))
 
-# Define a marginal Shannon entropy function
-def computeMarginalEntropy(prob_value:Any) -> float:
-	# Compute the marginal Shannon entropy associated with a probability value
-	# Verify the inputs
-	assert isNumeric(prob_value, include_numpy_flag = True) == True, "computeMarginalEntropy: Provided value for 'prob_value' must be numeric"
-	assert 0 <= prob_value and prob_value <= 1, "computeMarginalEntropy: Provided value for 'prob_value' must be >= 0 and <= 1"
-
-	# Compute the needed value and return it
-	if prob_value in [0, 1]:
-		return 0
-	else:
-		return prob_value * log2(1 / prob_value)
+# Define the phases and events tracked when instrumentation of a tiling is enabled
+ALL_INSTRUMENTED_PHASES = ["entropy", "probabilities", "type_sampling", "index_scan", "storage_update"]
+ALL_INSTRUMENTED_EVENTS = ["n_proposals", "n_acceptances", "n_resample_retries", "n_noop_swaps"]
 
 
 ###############################################
@@ -320,15 +77,26 @@ def computeMarginalEntropy(prob_value:Any) -> float:
 # Create the decorator needed for making the attributes private
 catan_generator_tiling_decorator = privacyDecorator(["_adjacency_matrix",					# class variables
 													 "_board",
+													 "_event_count_per_name",
+													 "_instrumentation_flag",
+													 "_list_position_per_polygon",
 													 "_maximum_entropy",
 													 "_n_polygons",
 													 "_needed_tile_types",
 													 "_neighbor_counts_per_tile",
 													 "_neighbor_indices_per_polygon",
+													 "_phase_seconds_per_name",
+													 "_polygon_indices_per_tile",
+													 "_random_state",
 													 "_tiles_per_index",
-													 "_initializeBoard",					# private functions
+													 "_unrendered_polygon_indices",
+													 "_x_shift_per_polygon",
+													 "_y_shift_per_polygon",
+													 "_getBoard",							# private functions
+													 "_initializeBoard",
 													 "_initializeStorageFromTiling",
-													 "_initializeTiling"])
+													 "_initializeTiling",
+													 "_recordPhase"])
 
 # Define the class with private attributes
 @catan_generator_tiling_decorator
@@ -344,64 +112,46 @@ class CatanGeneratorTiling:
 		# Store the provided values
 		self._game_mode = game_mode
 
+		# Start with instrumentation disabled and all timers and counters at zero
+		self._instrumentation_flag = False
+		self.resetInstrumentation()
+
 		# Initialize a new tiling given the current game mode
 		self._initializeBoard()
 		self._initializeRandomTiling(seed = seed)
 
 	### Define internal functions for initializing freshly created tilings ###
 	def _initializeBoard(self):
-		# Initialize information related to the polygon layout and stored Board object
+		# Initialize information related to the polygon layout (the Board object itself is only created when first needed by _getBoard)
 		# Set the number of polygons based on the game mode
 		self._n_polygons = sum(ROW_COUNTS_PER_MODE[self._game_mode])
 
-		# Create a list of all polygons objects to be passed to the Board object
-		all_polygons = [HEXAGON_REGULAR_TALL for _ in range(self._n_polygons)]
-
-		# Create the lists of x-value and y-value shifts associated with each polygon
-		x_shift_per_polygon = []
-		y_shift_per_polygon = []
-		for row_index in range(len(ROW_COUNTS_PER_MODE[self._game_mode])):
-			y_shift = 3 / 2 * row_index
-			for col_index in range(ROW_COUNTS_PER_MODE[self._game_mode][row_index]):
-				x_shift = sqrt(3) * (col_index - ROW_COUNTS_PER_MODE[self._game_mode][row_index] / 2)
-				x_shift_per_polygon.append(x_shift)
-				y_shift_per_polygon.append(y_shift)
-
-		# Determine the indices adjacent to each polygon on the board
-		# Initialize the needed storage
-		self._neighbor_indices_per_polygon = {}
-		for polygon_index in range(self._n_polygons):
-			self._neighbor_indices_per_polygon[polygon_index] = []
-		# Compute the theoretically correct distance for adjacent polygons
-		theoretical_distance = sqrt(3)
-		# Mark which polygons are adjacent to which other polygons
-		for polygon_index_1 in range(self._n_polygons - 1):
-			# Get the x-shift and y-shift for the 1st polygon
-			x_shift_1 = x_shift_per_polygon[polygon_index_1]
-			y_shift_1 = y_shift_per_polygon[polygon_index_1]
-			# Loop over the needed other polygons
-			for polygon_index_2 in range(polygon_index_1 + 1, self._n_polygons):
-				# Get the x-shift and y-shift for the 2nd polygon
-				x_shift_2 = x_shift_per_polygon[polygon_index_2]
-				y_shift_2 = y_shift_per_polygon[polygon_index_2]
-				# Compute the actual distances between the centers of these polygons
-				actual_distance = sqrt((x_shift_1 - x_shift_2)**2 + (y_shift_1 - y_shift_2)**2)
-				# Mark that the polygons are adjacent if the distance is correct (within a margin of error)
-				if tolerantlyCompare(actual_distance, "==", theoretical_distance, threshold = 10**-3):
-					self._neighbor_indices_per_polygon[polygon_index_1].append(polygon_index_2)
-					self._neighbor_indices_per_polygon[polygon_index_2].append(polygon_index_1)
-
-		# Create and store the Board object for the tiling
-		self._board = Board(n_polygons = self._n_polygons,
-			  				all_polygons = all_polygons,
-			  				x_shift_per_polygon = x_shift_per_polygon,
-			  				y_shift_per_polygon = y_shift_per_polygon)
+		# Compute the polygon centers and the indices adjacent to each polygon on the board
+		hex_layout = computeHexLayout(row_counts = ROW_COUNTS_PER_MODE[self._game_mode])
+		self._x_shift_per_polygon = hex_layout["x_shift_per_polygon"]
+		self._y_shift_per_polygon = hex_layout["y_shift_per_polygon"]
+		self._neighbor_indices_per_polygon = hex_layout["neighbor_indices_per_polygon"]
+		self._board = None
+
+	def _getBoard(self):
+		# Return the Board object for the tiling, importing the rendering modules and creating it on first use
+		if self._board is None:
+			# Import the rendering modules
+			from Board import Board
+			from Polygon import HEXAGON_REGULAR_TALL
+
+			# Create and store the Board object for the tiling
+			all_polygons = [HEXAGON_REGULAR_TALL for _ in range(self._n_polygons)]
+			self._board = Board(n_polygons = self._n_polygons,
+								all_polygons = all_polygons,
+								x_shift_per_polygon = self._x_shift_per_polygon,
+								y_shift_per_polygon = self._y_shift_per_polygon)
+		return self._board
 
 	def _initializeRandomTiling(self, seed:int):
 		# Perform all steps necessary for obtaining an initial tiling
-		# Set the random seed (if needed)
-		if seed is not None:
-			random.seed(seed = seed)
+		# Create the random stream owned by this tiling (which can be captured and restored with snapshots)
+		self._random_state = random.RandomState(seed)
 
 		# Randomly assigning an initial tile selection to each polygon
 		# Initialize the needed storage
@@ -414,7 +164,7 @@ class CatanGeneratorTiling:
 		# Perform the tiling assignment to each polygon
 		for polygon_index in range(self._n_polygons):
 			# Select and tile and remove it from the list of possible tiles
-			tile_index = random.randint(len(possible_tiles))
+			tile_index = self._random_state.randint(len(possible_tiles))
 			selected_tile_type = possible_tiles.pop(tile_index)
 			# Assign this tile to this polygon
 			self._tile_per_polygon.append(selected_tile_type)
@@ -442,6 +192,17 @@ class CatanGeneratorTiling:
 				tile_type_2 = self._tile_per_polygon[polygon_index_2]
 				self._neighbor_counts_per_tile[tile_type_1][tile_type_2] += 1
 
+		# Store the indices of the polygons holding each tile type, along with where each polygon sits in its list (allowing O(1) updates on swaps)
+		self._polygon_indices_per_tile = {tile_type: [] for tile_type in self._needed_tile_types}
+		self._list_position_per_polygon = []
+		for polygon_index in range(self._n_polygons):
+			tile_type = self._tile_per_polygon[polygon_index]
+			self._list_position_per_polygon.append(len(self._polygon_indices_per_tile[tile_type]))
+			self._polygon_indices_per_tile[tile_type].append(polygon_index)
+
+		# Mark every polygon as needing its color set on the next render
+		self._unrendered_polygon_indices = set(range(self._n_polygons))
+
 	### Define an external function for overwriting the tiling with specific values ###
 	def overwriteTiling(self, tile_per_polygon:list):
 		# Overwrite the randomly generated tiling (i.e. the primary use case) with a specified one (i.e. the secondary use case)
@@ -457,19 +218,87 @@ class CatanGeneratorTiling:
 		# Initialize the other storage variables given this new specified tiling
 		self._initializeStorageFromTiling()
 
+	### Define external functions for fetching the game mode and a copy of the current tiling ###
+	def getGameMode(self) -> str:
+		# Return the game mode of the tiling
+		return self._game_mode
+
+	def getTilePerPolygon(self) -> list:
+		# Return a copy of the tile type assigned to each polygon
+		return list(self._tile_per_polygon)
+
+	### Define external functions for saving and restoring the full state of the tiling ###
+	def getSnapshot(self) -> dict:
+		# Return a JSON-serializable snapshot of the tiling, its cached neighbor counts and its random stream
+		# Note: the order of the per-type polygon lists is included since it determines which polygon each random draw selects
+		snapshot = {}
+		snapshot["game_mode"] = self._game_mode
+		snapshot["tile_per_polygon"] = list(self._tile_per_polygon)
+		snapshot["neighbor_counts_per_tile"] = {tile_type: dict(counts) for tile_type, counts in self._neighbor_counts_per_tile.items()}
+		snapshot["polygon_indices_per_tile"] = {tile_type: list(polygon_indices) for tile_type, polygon_indices in self._polygon_indices_per_tile.items()}
+		snapshot["random_state"] = snapshotRandomState(random_state = self._random_state)
+		return snapshot
+
+	def restoreSnapshot(self, snapshot:dict):
+		# Restore a snapshot created by getSnapshot, after which swaps continue exactly as they would have from the original tiling
+		# Verify the inputs
+		assert type(snapshot) == dict, "CatanGeneratorTiling::restoreSnapshot: Provided value for 'snapshot' must be a dict object"
+		assert snapshot["game_mode"] == self._game_mode, "CatanGeneratorTiling::restoreSnapshot: Provided value for 'snapshot' must come from a tiling of the same game mode"
+
+		# Rebuild the storage from the tiling and make sure it agrees with the cached neighbor counts
+		self.overwriteTiling(tile_per_polygon = list(snapshot["tile_per_polygon"]))
+		assert self._neighbor_counts_per_tile == snapshot["neighbor_counts_per_tile"], "CatanGeneratorTiling::restoreSnapshot: Provided value for 'snapshot' has neighbor counts inconsistent with its tiling"
+
+		# Restore the order of the per-type polygon lists and the random stream
+		self._polygon_indices_per_tile = {tile_type: list(polygon_indices) for tile_type, polygon_indices in snapshot["polygon_indices_per_tile"].items()}
+		for polygon_indices in self._polygon_indices_per_tile.values():
+			for list_position, polygon_index in enumerate(polygon_indices):
+				self._list_position_per_polygon[polygon_index] = list_position
+		self._random_state = restoreRandomState(random_snapshot = snapshot["random_state"])
+
+	### Define external functions for controlling the optional instrumentation of swaps ###
+	def enableInstrumentation(self, enable_flag:bool = True):
+		# Turn the collection of per-phase timers and event counters inside swapTiles on or off
+		# Verify the inputs
+		assert type(enable_flag) == bool, "CatanGeneratorTiling::enableInstrumentation: Provided value for 'enable_flag' must be a bool object"
+
+		# Store the provided value
+		self._instrumentation_flag = enable_flag
+
+	def resetInstrumentation(self):
+		# Set all cumulative per-phase timers and event counters back to zero
+		self._phase_seconds_per_name = {phase_name: 0.0 for phase_name in ALL_INSTRUMENTED_PHASES}
+		self._event_count_per_name = {event_name: 0 for event_name in ALL_INSTRUMENTED_EVENTS}
+
+	def getInstrumentationSnapshot(self) -> dict:
+		# Return a copy of the cumulative per-phase timers (in seconds) and event counters collected so far
+		snapshot = {}
+		snapshot["enabled"] = self._instrumentation_flag
+		snapshot["phase_seconds"] = dict(self._phase_seconds_per_name)
+		snapshot["total_seconds"] = sum(list(self._phase_seconds_per_name.values()))
+		snapshot.update(self._event_count_per_name)
+		return snapshot
+
+	def _recordPhase(self, phase_name:str, phase_start_time:float) -> float:
+		# Add the time elapsed since the start of a phase to its timer and return the start time of the next phase
+		phase_end_time = perf_counter()
+		self._phase_seconds_per_name[phase_name] += phase_end_time - phase_start_time
+		return phase_end_time
+
 	### Define external functions for preprocessing bevel and sun information for all polygons ###
 	def preprocessAllBevelInfo(self, bevel_attitude:Any, bevel_size:Any):
 		# Preprocess all information related to the bevel for all polygons on the stored board (leaving error checking to the Board object)
-		self._board.preprocessAllBevelInfo(bevel_attitude = bevel_attitude, bevel_size = bevel_size)
+		self._getBoard().preprocessAllBevelInfo(bevel_attitude = bevel_attitude, bevel_size = bevel_size)
 
 	def preprocessAllSunInfo(self, sun_angle:Any, sun_attitude:Any):
 		# Preprocess all information related to the sun for all polygons on the stored board (leaving error checking to the Board object)
-		self._board.preprocessAllSunInfo(sun_angle = sun_angle, sun_attitude = sun_attitude)
+		self._getBoard().preprocessAllSunInfo(sun_angle = sun_angle, sun_attitude = sun_attitude)
 
 	### Define an external function for closing figures to save on memory ###
 	def closeFigures(self):
-		# Close the figures associated with all polygons on the stored board
-		self._board.closeFigures()
+		# Close the figures associated with all polygons on the stored board (if it was ever created)
+		if self._board is not None:
+			self._board.closeFigures()
 
 	### Define an external function for computing the Shannon entropy of neighbor distributions for each tile type ###
 	def computeEntropyPerTileType(self) -> dict:
@@ -510,6 +339,11 @@ class CatanGeneratorTiling:
 		assert type(reject_flag) == bool, "CatanGeneratorTiling::swapTiles: Provided value for 'reject_flag' must be a bool object"
 		assert normalize_type in ["static", "dynamic"], "CatanGeneratorTiling::swapTiles: Provided value for 'normalize_type' must be 'static' or 'dynamic"
 
+		# Start the timer for the first phase (if needed)
+		instrumentation_flag = self._instrumentation_flag
+		if instrumentation_flag == True:
+			phase_start_time = perf_counter()
+
 		# Initialize the dictionary of relevant results
 		# Add in the provided inputs
 		swap_results = {}
@@ -566,6 +400,10 @@ class CatanGeneratorTiling:
 		# Add these results to the dictionary
 		swap_results["normalized_error_by_tile"] = normalized_error_by_tile
 
+		# Record the time spent on the pre-swap entropy phase (if needed)
+		if instrumentation_flag == True:
+			phase_start_time = self._recordPhase(phase_name = "entropy", phase_start_time = phase_start_time)
+
 		# Compute the probability values for the 1st and 2nd tile type distributions using the provided skew power and add to the results dictionary
 		# General idea: Tile type 1 should be a tile above its target efficiency, tile type 2 should be a tile below its target efficiency
 		# Initialize the needed dictionaries
@@ -604,32 +442,52 @@ class CatanGeneratorTiling:
 		swap_results["probability_1_by_tile"] = probability_1_by_tile
 		swap_results["probability_2_by_tile"] = probability_2_by_tile
 
+		# Record the time spent on the probability phase (if needed)
+		if instrumentation_flag == True:
+			phase_start_time = self._recordPhase(phase_name = "probabilities", phase_start_time = phase_start_time)
+
 		# Randomly select the tile types to use in the swap and add to the results dictionary
 		# Select the tile types and make sure they are distinct
+		n_attempts = 0
 		while True:
-			tile_type_1 = str(random.choice(a = list(probability_1_by_tile.keys()), p = list(probability_1_by_tile.values())))
-			tile_type_2 = str(random.choice(a = list(probability_2_by_tile.keys()), p = list(probability_2_by_tile.values())))
+			n_attempts += 1
+			tile_type_1 = str(self._random_state.choice(a = list(probability_1_by_tile.keys()), p = list(probability_1_by_tile.values())))
+			tile_type_2 = str(self._random_state.choice(a = list(probability_2_by_tile.keys()), p = list(probability_2_by_tile.values())))
 			if tile_type_1 != tile_type_2:
 				break
 		# Add these results to the dictionary
 		swap_results["tile_type_1"] = tile_type_1
 		swap_results["tile_type_2"] = tile_type_2
 
+		# Record the time spent on the type sampling phase as well as the number of resamples (if needed)
+		if instrumentation_flag == True:
+			phase_start_time = self._recordPhase(phase_name = "type_sampling", phase_start_time = phase_start_time)
+			self._event_count_per_name["n_proposals"] += 1
+			self._event_count_per_name["n_resample_retries"] += n_attempts - 1
+
 		# Get the indices of polygons associated with these tile types
-		possible_indices_1 = [polygon_index for polygon_index in range(self._n_polygons) if self._tile_per_polygon[polygon_index] == tile_type_1]
-		possible_indices_2 = [polygon_index for polygon_index in range(self._n_polygons) if self._tile_per_polygon[polygon_index] == tile_type_2]
+		possible_indices_1 = self._polygon_indices_per_tile[tile_type_1]
+		possible_indices_2 = self._polygon_indices_per_tile[tile_type_2]
 
 		# Randomly select the indices to switch and add to the results dictionary
 		# Select the polygon indices
-		polygon_index_1 = int(random.choice(a = possible_indices_1))
-		polygon_index_2 = int(random.choice(a = possible_indices_2))
+		polygon_index_1 = possible_indices_1[self._random_state.randint(len(possible_indices_1))]
+		polygon_index_2 = possible_indices_2[self._random_state.randint(len(possible_indices_2))]
 		# Add these results to the dictionary
 		swap_results["polygon_index_1"] = polygon_index_1
 		swap_results["polygon_index_2"] = polygon_index_2
 
+		# Record the time spent on the index scan phase (if needed)
+		if instrumentation_flag == True:
+			phase_start_time = self._recordPhase(phase_name = "index_scan", phase_start_time = phase_start_time)
+
 		# Perform the needed tile swap for these polygons by updating internal storage accordingly
 		self._updateStorageDueToSwap(polygon_index_1 = polygon_index_1, polygon_index_2 = polygon_index_2)
 
+		# Record the time spent on the storage update phase (if needed)
+		if instrumentation_flag == True:
+			phase_start_time = self._recordPhase(phase_name = "storage_update", phase_start_time = phase_start_time)
+
 		# Compute the post-swap entropy and efficiency (i.e. normalized entropy) values and add to the results dictionary
 		# Get the needed entropy values for each distribution
 		post_entropy_by_tile = self.computeEntropyPerTileType()
@@ -653,6 +511,10 @@ class CatanGeneratorTiling:
 		swap_results["pre_mean_squared_error"] = pre_mean_squared_error
 		swap_results["post_mean_squared_error"] = post_mean_squared_error
 
+		# Record the time spent on the post-swap entropy phase (if needed)
+		if instrumentation_flag == True:
+			phase_start_time = self._recordPhase(phase_name = "entropy", phase_start_time = phase_start_time)
+
 		# Reject the change if it raised the mean squared error of efficiency (if needed)
 		if reject_flag == True and post_mean_squared_error > pre_mean_squared_error:
 			# Undo the changes and mark that the swap was rejected
@@ -662,11 +524,20 @@ class CatanGeneratorTiling:
 			# Leave the changes and mark that the swap was accepted
 			swap_results["swap_accepted_flag"] = True
 
+		# Record the time spent undoing the swap as well as the outcome of the swap (if needed)
+		# Note: a no-op swap is one which leaves the mean squared error exactly unchanged (e.g. the swapped tiles have identical neighbor types)
+		if instrumentation_flag == True:
+			self._recordPhase(phase_name = "storage_update", phase_start_time = phase_start_time)
+			if swap_results["swap_accepted_flag"] == True:
+				self._event_count_per_name["n_acceptances"] += 1
+			if post_mean_squared_error == pre_mean_squared_error:
+				self._event_count_per_name["n_noop_swaps"] += 1
+
 		# Return the results
 		return swap_results
 
 	def _updateStorageDueToSwap(self, polygon_index_1:int, polygon_index_2:int):
-		# Update the polygon tile type list and neighbor counts dictionary to reflect a swap occurring (note: input verification not done for efficiency)
+		# Update the polygon tile type list, per-type index lists and neighbor counts dictionary to reflect a swap occurring (note: input verification not done for efficiency)
 		# Get the current tile types associated with these polygons
 		tile_type_1 = self._tile_per_polygon[polygon_index_1]
 		tile_type_2 = self._tile_per_polygon[polygon_index_2]
@@ -693,6 +564,18 @@ class CatanGeneratorTiling:
 		self._tile_per_polygon[polygon_index_1] = tile_type_2
 		self._tile_per_polygon[polygon_index_2] = tile_type_1
 
+		# Swap the polygons between the per-type index lists by exchanging their list slots
+		position_1 = self._list_position_per_polygon[polygon_index_1]
+		position_2 = self._list_position_per_polygon[polygon_index_2]
+		self._polygon_indices_per_tile[tile_type_1][position_1] = polygon_index_2
+		self._polygon_indices_per_tile[tile_type_2][position_2] = polygon_index_1
+		self._list_position_per_polygon[polygon_index_1] = position_2
+		self._list_position_per_polygon[polygon_index_2] = position_1
+
+		# Mark that both polygons need their colors updated on the next render
+		self._unrendered_polygon_indices.add(polygon_index_1)
+		self._unrendered_polygon_indices.add(polygon_index_2)
+
 		# Raise the neighbor counts for type 2 after changing the 1st polygon
 		for neighbor_polygon_index in self._neighbor_indices_per_polygon[polygon_index_1]:
 			# Get the tile type for the neighbor
@@ -712,27 +595,146 @@ class CatanGeneratorTiling:
 			self._neighbor_counts_per_tile[tile_type_1][neighbor_tile_type] += 1
 
 	### Define an external function for rendering the tiling ###
-	def render(self, dpi:int) -> Image.Image:
+	def render(self, dpi:int) -> "Image.Image":
 		# Return a PIL image render of the tiling for the Catan board
-		# Assign the correct colors to each polygon
-		for polygon_index in range(self._n_polygons):
+		# Assign the correct colors to each polygon which changed since the last render
+		board = self._getBoard()
+		for polygon_index in self._unrendered_polygon_indices:
 			selected_tile_type = self._tile_per_polygon[polygon_index]
-			self._board.setTintShade(tint_shade = COLOR_PER_TILE[selected_tile_type], polygon_index = polygon_index)
+			board.setTintShade(tint_shade = COLOR_PER_TILE[selected_tile_type], polygon_index = polygon_index)
+		self._unrendered_polygon_indices = set()
 
 		# Create the rendered image and return it
-		return self._board.render(dpi = dpi)
+		return board.render(dpi = dpi)
+
+
+###############################################################
+### Define the functions run by the board rendering process ###
+###############################################################
+# Define the tilings kept by the rendering process (one per game mode, so that the bevel and sun information is only preprocessed once)
+RENDER_STATE = {}
+
+def initializeRenderProcess():
+	# Force the non-GUI matplotlib backend before any figure is created and import the rendering modules ahead of the first render
+	import matplotlib
+	matplotlib.use("Agg")
+	import_module("Board")
+	import_module("Polygon")
+
+def renderTilingInProcess(game_mode:str, tile_per_polygon:list, dpi:int) -> "Image.Image":
+	# Return a PIL image render of the provided tiling, reusing the preprocessed tiling of its game mode
+	# Create and preprocess the tiling of the game mode (if needed)
+	if game_mode not in RENDER_STATE:
+		tiling = CatanGeneratorTiling(game_mode = game_mode)
+		tiling.preprocessAllBevelInfo(bevel_attitude = CATAN_BEVEL_ATTITUDE, bevel_size = CATAN_BEVEL_SIZE)
+		tiling.preprocessAllSunInfo(sun_angle = CATAN_SUN_ANGLE, sun_attitude = CATAN_SUN_ATTITUDE)
+		RENDER_STATE[game_mode] = tiling
+
+	# Render the provided tiling
+	tiling = RENDER_STATE[game_mode]
+	tiling.overwriteTiling(tile_per_polygon = list(tile_per_polygon))
+	return tiling.render(dpi = dpi)
+
+
+###########################################################
+### Define the background board generation worker class ###
+###########################################################
+# Define the class which runs the optimization of a board away from the GUI thread, handing each render to the rendering process
+class CatanGeneratorWorker(Thread):
+	### Initialize the class ###
+	def __init__(self, game_mode:str, render_executor:ProcessPoolExecutor, seed:int = None, n_steps:int = 5000, n_steps_per_update:int = 100, n_updates_per_preview:int = 5,
+				 skew_power:Any = 2, reject_flag:bool = True, normalize_type:str = "static", preview_dpi:int = 30, final_dpi:int = 300):
+		# Verify the inputs (tiling and swap settings are verified by CatanGeneratorTiling)
+		assert type(n_steps) == int and n_steps >= 0, "CatanGeneratorWorker::__init__: Provided value for 'n_steps' must be a non-negative int object"
+		assert type(n_steps_per_update) == int and n_steps_per_update > 0, "CatanGeneratorWorker::__init__: Provided value for 'n_steps_per_update' must be a positive int object"
+		assert type(n_updates_per_preview) == int and n_updates_per_preview > 0, "CatanGeneratorWorker::__init__: Provided value for 'n_updates_per_preview' must be a positive int object"
+		assert type(preview_dpi) == int and preview_dpi > 0, "CatanGeneratorWorker::__init__: Provided value for 'preview_dpi' must be a positive int object"
+		assert type(final_dpi) == int and final_dpi > 0, "CatanGeneratorWorker::__init__: Provided value for 'final_dpi' must be a positive int object"
+
+		# Initialize the thread as a daemon so that closing the GUI never waits on it
+		super().__init__(daemon = True)
+
+		# Store the provided values
+		self.game_mode = game_mode
+		self.render_executor = render_executor
+		self.seed = seed
+		self.n_steps = n_steps
+		self.n_steps_per_update = n_steps_per_update
+		self.n_updates_per_preview = n_updates_per_preview
+		self.swap_settings = {"skew_power": skew_power, "reject_flag": reject_flag, "normalize_type": normalize_type}
+		self.preview_dpi = preview_dpi
+		self.final_dpi = final_dpi
+
+		# Create the queue of messages for the GUI and the event used for cancellation
+		self.message_queue = Queue()
+		self.cancel_event = Event()
+
+	### Define the external function for cancelling the work ###
+	def cancel(self):
+		# Ask the worker to stop at the next update boundary
+		self.cancel_event.set()
+
+	### Define the function for rendering the current tiling ###
+	def renderTiling(self, tiling:CatanGeneratorTiling, dpi:int) -> "Image.Image":
+		# Render the tiling in the rendering process and wait for the image
+		return self.render_executor.submit(renderTilingInProcess, self.game_mode, tiling.getTilePerPolygon(), dpi).result()
+
+	### Define the function run on the worker thread ###
+	def run(self):
+		# Optimize the board in chunks, posting progress and preview messages to the queue until done or cancelled
+		try:
+			# Create the tiling and post a first preview as soon as possible
+			tiling = CatanGeneratorTiling(game_mode = self.game_mode, seed = self.seed)
+			self.message_queue.put({"type": "preview", "step_index": 0, "image": self.renderTiling(tiling = tiling, dpi = self.preview_dpi)})
+
+			# Run the swaps in chunks so that cancellation is checked regularly
+			step_index = 0
+			n_updates = 0
+			while step_index < self.n_steps and not self.cancel_event.is_set():
+				# Run the next chunk of swaps
+				for _ in range(min(self.n_steps_per_update, self.n_steps - step_index)):
+					swap_results = tiling.swapTiles(**self.swap_settings)
+					step_index += 1
+
+				# Post the progress of the optimization
+				mean_squared_error = swap_results["post_mean_squared_error"] if swap_results["swap_accepted_flag"] == True else swap_results["pre_mean_squared_error"]
+				self.message_queue.put({"type": "progress", "step_index": step_index, "mean_squared_error": mean_squared_error})
+
+				# Post a new low dpi preview (if needed)
+				n_updates += 1
+				if n_updates % self.n_updates_per_preview == 0:
+					self.message_queue.put({"type": "preview", "step_index": step_index, "image": self.renderTiling(tiling = tiling, dpi = self.preview_dpi)})
+
+			# Post the final high dpi render unless cancelled
+			if self.cancel_event.is_set():
+				self.message_queue.put({"type": "cancelled", "step_index": step_index})
+			else:
+				self.message_queue.put({"type": "final", "step_index": step_index, "image": self.renderTiling(tiling = tiling, dpi = self.final_dpi)})
+		except Exception as error:
+			# Pass any errors to the GUI rather than losing them on the worker thread
+			self.message_queue.put({"type": "error", "error": error})
 
 
 ############################################
 ### Define the board generator GUI class ###
 ############################################
 # Create the decorator needed for making the attributes private
-catan_generator_gui_decorator = privacyDecorator(["_used_canvas",					# class variables
+catan_generator_gui_decorator = privacyDecorator(["_board_image",					# class variables
+												  "_board_image_item",
+												  "_generation_settings",
+												  "_render_executor",
+												  "_status_text_item",
+												  "_used_canvas",
 												  "_used_window",
+												  "_used_worker",
 												  "_BACKGROUND_COLOR_DARK",			# class constants
 												  "_BACKGROUND_COLOR_LIGHT",
 												  "_FOREGROUND_COLOR_DARK",
-												  "_FOREGROUND_COLOR_LIGHT"])
+												  "_FOREGROUND_COLOR_LIGHT",
+												  "_POLL_INTERVAL_MS",
+												  "_handleKey",						# private functions
+												  "_pollWorker",
+												  "_showImage"])
 
 # Define the class with private attributes
 @catan_generator_gui_decorator
@@ -742,9 +744,21 @@ class CatanGeneratorGUI:
 	_BACKGROUND_COLOR_LIGHT = RGB("#eeeeee")
 	_FOREGROUND_COLOR_DARK = RGB("#000000")
 	_FOREGROUND_COLOR_LIGHT = RGB("#ffffff")
+	_POLL_INTERVAL_MS = 50
 
 	### Initialize the class ###
-	def __init__(self):
+	def __init__(self, game_mode:str = "Original: 5 Wide"):
+		# Verify the inputs
+		assert game_mode in ALL_GAME_MODES, "CatanGeneratorGUI::__init__: Provided value for 'game_mode' must be contained in the list ALL_GAME_MODES"
+
+		# Start the rendering process before any Tk objects exist and load the rendering modules there while the window is being created
+		# Note: the process is started by its first task, so registered custom game modes are available to it where processes are forked
+		self._render_executor = ProcessPoolExecutor(max_workers = 1)
+		self._render_executor.submit(initializeRenderProcess)
+
+		# Import the GUI modules (kept out of the module import so that simulation-only users never load tkinter)
+		from tkinter_helper import createCanvas, createRectangle, createWindow
+
 		# Create the frame and canvas for this class
 		self._used_window = createWindow(width_parameter = 0.9,
 										 height_parameter = 0.85,
@@ -778,6 +792,98 @@ class CatanGeneratorGUI:
 						br_y_parameter = 1.00,
 						fill_color = self._BACKGROUND_COLOR_LIGHT)
 
+		# Initialize the storage related to board generation
+		self._used_worker = None
+		self._board_image = None
+		self._board_image_item = None
+		self._status_text_item = self._used_canvas.create_text(0, 0, anchor = "nw", text = "Press space to generate a board, escape to cancel")
+		self._generation_settings = {"game_mode": game_mode}
+
+		# Bind the keys for starting and cancelling board generation
+		self._used_window.bind("<KeyPress>", self._handleKey)
+
+	### Define external functions for starting and cancelling board generation ###
+	def startGeneration(self, game_mode:str, seed:int = None, **worker_settings):
+		# Start generating a new board on a background worker, cancelling any board currently being generated
+		# Cancel the current worker (if needed)
+		self.cancelGeneration()
+
+		# Remember the settings so that the next key press generates another board of the same kind
+		self._generation_settings = dict(worker_settings, game_mode = game_mode)
+
+		# Create and start the new worker
+		self._used_worker = CatanGeneratorWorker(game_mode = game_mode, render_executor = self._render_executor, seed = seed, **worker_settings)
+		self._used_worker.start()
+
+		# Start polling the worker for messages
+		self._used_window.after(self._POLL_INTERVAL_MS, self._pollWorker, self._used_worker)
+
+	def cancelGeneration(self):
+		# Cancel the board currently being generated (if any)
+		if self._used_worker is not None:
+			self._used_worker.cancel()
+			self._used_worker = None
+
+	def run(self):
+		# Run the GUI event loop, stopping the rendering process once the window is closed
+		self._used_window.mainloop()
+		self.cancelGeneration()
+		self._render_executor.shutdown(wait = False, cancel_futures = True)
+
+	### Define internal functions for handling key presses and worker messages on the GUI thread ###
+	def _handleKey(self, event:Any):
+		# Generate a new board on space (with a new random seed) or cancel the current one on escape
+		if event.keysym == "space":
+			self.startGeneration(**self._generation_settings)
+		elif event.keysym == "Escape":
+			self.cancelGeneration()
+			self._used_canvas.itemconfigure(self._status_text_item, text = "Generation cancelled, press space to generate a board")
+
+	def _pollWorker(self, worker:CatanGeneratorWorker):
+		# Handle all messages currently waiting on the queue of the worker, then schedule the next poll while it is running
+		# Ignore workers which have been replaced or cancelled
+		if worker is not self._used_worker:
+			return
+
+		# Handle each waiting message without blocking the event loop
+		while True:
+			try:
+				message = worker.message_queue.get_nowait()
+			except Empty:
+				break
+			if message["type"] == "progress":
+				self._used_canvas.itemconfigure(self._status_text_item, text = "Step " + str(message["step_index"]) + " of " + str(worker.n_steps) + ", MSE = " + str(round(message["mean_squared_error"], 6)))
+			elif message["type"] in ["preview", "final"]:
+				self._showImage(image = message["image"])
+			elif message["type"] == "error":
+				self._used_canvas.itemconfigure(self._status_text_item, text = "Generation failed: " + str(message["error"]))
+			if message["type"] in ["final", "cancelled", "error"]:
+				self._used_worker = None
+				return
+
+		# Schedule the next poll
+		self._used_window.after(self._POLL_INTERVAL_MS, self._pollWorker, worker)
+
+	def _showImage(self, image:"Image.Image"):
+		# Display a rendered board scaled to fit the area to the right of the section rectangles
+		# Compute the available area
+		canvas_width = self._used_canvas.winfo_width()
+		canvas_height = self._used_canvas.winfo_height()
+		area_width = max(1, int(0.76 * canvas_width))
+		area_height = max(1, canvas_height)
+
+		# Scale the image to fit the area while keeping its aspect ratio
+		scale = min(area_width / image.width, area_height / image.height)
+		scaled_image = image.resize((max(1, int(scale * image.width)), max(1, int(scale * image.height))))
+
+		# Replace the displayed image (keeping a reference so that Tk does not discard it)
+		from PIL import ImageTk
+		self._board_image = ImageTk.PhotoImage(scaled_image)
+		if self._board_image_item is None:
+			self._board_image_item = self._used_canvas.create_image(int(0.24 * canvas_width) + area_width // 2, area_height // 2, image = self._board_image)
+		else:
+			self._used_canvas.itemconfigure(self._board_image_item, image = self._board_image)
+
 if __name__ == "__main__":
 	#game_mode = "Original: 5 Wide"
 	game_mode = "Original: 6 Wide"
@@ -787,18 +893,9 @@ if __name__ == "__main__":
 	#game_mode = "Seafarers: 9 Wide"
 	#game_mode = "Seafarers: 10 Wide"
 
-	from tqdm import tqdm
-
 	seed = 19
-	dpi = 300
-
-	tiling = CatanGeneratorTiling(game_mode = game_mode, seed = seed)
-	tiling.preprocessAllBevelInfo(bevel_attitude = CATAN_BEVEL_ATTITUDE, bevel_size = CATAN_BEVEL_SIZE)
-	tiling.preprocessAllSunInfo(sun_angle = CATAN_SUN_ANGLE, sun_attitude = CATAN_SUN_ATTITUDE)
-	tiling.render(dpi = dpi).save("pre.png")
-
-	for index in tqdm(range(2000)):
-		tiling.swapTiles(skew_power = 2, reject_flag = True, normalize_type = "static")
 
-	#tiling.render(dpi = dpi).show()
-	tiling.render(dpi = dpi).save("post.png")
\ No newline at end of file
+	# Open the GUI and start generating the first board right away (press space for another board, escape to cancel)
+	gui = CatanGeneratorGUI(game_mode = game_mode)
+	gui.startGeneration(game_mode = game_mode, seed = seed)
+	gui.run()
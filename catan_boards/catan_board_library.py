@@ -0,0 +1,174 @@
+##########################################
+### Import needed general dependencies ###
+##########################################
+# Add paths for internal modules
+# Import dependencies
+from pathlib import Path
+from sys import path
+# Get the shared active projects folder
+active_projects_folder = Path(__file__).parent.parent
+# Get the shared parent folder
+parent_folder = active_projects_folder.parent
+# Get the shared infrastructure folder
+infrastructure_folder = parent_folder.joinpath("infrastructure")
+# Add the needed paths
+path.insert(0, str(infrastructure_folder.joinpath("board_games")))
+path.insert(0, str(infrastructure_folder.joinpath("common_needs")))
+
+# Built-in modules
+from sqlite3 import connect
+from threading import Lock
+
+# Internal modules
+from catan_board_core import ALL_GAME_MODES, ALL_TILE_TYPES, canonicalizeTiling
+from catan_generator_engine import CatanGeneratorEngine
+
+
+###################################################
+### Define functions for encoding stored boards ###
+###################################################
+def encodeTiling(tile_per_polygon:list) -> str:
+	# Encode a tiling as a string with one digit (the index into ALL_TILE_TYPES) per polygon
+	return "".join([str(ALL_TILE_TYPES.index(tile_type)) for tile_type in tile_per_polygon])
+
+def decodeTiling(encoding:str) -> list:
+	# Decode a string created by encodeTiling back into a list of tile types
+	return [ALL_TILE_TYPES[int(character)] for character in encoding]
+
+
+#####################################################
+### Define functions for creating boards to store ###
+#####################################################
+def createBoardFromEngine(engine:CatanGeneratorEngine) -> dict:
+	# Create the board dictionary (as accepted by upsertBoards) of the current tiling of an engine
+	board = {}
+	board["game_mode"] = engine.getGameMode()
+	board["tile_per_polygon"] = engine.getTilePerPolygon()
+	board["mean_squared_error"] = engine.getMeanSquaredError()
+	board["efficiency_per_tile_type"] = engine.getEfficiencyPerTileType()
+	return board
+
+def createBoardFromTiling(game_mode:str, tile_per_polygon:list) -> dict:
+	# Score a tiling (e.g. one found by an optimizer which doesn't use CatanGeneratorEngine) and create its board dictionary (as accepted by upsertBoards)
+	return createBoardFromEngine(engine = CatanGeneratorEngine(game_mode = game_mode, tile_per_polygon = list(tile_per_polygon)))
+
+
+######################################
+### Define the board library class ###
+######################################
+class CatanBoardLibrary:
+	### Initialize the class ###
+	def __init__(self, db_path:str):
+		# Open (or create) the library db file along with its table and indexes
+		# Store the provided values and create the connection (shared across threads behind a lock)
+		self.db_path = str(db_path)
+		self.connection = connect(self.db_path, check_same_thread = False)
+		self.lock = Lock()
+
+		# Set the column names of the efficiency values
+		self.efficiency_columns = [tile_type + "_efficiency" for tile_type in ALL_TILE_TYPES]
+
+		# Create the table (keyed by game mode and canonical encoding) and its indexes
+		with self.lock, self.connection:
+			self.connection.execute("CREATE TABLE IF NOT EXISTS boards (game_mode TEXT NOT NULL, encoding TEXT NOT NULL, mean_squared_error REAL NOT NULL, n_times_found INTEGER NOT NULL, "
+									+ ", ".join([column + " REAL" for column in self.efficiency_columns]) + ", PRIMARY KEY (game_mode, encoding))")
+			self.connection.execute("CREATE INDEX IF NOT EXISTS boards_by_error ON boards (game_mode, mean_squared_error)")
+			for column in self.efficiency_columns:
+				self.connection.execute("CREATE INDEX IF NOT EXISTS boards_by_" + column + " ON boards (game_mode, " + column + ")")
+
+	def close(self):
+		# Close the connection to the db file
+		self.connection.close()
+
+	### Define functions for converting between rows and boards ###
+	def createRow(self, board:dict) -> tuple:
+		# Create the row stored for a board (in canonical form)
+		tile_per_polygon = canonicalizeTiling(game_mode = board["game_mode"], tile_per_polygon = board["tile_per_polygon"])
+		efficiencies = [board["efficiency_per_tile_type"].get(tile_type) for tile_type in ALL_TILE_TYPES]
+		return tuple([board["game_mode"], encodeTiling(tile_per_polygon = tile_per_polygon), board["mean_squared_error"], 1] + efficiencies)
+
+	def createBoard(self, row:tuple) -> dict:
+		# Create a board dictionary from a row read with readBoards
+		board = {}
+		board["game_mode"] = row[0]
+		board["tile_per_polygon"] = decodeTiling(encoding = row[1])
+		board["mean_squared_error"] = row[2]
+		board["n_times_found"] = row[3]
+		board["efficiency_per_tile_type"] = {tile_type: row[4 + type_index] for type_index, tile_type in enumerate(ALL_TILE_TYPES) if row[4 + type_index] is not None}
+		return board
+
+	def readBoards(self, where_clause:str, parameters:list, order_clause:str = "mean_squared_error", n_boards:int = None) -> list:
+		# Read the boards matching a WHERE clause in the needed order
+		query = "SELECT game_mode, encoding, mean_squared_error, n_times_found, " + ", ".join(self.efficiency_columns) + " FROM boards WHERE " + where_clause + " ORDER BY " + order_clause
+		if n_boards is not None:
+			query += " LIMIT " + str(int(n_boards))
+		with self.lock:
+			rows = self.connection.execute(query, parameters).fetchall()
+		return [self.createBoard(row = row) for row in rows]
+
+	### Define external functions for adding boards ###
+	def upsertBoards(self, boards:list):
+		# Add many boards (dictionaries with game_mode, tile_per_polygon, mean_squared_error and efficiency_per_tile_type) in a single transaction
+		# Note: boards already in the library only have their count of times found increased
+		# Verify the inputs
+		for board in boards:
+			assert board["game_mode"] in ALL_GAME_MODES, "CatanBoardLibrary::upsertBoards: Provided value for 'boards' must only contain boards of game modes in the list ALL_GAME_MODES"
+
+		# Create the rows outside of the lock since canonicalization is the expensive part
+		rows = [self.createRow(board = board) for board in boards]
+
+		# Write the rows
+		with self.lock, self.connection:
+			self.connection.executemany("INSERT INTO boards VALUES (" + ", ".join(["?"] * (4 + len(ALL_TILE_TYPES))) + ") "
+										"ON CONFLICT (game_mode, encoding) DO UPDATE SET n_times_found = n_times_found + 1", rows)
+
+	### Define external functions for querying boards ###
+	def countBoards(self, game_mode:str) -> int:
+		# Return the number of distinct boards stored for a game mode
+		with self.lock:
+			return self.connection.execute("SELECT COUNT(*) FROM boards WHERE game_mode = ?", [game_mode]).fetchone()[0]
+
+	def getBestBoards(self, game_mode:str, n_boards:int = 100, max_mean_squared_error:float = None) -> list:
+		# Return the boards with the smallest mean squared error for a game mode (optionally only those below a threshold)
+		if max_mean_squared_error is None:
+			return self.readBoards(where_clause = "game_mode = ?", parameters = [game_mode], n_boards = n_boards)
+		return self.readBoards(where_clause = "game_mode = ? AND mean_squared_error <= ?", parameters = [game_mode, max_mean_squared_error], n_boards = n_boards)
+
+	def getBoardsInEfficiencyRange(self, game_mode:str, tile_type:str, min_efficiency:float, max_efficiency:float, n_boards:int = None) -> list:
+		# Return the boards whose efficiency for a tile type lies in a closed range (best mean squared error first)
+		# Verify the inputs
+		assert tile_type in ALL_TILE_TYPES, "CatanBoardLibrary::getBoardsInEfficiencyRange: Provided value for 'tile_type' must be contained in the list ALL_TILE_TYPES"
+
+		# Read the needed boards
+		return self.readBoards(where_clause = "game_mode = ? AND " + tile_type + "_efficiency BETWEEN ? AND ?", parameters = [game_mode, min_efficiency, max_efficiency], n_boards = n_boards)
+
+	def getNearestBoards(self, game_mode:str, efficiency_per_tile_type:dict, n_boards:int = 1, initial_radius:float = 0.02) -> list:
+		# Return the boards whose efficiency vectors are nearest (in Euclidean distance) to the provided efficiency values
+		# Verify the inputs
+		for tile_type in efficiency_per_tile_type:
+			assert tile_type in ALL_TILE_TYPES, "CatanBoardLibrary::getNearestBoards: Provided value for 'efficiency_per_tile_type' must only have valid tile types as keys"
+		n_available = self.countBoards(game_mode = game_mode)
+		if n_available == 0:
+			return []
+
+		# Search an indexed box around the target, doubling its size until enough candidates are found
+		# Note: any board within the box radius of the target is inside the box, so once the n-th nearest candidate lies within the radius the answer is exact
+		radius = initial_radius
+		while True:
+			# Read the candidates within the box
+			where_clause = "game_mode = ?"
+			parameters = [game_mode]
+			for tile_type, efficiency in efficiency_per_tile_type.items():
+				where_clause += " AND " + tile_type + "_efficiency BETWEEN ? AND ?"
+				parameters += [efficiency - radius, efficiency + radius]
+			candidates = self.readBoards(where_clause = where_clause, parameters = parameters)
+
+			# Sort the candidates by distance
+			distance_per_candidate = [sum([(candidate["efficiency_per_tile_type"][tile_type] - efficiency)**2 for tile_type, efficiency in efficiency_per_tile_type.items()])**0.5 for candidate in candidates]
+			order = sorted(range(len(candidates)), key = lambda candidate_index: distance_per_candidate[candidate_index])
+
+			# Return the results if they are provably the nearest (or the box already covers every possible efficiency)
+			n_needed = min(n_boards, n_available)
+			if (len(order) >= n_needed and distance_per_candidate[order[n_needed - 1]] <= radius) or radius > 1:
+				return [candidates[candidate_index] for candidate_index in order[:n_boards]]
+			radius *= 2
@@ -0,0 +1,375 @@
+##########################################
+### Import needed general dependencies ###
+##########################################
+# Add paths for internal modules
+# Import dependencies
+from pathlib import Path
+from sys import path
+# Get the shared active projects folder
+active_projects_folder = Path(__file__).parent.parent
+# Get the shared parent folder
+parent_folder = active_projects_folder.parent
+# Get the shared infrastructure folder
+infrastructure_folder = parent_folder.joinpath("infrastructure")
+# Add the needed paths
+path.insert(0, str(infrastructure_folder.joinpath("board_games")))
+path.insert(0, str(infrastructure_folder.joinpath("common_needs")))
+
+# Built-in modules
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from json import dumps
+from threading import Condition, Timer
+from traceback import format_exception
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+# Internal modules
+from catan_board_generator import ALL_GAME_MODES, CATAN_BEVEL_ATTITUDE, CATAN_BEVEL_SIZE, CATAN_SUN_ANGLE, CATAN_SUN_ATTITUDE, CatanGeneratorTiling, canonicalizeTiling
+from catan_board_library import CatanBoardLibrary
+from catan_generator_engine import CatanGeneratorEngine
+
+
+###############################################################
+### Define the function which generates a single good board ###
+###############################################################
+def generateOptimizedBoard(game_mode:str, seed:int, n_steps:int, skew_power:Any, normalize_type:str, max_mean_squared_error:float, max_attempts:int, render_dpi:int = None) -> dict:
+	# Optimize boards until one meets the MSE threshold (or attempts run out), return the best board in canonical form
+	# Run the needed attempts and keep the best result
+	best_engine = None
+	for attempt_index in range(max_attempts):
+		# Optimize a board using the trusted engine (each attempt uses its own seed)
+		attempt_seed = None if seed is None else (seed + attempt_index) % 2**32
+		engine = CatanGeneratorEngine(game_mode = game_mode, skew_power = skew_power, reject_flag = True, normalize_type = normalize_type, seed = attempt_seed)
+		engine.runSwaps(n_steps = n_steps)
+
+		# Keep the best board so far and stop early if it is good enough
+		if best_engine is None or engine.getMeanSquaredError() < best_engine.getMeanSquaredError():
+			best_engine = engine
+		if best_engine.getMeanSquaredError() <= max_mean_squared_error:
+			break
+
+	# Store the results (symmetric boards are equivalent, so only the canonical form is kept)
+	board = {}
+	board["game_mode"] = game_mode
+	board["tile_per_polygon"] = canonicalizeTiling(game_mode = game_mode, tile_per_polygon = best_engine.getTilePerPolygon())
+	board["mean_squared_error"] = best_engine.getMeanSquaredError()
+	board["efficiency_per_tile_type"] = best_engine.getEfficiencyPerTileType()
+	board["png_bytes"] = None
+
+	# Render the board to PNG bytes (if needed)
+	if render_dpi is not None:
+		board["png_bytes"] = renderBoardPng(game_mode = game_mode, tile_per_polygon = board["tile_per_polygon"], render_dpi = render_dpi)
+
+	# Return the results
+	return board
+
+def renderStoredBoard(board:dict, render_dpi:int) -> dict:
+	# Return a copy of a board read from the library along with its render, so that stored boards can be served as PNGs without optimizing again
+	rendered_board = dict(board)
+	rendered_board["png_bytes"] = renderBoardPng(game_mode = board["game_mode"], tile_per_polygon = board["tile_per_polygon"], render_dpi = render_dpi)
+	return rendered_board
+
+def renderBoardPng(game_mode:str, tile_per_polygon:list, render_dpi:int) -> bytes:
+	# Render a tiling to PNG bytes
+	tiling = CatanGeneratorTiling(game_mode = game_mode)
+	tiling.overwriteTiling(tile_per_polygon = list(tile_per_polygon))
+	tiling.preprocessAllBevelInfo(bevel_attitude = CATAN_BEVEL_ATTITUDE, bevel_size = CATAN_BEVEL_SIZE)
+	tiling.preprocessAllSunInfo(sun_angle = CATAN_SUN_ANGLE, sun_attitude = CATAN_SUN_ATTITUDE)
+	png_buffer = BytesIO()
+	tiling.render(dpi = render_dpi).save(png_buffer, format = "PNG")
+	tiling.closeFigures()
+	return png_buffer.getvalue()
+
+
+##############################################
+### Define the pre-warmed board pool class ###
+##############################################
+class CatanBoardPool:
+	### Initialize the class ###
+	def __init__(self, game_modes:list = None, pool_size_per_mode:int = 8, n_workers:int = 2, n_steps:int = 5000, skew_power:Any = 2,
+				 normalize_type:str = "static", max_mean_squared_error:float = 0.001, max_attempts:int = 5, render_dpi:int = None, seed:int = None, board_library:CatanBoardLibrary = None,
+				 max_consecutive_failures:int = 5, retry_delay_seconds:float = 1, library_batch_size:int = 16):
+		# Verify the inputs (swap settings are verified by CatanGeneratorEngine in the workers)
+		if game_modes is None:
+			game_modes = list(ALL_GAME_MODES)
+		for game_mode in game_modes:
+			assert game_mode in ALL_GAME_MODES, "CatanBoardPool::__init__: Provided value for 'game_modes' must only contain values in the list ALL_GAME_MODES"
+		assert type(pool_size_per_mode) == int and pool_size_per_mode > 0, "CatanBoardPool::__init__: Provided value for 'pool_size_per_mode' must be a positive int object"
+		assert type(n_workers) == int and n_workers > 0, "CatanBoardPool::__init__: Provided value for 'n_workers' must be a positive int object"
+		assert type(max_attempts) == int and max_attempts > 0, "CatanBoardPool::__init__: Provided value for 'max_attempts' must be a positive int object"
+		if render_dpi is not None:
+			assert type(render_dpi) == int and render_dpi > 0, "CatanBoardPool::__init__: If provided, value for 'render_dpi' must be a positive int object"
+		if seed is not None:
+			assert type(seed) == int and 0 <= seed and seed < 2**32, "CatanBoardPool::__init__: If provided, value for 'seed' must be an int object >= 0 and < 2^32"
+		assert type(max_consecutive_failures) == int and max_consecutive_failures > 0, "CatanBoardPool::__init__: Provided value for 'max_consecutive_failures' must be a positive int object"
+		assert 0 <= retry_delay_seconds, "CatanBoardPool::__init__: Provided value for 'retry_delay_seconds' must be non-negative"
+		assert type(library_batch_size) == int and library_batch_size > 0, "CatanBoardPool::__init__: Provided value for 'library_batch_size' must be a positive int object"
+
+		# Store the provided values
+		self.game_modes = list(game_modes)
+		self.pool_size_per_mode = pool_size_per_mode
+		self.n_workers = n_workers
+		self.generation_settings = {"n_steps": n_steps, "skew_power": skew_power, "normalize_type": normalize_type, "max_mean_squared_error": max_mean_squared_error,
+									"max_attempts": max_attempts, "render_dpi": render_dpi}
+		self.next_seed = seed
+		self.board_library = board_library
+		self.max_consecutive_failures = max_consecutive_failures
+		self.retry_delay_seconds = retry_delay_seconds
+		self.library_batch_size = library_batch_size
+
+		# Initialize the ready boards, number of pending generations and failures for each game mode, all guarded by a single condition
+		self.ready_boards_per_mode = {game_mode: deque() for game_mode in self.game_modes}
+		self.n_pending_per_mode = {game_mode: 0 for game_mode in self.game_modes}
+		self.n_failures_per_mode = {game_mode: 0 for game_mode in self.game_modes}
+		self.last_error_per_mode = {game_mode: None for game_mode in self.game_modes}
+		self.retry_scheduled_per_mode = {game_mode: False for game_mode in self.game_modes}
+		self.unsaved_boards = []
+		self.condition = Condition()
+		self.executor = None
+
+	### Define external functions for starting and stopping the background workers ###
+	def start(self):
+		# Start the worker processes and fill every pool, starting from the best stored boards when a library is available
+		# Note: stored boards are rendered by the workers when PNGs are needed, which is far quicker than optimizing new boards
+		self.executor = ProcessPoolExecutor(max_workers = self.n_workers)
+		render_dpi = self.generation_settings["render_dpi"]
+		with self.condition:
+			for game_mode in self.game_modes:
+				if self.board_library is not None:
+					stored_boards = self.board_library.getBestBoards(game_mode = game_mode, n_boards = self.pool_size_per_mode, max_mean_squared_error = self.generation_settings["max_mean_squared_error"])
+					for board in stored_boards:
+						if render_dpi is None:
+							board["png_bytes"] = None
+							self.ready_boards_per_mode[game_mode].append(board)
+						else:
+							future = self.executor.submit(renderStoredBoard, board = board, render_dpi = render_dpi)
+							future.add_done_callback(lambda future, game_mode = game_mode: self.receiveBoard(game_mode = game_mode, future = future, stored_flag = True))
+							self.n_pending_per_mode[game_mode] += 1
+				self.topUp(game_mode = game_mode)
+
+	def stop(self):
+		# Stop the worker processes without waiting for pending boards, then store the boards not yet written to the library
+		if self.executor is not None:
+			self.executor.shutdown(wait = False, cancel_futures = True)
+			self.executor = None
+		self.flushLibrary()
+
+	def flushLibrary(self):
+		# Write every generated board not yet stored to the library in a single transaction
+		with self.condition:
+			unsaved_boards = self.unsaved_boards
+			self.unsaved_boards = []
+		if self.board_library is not None and len(unsaved_boards) > 0:
+			self.board_library.upsertBoards(boards = unsaved_boards)
+
+	### Define functions for keeping the pools full ###
+	def isFailing(self, game_mode:str) -> bool:
+		# Return whether generations for the game mode keep failing, in which case the pool stops submitting them (note: must be called while holding the condition)
+		return self.n_failures_per_mode[game_mode] >= self.max_consecutive_failures
+
+	def topUp(self, game_mode:str):
+		# Submit enough generations for the game mode to refill its pool, unless its generations keep failing or a retry is waiting (note: must be called while holding the condition)
+		if self.isFailing(game_mode = game_mode) or self.retry_scheduled_per_mode[game_mode] == True:
+			return
+		while self.executor is not None and len(self.ready_boards_per_mode[game_mode]) + self.n_pending_per_mode[game_mode] < self.pool_size_per_mode:
+			# Get the seed for this generation
+			seed = self.next_seed
+			if self.next_seed is not None:
+				self.next_seed = (self.next_seed + self.generation_settings["max_attempts"]) % 2**32
+
+			# Submit the generation
+			future = self.executor.submit(generateOptimizedBoard, game_mode = game_mode, seed = seed, **self.generation_settings)
+			future.add_done_callback(lambda future, game_mode = game_mode: self.receiveBoard(game_mode = game_mode, future = future))
+			self.n_pending_per_mode[game_mode] += 1
+
+	def receiveBoard(self, game_mode:str, future:Any, stored_flag:bool = False):
+		# Add a finished board to its pool and wake up any waiting requests, or log a failed generation and retry it after a backoff
+		# Note: new boards are written to the library in batches of library_batch_size (boards rendered from the library aren't written again)
+		#       The library is written after releasing the condition, so that handing out boards never waits on the database
+		if future.cancelled():
+			with self.condition:
+				self.n_pending_per_mode[game_mode] -= 1
+				self.condition.notify_all()
+			return
+		exception = future.exception()
+		unsaved_boards = []
+		with self.condition:
+			self.n_pending_per_mode[game_mode] -= 1
+			if exception is None:
+				self.ready_boards_per_mode[game_mode].append(future.result())
+				self.n_failures_per_mode[game_mode] = 0
+				if self.board_library is not None and stored_flag == False:
+					self.unsaved_boards.append(future.result())
+					if len(self.unsaved_boards) >= self.library_batch_size:
+						unsaved_boards = self.unsaved_boards
+						self.unsaved_boards = []
+			else:
+				# Record the failure and schedule a single retry with a delay which doubles for every consecutive failure (until the cap is reached)
+				self.n_failures_per_mode[game_mode] += 1
+				self.last_error_per_mode[game_mode] = repr(exception)
+				if self.isFailing(game_mode = game_mode) == False and self.retry_scheduled_per_mode[game_mode] == False and self.executor is not None:
+					self.retry_scheduled_per_mode[game_mode] = True
+					retry_timer = Timer(self.retry_delay_seconds * 2**(self.n_failures_per_mode[game_mode] - 1), self.retryTopUp, kwargs = {"game_mode": game_mode})
+					retry_timer.daemon = True
+					retry_timer.start()
+			n_failures = self.n_failures_per_mode[game_mode]
+			self.condition.notify_all()
+
+		# Log the failure or store a full batch of boards in the library
+		if exception is not None:
+			print("CatanBoardPool::receiveBoard: Generation for '" + game_mode + "' failed (" + str(n_failures) + " in a row" + (", no more retries" if n_failures >= self.max_consecutive_failures else "") + "):\n" +
+				  "".join(format_exception(type(exception), exception, exception.__traceback__)))
+		elif len(unsaved_boards) > 0:
+			self.board_library.upsertBoards(boards = unsaved_boards)
+
+	def retryTopUp(self, game_mode:str):
+		# Refill the pool of the game mode once the backoff after a failed generation has passed
+		with self.condition:
+			self.retry_scheduled_per_mode[game_mode] = False
+			self.topUp(game_mode = game_mode)
+
+	### Define external functions for handing out boards ###
+	def getBoard(self, game_mode:str, timeout:float = None) -> dict:
+		# Hand out a ready board for the game mode immediately (or wait for one if the pool is empty), return None on timeout
+		# Verify the inputs
+		assert game_mode in self.game_modes, "CatanBoardPool::getBoard: Provided value for 'game_mode' must be one of the game modes served by the pool"
+
+		# Take the oldest ready board and replace it in the background (returning early if none can arrive because generations keep failing)
+		with self.condition:
+			self.condition.wait_for(lambda: len(self.ready_boards_per_mode[game_mode]) > 0 or (self.isFailing(game_mode = game_mode) and self.n_pending_per_mode[game_mode] == 0), timeout = timeout)
+			if len(self.ready_boards_per_mode[game_mode]) == 0:
+				return None
+			board = self.ready_boards_per_mode[game_mode].popleft()
+			self.topUp(game_mode = game_mode)
+
+		# Return the results
+		return board
+
+	def getStatus(self) -> dict:
+		# Return the number of ready and pending boards for each game mode, along with the number of consecutive failed generations and the last error
+		with self.condition:
+			return {game_mode: {"ready": len(self.ready_boards_per_mode[game_mode]), "pending": self.n_pending_per_mode[game_mode], "failures": self.n_failures_per_mode[game_mode],
+								"last_error": self.last_error_per_mode[game_mode]} for game_mode in self.game_modes}
+
+	def resetFailures(self, game_mode:str):
+		# Clear the failures of a game mode (e.g. after fixing the render setup) and refill its pool
+		with self.condition:
+			self.n_failures_per_mode[game_mode] = 0
+			self.topUp(game_mode = game_mode)
+
+
+###########################################
+### Define the HTTP front end of a pool ###
+###########################################
+def createBoardServer(board_pool:CatanBoardPool, host:str = "127.0.0.1", port:int = 8765, timeout:float = 30) -> ThreadingHTTPServer:
+	# Create an HTTP server which serves boards from the pool
+	# Note: GET /board?game_mode=... returns JSON, GET /board.png?game_mode=... returns the cached render, GET /status returns the pool sizes
+	class BoardRequestHandler(BaseHTTPRequestHandler):
+		def sendContent(self, status_code:int, content_type:str, content:bytes):
+			# Send a complete response
+			self.send_response(status_code)
+			self.send_header("Content-Type", content_type)
+			self.send_header("Content-Length", str(len(content)))
+			self.end_headers()
+			self.wfile.write(content)
+
+		def sendJson(self, status_code:int, value:Any):
+			# Send a JSON response
+			self.sendContent(status_code = status_code, content_type = "application/json", content = dumps(value).encode("utf-8"))
+
+		def do_GET(self):
+			# Handle the supported routes
+			parsed_url = urlparse(self.path)
+			query = parse_qs(parsed_url.query)
+			if parsed_url.path == "/status":
+				self.sendJson(status_code = 200, value = board_pool.getStatus())
+				return
+			if parsed_url.path not in ["/board", "/board.png"]:
+				self.sendJson(status_code = 404, value = {"error": "unknown path"})
+				return
+
+			# Fetch a board for the requested game mode
+			game_mode = query.get("game_mode", [""])[0]
+			if game_mode not in board_pool.game_modes:
+				self.sendJson(status_code = 400, value = {"error": "unsupported game mode", "game_modes": board_pool.game_modes})
+				return
+			if parsed_url.path == "/board.png" and board_pool.generation_settings["render_dpi"] is None:
+				self.sendJson(status_code = 404, value = {"error": "pool was started without cached renders"})
+				return
+			board = board_pool.getBoard(game_mode = game_mode, timeout = timeout)
+			if board is None:
+				self.sendJson(status_code = 503, value = {"error": "no board ready in time"})
+				return
+
+			# Send the board in the needed format
+			if parsed_url.path == "/board.png":
+				self.sendContent(status_code = 200, content_type = "image/png", content = board["png_bytes"])
+			else:
+				self.sendJson(status_code = 200, value = {key: value for key, value in board.items() if key != "png_bytes"})
+
+		def log_message(self, format:str, *args):
+			# Keep the console quiet for every request
+			pass
+
+	# Create and return the server
+	return ThreadingHTTPServer((host, port), BoardRequestHandler)
+
+
+#########################################################################
+### Create the code inside __main__ so that multiprocessing will work ###
+#########################################################################
+if __name__ == "__main__":
+	################################################
+	### Define parameters related to the service ###
+	################################################
+	# Pool settings
+	game_modes = ALL_GAME_MODES
+	pool_size_per_mode = 8
+	n_workers = 4
+	seed = 0
+
+	# Quality settings
+	n_steps = 5000
+	skew_power = 2
+	normalize_type = "static"
+	max_mean_squared_error = 0.001
+	max_attempts = 5
+
+	# Cached render settings (None for no renders, stored boards are rendered when the pool starts otherwise)
+	render_dpi = 150
+
+	# Board library settings (None for no library)
+	library_path = Path(__file__).parent.joinpath("catan_board_library.db")
+
+	# Server settings
+	host = "127.0.0.1"
+	port = 8765
+
+
+	#################################
+	### Start the pool and server ###
+	#################################
+	# Open the board library (if needed)
+	board_library = None if library_path is None else CatanBoardLibrary(db_path = library_path)
+
+	# Create and start the pool
+	board_pool = CatanBoardPool(game_modes = game_modes, pool_size_per_mode = pool_size_per_mode, n_workers = n_workers, n_steps = n_steps, skew_power = skew_power,
+								normalize_type = normalize_type, max_mean_squared_error = max_mean_squared_error, max_attempts = max_attempts, render_dpi = render_dpi, seed = seed,
+								board_library = board_library)
+	board_pool.start()
+
+	# Serve requests until interrupted
+	board_server = createBoardServer(board_pool = board_pool, host = host, port = port)
+	print("Serving boards on http://" + host + ":" + str(port) + " (GET /board?game_mode=..., /board.png?game_mode=..., /status)")
+	try:
+		board_server.serve_forever()
+	except KeyboardInterrupt:
+		pass
+	finally:
+		board_server.server_close()
+		board_pool.stop()
+		if board_library is not None:
+			board_library.close()
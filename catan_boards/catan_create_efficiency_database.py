@@ -16,17 +16,18 @@ path.insert(0, str(infrastructure_folder.joinpath("board_games")))
 path.insert(0, str(infrastructure_folder.joinpath("common_needs")))
 
 # Built-in modules
-from math import sqrt
+from sqlite3 import connect
 
 # Internal modules
+from catan_batch_runner import parseJobArguments
 from catan_board_generator import ALL_TILE_TYPES, CatanGeneratorTiling
+from catan_efficiency_queries import computeConvergencePerSimulation, computeDistanceCorrelation, computeMaxAbsoluteDelta, computeQuantileBucketDensity, computeQuantileBuckets, computeStatisticsPerTypePair, createAnalysisIndexes
+from catan_scatter_plots import createColoredScatterFigure, createDensityFigure, writeFiguresInBackground
+from catan_swap_trace import CatanSwapTraceReplayer, recordSwapTrace, saveSwapTraces
 from color_helper import ALL_PLOTLY_COLOR_SCALES_BY_TYPE, customSpectrum
-from sqlite3_helper import addTable, appendRow, ConnectionManager, getRowCount, readColumn, readEntry
-from tkinter_helper import askSaveFilename
+from sqlite3_helper import addTable, appendRow, ConnectionManager
 
 # External modules
-from numpy import corrcoef, quantile
-import plotly.graph_objects as go
 from tqdm import tqdm
 
 
@@ -48,149 +49,191 @@ normalize_type = "static"
 n_simulations = 20
 n_steps_per_simulation = 1000
 
-
-#################################################################
-### Set up the db file required for saving simulation results ###
-#################################################################
-# Get a path to which the data should be saved and make sure cancel wasn't clicked
-db_path = askSaveFilename(allowed_extensions = ["db"])
-assert db_path is not None, "Unable to create db file because cancel button was clicked"
-
-# Create a connection manager to associate with the db file
-connection_manager = ConnectionManager(db_path = db_path)
+# Whether to save compact swap traces (npz file) from which all columns are recomputed, rather than every column of every swap (db file)
+trace_flag = True
 
 # Set the table name for the simulation results
 table_name = "sim_results"
 
-# Set the column names and types for this table
-column_names = ["sim_index", "step_index", "tile_type_1", "tile_type_2", "pre_mean_squared_error", "post_mean_squared_error", "delta_mean_squared_error"]
-column_types = ["BIGINT", "BIGINT", "TEXT", "TEXT", "FLOAT", "FLOAT", "FLOAT"]
-for tile_type in ALL_TILE_TYPES:
-	column_names.append(tile_type + "_pre_efficiency")
-	column_types.append("FLOAT")
-for tile_type in ALL_TILE_TYPES:
-	column_names.append(tile_type + "_normalized_error")
-	column_types.append("FLOAT")
-
-# Create the needed table in the db file
-addTable(connection_manager = connection_manager, table_name = table_name, column_names = column_names, column_types = column_types)
+# Plot settings (above the WebGL threshold, each plot is either decimated to roughly the maximum number of points or binned into a density grid)
+webgl_threshold = 5000
+max_plotted_points = 50000
+reduction_type = "decimate"
+
+# Whether to open the plots in a browser once they are written
+open_flag = True
+
+# Path to which the results are saved (asked for with a dialog if not provided here, on the command line or in a job config)
+results_path = None
+
+# Override the parameters above with those of a job config or the command line (if provided, see catan_batch_runner.py)
+job_settings = parseJobArguments(default_settings = {"seed": seed, "game_mode": game_mode, "skew_power": skew_power, "reject_flag": reject_flag, "normalize_type": normalize_type,
+													 "n_simulations": n_simulations, "n_steps_per_simulation": n_steps_per_simulation, "trace_flag": trace_flag, "table_name": table_name,
+													 "webgl_threshold": webgl_threshold, "max_plotted_points": max_plotted_points, "reduction_type": reduction_type, "open_flag": open_flag},
+								 path_names = ["results_path"])
+seed = job_settings["seed"]
+game_mode = job_settings["game_mode"]
+skew_power = job_settings["skew_power"]
+reject_flag = job_settings["reject_flag"]
+normalize_type = job_settings["normalize_type"]
+n_simulations = job_settings["n_simulations"]
+n_steps_per_simulation = job_settings["n_steps_per_simulation"]
+trace_flag = job_settings["trace_flag"]
+table_name = job_settings["table_name"]
+webgl_threshold = job_settings["webgl_threshold"]
+max_plotted_points = job_settings["max_plotted_points"]
+reduction_type = job_settings["reduction_type"]
+open_flag = job_settings["open_flag"]
+results_path = job_settings["results_path"]
+
+# Ask for a path to which the results should be saved (if needed) and make sure cancel wasn't clicked
+if results_path is None:
+	from tkinter_helper import askSaveFilename
+	results_path = askSaveFilename(allowed_extensions = ["npz" if trace_flag == True else "db"])
+	assert results_path is not None, "Unable to create results file because cancel button was clicked"
 
 
 ######################################################################
-### Run the needed simulations and save the results to the db file ###
+### Run the needed simulations and save the results as swap traces ###
 ######################################################################
-for sim_index in tqdm(range(n_simulations)):
-	# Create the tiling to use for this simulation
-	current_tiling = CatanGeneratorTiling(game_mode = game_mode, seed = seed)
-
-	# Randomly swap tiles for the needed number of simulation steps
-	for step_index in range(n_steps_per_simulation):
-		# Execute a random swap and get the needed results
-		swap_results = current_tiling.swapTiles(skew_power = skew_power, reject_flag = reject_flag, normalize_type = normalize_type)
-
-		# Extract the needed values from the swap results
-		tile_type_1 = swap_results["tile_type_1"]
-		tile_type_2 = swap_results["tile_type_2"]
-		pre_mean_squared_error = swap_results["pre_mean_squared_error"]
-		post_mean_squared_error = swap_results["post_mean_squared_error"]
-		pre_efficiency_by_tile = swap_results["pre_efficiency_by_tile"]
-		normalized_error_by_tile = swap_results["normalized_error_by_tile"]
-
-		# Compute the change in mean squared error
-		delta_mean_squared_error = post_mean_squared_error - pre_mean_squared_error
-
-		# Write the needed information to the db file (if needed)
-		if reject_flag == False or delta_mean_squared_error < 0:
-			# Get the row index for the new row
-			row_index = getRowCount(connection_manager = connection_manager, table_name = table_name)
-
-			# Create a list containing the new row information
-			new_row = [sim_index, step_index, tile_type_1, tile_type_2, pre_mean_squared_error, post_mean_squared_error, delta_mean_squared_error]
-			for tile_type in ALL_TILE_TYPES:
-				new_row.append(pre_efficiency_by_tile[tile_type])
-			for tile_type in ALL_TILE_TYPES:
-				new_row.append(normalized_error_by_tile[tile_type])
-
-			# Add the row to the db file
-			appendRow(connection_manager = connection_manager, table_name = table_name, new_row = new_row)
-
-	# Iterate the random seed (if needed)
-	if seed is not None:
-		seed += 1
-
-# Commit changes to db file now that the simulations are done
-connection_manager.commit()
-
-##########################################################
-### Read important shared information from the db file ###
-##########################################################
-# Get the total number of rows from the db file
-n_rows = getRowCount(connection_manager = connection_manager, table_name = table_name)
-
-# Read the change in MSE column from the db file
-delta_mean_squared_error_column = readColumn(connection_manager = connection_manager, table_name = table_name, column_name = "delta_mean_squared_error")
-
-# Read the tile type columns from the db file
-tile_type_1_column = readColumn(connection_manager = connection_manager, table_name = table_name, column_name = "tile_type_1")
-tile_type_2_column = readColumn(connection_manager = connection_manager, table_name = table_name, column_name = "tile_type_2")
-
-# Read the normalized error columns for each tile type
-normalized_error_column_by_tile = {}
-for tile_type in ALL_TILE_TYPES:
-	normalized_error_column_by_tile[tile_type] = readColumn(connection_manager = connection_manager, table_name = table_name, column_name = tile_type + "_normalized_error")
-
-# Close the connection manager
-connection_manager.close()
+if trace_flag == True:
+	# Record a trace of each simulation and save them
+	traces = []
+	for sim_index in tqdm(range(n_simulations)):
+		traces.append(recordSwapTrace(game_mode = game_mode, seed = seed, n_steps = n_steps_per_simulation, skew_power = skew_power, reject_flag = reject_flag, normalize_type = normalize_type))
+		if seed is not None:
+			seed += 1
+	saveSwapTraces(traces = traces, trace_path = results_path)
+
+	# Recompute the rows which would have been written to the db file from the traces and load them into an in-memory db for analysis
+	connection = connect(":memory:")
+	connection.execute("CREATE TABLE " + table_name + " (sim_index BIGINT, step_index BIGINT, tile_type_1 TEXT, tile_type_2 TEXT, pre_mean_squared_error FLOAT, post_mean_squared_error FLOAT, delta_mean_squared_error FLOAT, "
+					   + ", ".join([tile_type + "_pre_efficiency FLOAT" for tile_type in ALL_TILE_TYPES] + [tile_type + "_normalized_error FLOAT" for tile_type in ALL_TILE_TYPES]) + ")")
+	for sim_index, trace in enumerate(traces):
+		# Replay the trace and compute the needed values for all steps at once
+		replayer = CatanSwapTraceReplayer(trace = trace)
+		pre_mean_squared_errors = replayer.getMeanSquaredErrors(stage = "pre").tolist()
+		post_mean_squared_errors = replayer.getMeanSquaredErrors(stage = "post").tolist()
+		pre_efficiencies = replayer.getEfficiencies(stage = "pre").tolist()
+		normalized_errors = replayer.getNormalizedErrors().tolist()
+		tile_types_1, tile_types_2 = replayer.getSwappedTileTypes()
+		code_per_tile = {tile_type: replayer.needed_tile_types.index(tile_type) if tile_type in replayer.needed_tile_types else None for tile_type in ALL_TILE_TYPES}
+
+		# Create the rows of the kept swaps and add them to the table
+		rows = []
+		for step_index in range(replayer.n_steps):
+			delta_mean_squared_error = post_mean_squared_errors[step_index] - pre_mean_squared_errors[step_index]
+			if reject_flag == False or delta_mean_squared_error < 0:
+				rows.append([sim_index, step_index, tile_types_1[step_index], tile_types_2[step_index], pre_mean_squared_errors[step_index], post_mean_squared_errors[step_index], delta_mean_squared_error]
+							+ [None if code_per_tile[tile_type] is None else pre_efficiencies[step_index][code_per_tile[tile_type]] for tile_type in ALL_TILE_TYPES]
+							+ [None if code_per_tile[tile_type] is None else normalized_errors[step_index][code_per_tile[tile_type]] for tile_type in ALL_TILE_TYPES])
+		with connection:
+			connection.executemany("INSERT INTO " + table_name + " VALUES (" + ", ".join(["?"] * (7 + 2 * len(ALL_TILE_TYPES))) + ")", rows)
 
+else:
+	#################################################################
+	### Set up the db file required for saving simulation results ###
+	#################################################################
+	# Create a connection manager to associate with the db file
+	connection_manager = ConnectionManager(db_path = results_path)
+
+	# Set the column names and types for this table
+	column_names = ["sim_index", "step_index", "tile_type_1", "tile_type_2", "pre_mean_squared_error", "post_mean_squared_error", "delta_mean_squared_error"]
+	column_types = ["BIGINT", "BIGINT", "TEXT", "TEXT", "FLOAT", "FLOAT", "FLOAT"]
+	for tile_type in ALL_TILE_TYPES:
+		column_names.append(tile_type + "_pre_efficiency")
+		column_types.append("FLOAT")
+	for tile_type in ALL_TILE_TYPES:
+		column_names.append(tile_type + "_normalized_error")
+		column_types.append("FLOAT")
+
+	# Create the needed table in the db file
+	addTable(connection_manager = connection_manager, table_name = table_name, column_names = column_names, column_types = column_types)
+
+
+	######################################################################
+	### Run the needed simulations and save the results to the db file ###
+	######################################################################
+	for sim_index in tqdm(range(n_simulations)):
+		# Create the tiling to use for this simulation
+		current_tiling = CatanGeneratorTiling(game_mode = game_mode, seed = seed)
+
+		# Randomly swap tiles for the needed number of simulation steps
+		for step_index in range(n_steps_per_simulation):
+			# Execute a random swap and get the needed results
+			swap_results = current_tiling.swapTiles(skew_power = skew_power, reject_flag = reject_flag, normalize_type = normalize_type)
+
+			# Extract the needed values from the swap results
+			tile_type_1 = swap_results["tile_type_1"]
+			tile_type_2 = swap_results["tile_type_2"]
+			pre_mean_squared_error = swap_results["pre_mean_squared_error"]
+			post_mean_squared_error = swap_results["post_mean_squared_error"]
+			pre_efficiency_by_tile = swap_results["pre_efficiency_by_tile"]
+			normalized_error_by_tile = swap_results["normalized_error_by_tile"]
+
+			# Compute the change in mean squared error
+			delta_mean_squared_error = post_mean_squared_error - pre_mean_squared_error
+
+			# Write the needed information to the db file (if needed)
+			if reject_flag == False or delta_mean_squared_error < 0:
+				# Create a list containing the new row information
+				new_row = [sim_index, step_index, tile_type_1, tile_type_2, pre_mean_squared_error, post_mean_squared_error, delta_mean_squared_error]
+				for tile_type in ALL_TILE_TYPES:
+					new_row.append(pre_efficiency_by_tile[tile_type])
+				for tile_type in ALL_TILE_TYPES:
+					new_row.append(normalized_error_by_tile[tile_type])
+
+				# Add the row to the db file
+				appendRow(connection_manager = connection_manager, table_name = table_name, new_row = new_row)
+
+		# Iterate the random seed (if needed)
+		if seed is not None:
+			seed += 1
+
+	# Commit changes to db file now that the simulations are done and close the connection manager
+	connection_manager.commit()
+	connection_manager.close()
+
+	# Open the db file for analysis
+	connection = connect(results_path)
+
+
+#############################################################
+### Summarize the simulations with queries on the db file ###
+#############################################################
+# Create the indexes used by the analysis queries
+createAnalysisIndexes(connection = connection, table_name = table_name)
+
+# Print the statistics of the change in MSE for each pair of swapped tile types
+print("CHANGE IN MSE PER SWAPPED TILE TYPE PAIR:")
+for statistics in computeStatisticsPerTypePair(connection = connection, table_name = table_name):
+	print("    " + statistics["tile_type_1"] + " <-> " + statistics["tile_type_2"] + " ---> n = " + str(statistics["n_swaps"]) + ", mean = " + str(statistics["mean_delta"]) + ", std = " + str(statistics["std_delta"]))
+
+# Print the convergence of each simulation
+print("CONVERGENCE PER SIMULATION:")
+for convergence in computeConvergencePerSimulation(connection = connection, table_name = table_name):
+	print("    sim " + str(convergence["sim_index"]) + " ---> MSE " + str(convergence["initial_mean_squared_error"]) + " to " + str(convergence["final_mean_squared_error"]) + " by step " + str(convergence["final_step_index"]))
+
+# Print the correlation coefficient between the diagonal distance and the decrease in MSE
+# Note: hypothesis is that LARGER DISTANCE should result in MORE NEGATIVE delta in MSE
+print("Correlation Coefficient Between Diagonal Distance And Decrease In MSE ---> " + str(computeDistanceCorrelation(connection = connection, table_name = table_name)))
 
-#########################################################
-### Analyze the simulations and create relevant plots ###
-#########################################################
-# Initialize the needed storage
-delta_values_by_quantile = {0: [], 1: [], 2: [], 3: []}
-normalized_error_1_values_by_quantile = {0: [], 1: [], 2: [], 3: []}
-normalized_error_2_values_by_quantile = {0: [], 1: [], 2: [], 3: []}
-distances_from_equal = []
-
-# Get the quantile information from the delta column
-quantile_values = quantile(a = delta_mean_squared_error_column, q = [0, 0.25, 0.5, 0.75, 1])
-
-# Compute the maximum magnitude delta MSE value from the db file
-max_abs_delta = max(abs(max(delta_mean_squared_error_column)), abs(min(delta_mean_squared_error_column)))
-
-# Read the needed information from the table
-for row_index in tqdm(range(n_rows)):
-	# Get the change in mean squared error associated with this swap
-	delta_mean_squared_error = delta_mean_squared_error_column[row_index]
-
-	# Determine to which quantile the relevant data should be added
-	if quantile_values[0] <= delta_mean_squared_error and delta_mean_squared_error < quantile_values[1]:
-		quantile_index = 0
-	elif quantile_values[1] <= delta_mean_squared_error and delta_mean_squared_error <= quantile_values[2]:
-		quantile_index = 1
-	elif quantile_values[2] <= delta_mean_squared_error and delta_mean_squared_error <= quantile_values[3]:
-		quantile_index = 2
-	else:
-		quantile_index = 3
-
-	# Get the two tile types involved with this swap
-	tile_type_1 = tile_type_1_column[row_index]
-	tile_type_2 = tile_type_2_column[row_index]
+# Compute the maximum magnitude delta MSE value
+max_abs_delta = computeMaxAbsoluteDelta(connection = connection, table_name = table_name)
 
-	# Get the associated normalized error values for these tile types
-	normalized_error_1 = normalized_error_column_by_tile[tile_type_1][row_index]
-	normalized_error_2 = normalized_error_column_by_tile[tile_type_2][row_index]
+# Fetch the values needed for the plots of each quartile of the change in MSE, reduced in SQLite to a stratified sample or a density grid of each quartile
+if reduction_type == "decimate":
+	values_per_bucket = computeQuantileBuckets(connection = connection, table_name = table_name, n_buckets = 4, max_points_per_bucket = max_plotted_points)
+else:
+	binned_data_per_bucket = computeQuantileBucketDensity(connection = connection, table_name = table_name, n_buckets = 4)
 
-	# Append to the needed lists
-	delta_values_by_quantile[quantile_index].append(delta_mean_squared_error)
-	normalized_error_1_values_by_quantile[quantile_index].append(normalized_error_1)
-	normalized_error_2_values_by_quantile[quantile_index].append(normalized_error_2)
-	distances_from_equal.append(abs(normalized_error_1 - normalized_error_2) / sqrt(2))
+# Close the connection
+connection.close()
 
-# Print the correlation coefficient between these two columns
-# Note: hypothesis is that LARGER DISTANCE should result in MORE NEGATIVE delta in MSE
-print("Correlation Coefficient Between Diagonal Distance And Decrease In MSE ---> " + str(-float(corrcoef(distances_from_equal, delta_mean_squared_error_column)[0, 1])))
 
+#########################################################
+### Analyze the simulations and create relevant plots ###
+#########################################################
 # Set the color scale and color bound values as needed
 # Fetch the needed diverging spectrum
 rgb_spectrum = ALL_PLOTLY_COLOR_SCALES_BY_TYPE["diverging"]["Portland"]
@@ -213,31 +256,33 @@ suffixes_by_quantile = ["75th To 100th Percentile",
 						"0th To 25th Percentile"]
 
 # Create scatter plots showing how efficiency values affect delta values
+figures = []
 for quantile_index in range(4):
 	# Create the figure
-	fig = go.Figure()
-
-	# Add the needed traces
-	fig.add_trace(go.Scatter(x = normalized_error_1_values_by_quantile[quantile_index],
-							 y = normalized_error_2_values_by_quantile[quantile_index],
-							 showlegend = False,
-							 customdata = delta_values_by_quantile[quantile_index],
-							 hovertemplate = ("<b>Normalized Error 1:</b> %{x}<br>"
-											  "<b>Normalized Error 2:</b> %{y}<br>"
-											  "<b>Delta Mean Squared Error:</b> %{customdata}<br>"
-											  "<extra></extra>"),
-							 mode = "markers",
-							 marker = {"color": delta_values_by_quantile[quantile_index],
-									   "colorscale": color_scale,
-									   "showscale": True,
-									   "cmin": c_min,
-									   "cmax": c_max}))
+	hover_labels = ["Normalized Error 1", "Normalized Error 2", "Delta Mean Squared Error"]
+	if reduction_type == "decimate":
+		fig = createColoredScatterFigure(x_values = values_per_bucket[quantile_index]["normalized_error_1"],
+										 y_values = values_per_bucket[quantile_index]["normalized_error_2"],
+										 color_values = values_per_bucket[quantile_index]["delta_mean_squared_error"],
+										 color_scale = color_scale,
+										 c_min = c_min,
+										 c_max = c_max,
+										 hover_labels = hover_labels,
+										 reduction_type = reduction_type,
+										 webgl_threshold = webgl_threshold,
+										 max_points = max_plotted_points,
+										 n_total_points = values_per_bucket[quantile_index]["n_swaps"])
+	else:
+		fig = createDensityFigure(binned_data = binned_data_per_bucket[quantile_index], color_scale = color_scale, c_min = c_min, c_max = c_max, hover_labels = hover_labels)
 
 	# Format the figure
 	fig.update_layout(title = "Change In Mean Squared Error As Function Of Normalized Error Values (" + suffixes_by_quantile[quantile_index] + ")",
 					  xaxis = {"range": [-0.05, 1.05]}, yaxis = {"range": [-0.05, 1.05]})
 	fig.update_xaxes(title = "normalized error 1")
 	fig.update_yaxes(title = "normalized error 2")
-	
-	# Show the figure
-	fig.show()
\ No newline at end of file
+	figures.append(fig)
+
+# Write the figures next to the saved results and open them, without blocking on the rendering
+results_path = Path(results_path)
+html_paths = [results_path.with_name(results_path.stem + "_quartile_" + str(quantile_index) + ".html") for quantile_index in range(4)]
+writeFiguresInBackground(figures = figures, html_paths = html_paths, open_flag = open_flag)
@@ -14,17 +14,19 @@ infrastructure_folder = parent_folder.joinpath("infrastructure")
 # Add the needed paths
 path.insert(0, str(infrastructure_folder.joinpath("common_needs")))
 path.insert(0, str(infrastructure_folder.joinpath("dimensional_analysis")))
+path.insert(0, str(active_projects_folder.joinpath("dimension_demo")))
 
 # Built-in modules
 from time import time
 
 # Internal modules
+from catan_batch_runner import parseJobArguments
 from persistent_dimension import estimatePointwiseDimension, generateDimensionDatabase, plotDimensionEstimateOfSet
 from sqlite3_helper import ConnectionManager, getColumnNames, getColumnTypes, getExistingTables, getRowCount, readRow
-from tkinter_helper import askOpenFilename
+from truncated_local_pca import computeSoftmaxDistances, estimateLocalDimensions, saveLocalDimensions
 
 # External modules
-from numpy import array
+from numpy import array, bincount
 from tqdm import tqdm
 
 
@@ -32,6 +34,60 @@ from tqdm import tqdm
 ### Create the code inside __main__ so that multiprocessing will work ###
 #########################################################################
 if __name__ == "__main__":
+	##########################################################
+	### Define parameters related to the dimensional study ###
+	##########################################################
+	# Set the needed softmax distance settings
+	all_softmax_distances = [0.4, 0.8, 1.6]
+	min_softmax_distance = 0.1
+	max_softmax_distance = 2.5
+	n_distances = 20
+
+	# Set the needed percent variance settings
+	all_percent_variances = [60, 75, 90]
+	min_percent_variance = 50
+	max_percent_variance = 90
+
+	# General plot settings
+	round_flag = False
+	show_flag = False
+	save_flag = True
+
+	# Truncated neighborhood settings (if truncated_flag is True, the dimensions are estimated with truncated_local_pca.py instead of the full dimension database)
+	# Note: this is meant for 10^5 or more efficiency vectors, where neighbors with a softmax weight below weight_cutoff are dropped and error bounds are reported
+	#       The truncated estimator defines its own weighting (see truncated_local_pca.py), which hasn't been checked against generateDimensionDatabase, so its
+	#       dimensions are a separate estimate rather than a faster copy of the full one
+	truncated_flag = False
+	weight_cutoff = 10**-6
+
+	# Number of worker threads used for the truncated neighborhoods (-1 for every core, set by catan_batch_runner.py to the thread limit of each job)
+	n_workers = -1
+
+	# Path from which the efficiency database is loaded (asked for with a dialog if not provided here, on the command line or in a job config)
+	db_path_efficiency = None
+
+	# Override the parameters above with those of a job config or the command line (if provided, see catan_batch_runner.py)
+	job_settings = parseJobArguments(default_settings = {"all_softmax_distances": all_softmax_distances, "min_softmax_distance": min_softmax_distance, "max_softmax_distance": max_softmax_distance,
+														 "n_distances": n_distances, "all_percent_variances": all_percent_variances, "min_percent_variance": min_percent_variance,
+														 "max_percent_variance": max_percent_variance, "round_flag": round_flag, "show_flag": show_flag, "save_flag": save_flag,
+														 "truncated_flag": truncated_flag, "weight_cutoff": weight_cutoff, "n_workers": n_workers},
+									 path_names = ["db_path_efficiency"])
+	all_softmax_distances = job_settings["all_softmax_distances"]
+	min_softmax_distance = job_settings["min_softmax_distance"]
+	max_softmax_distance = job_settings["max_softmax_distance"]
+	n_distances = job_settings["n_distances"]
+	all_percent_variances = job_settings["all_percent_variances"]
+	min_percent_variance = job_settings["min_percent_variance"]
+	max_percent_variance = job_settings["max_percent_variance"]
+	round_flag = job_settings["round_flag"]
+	show_flag = job_settings["show_flag"]
+	save_flag = job_settings["save_flag"]
+	truncated_flag = job_settings["truncated_flag"]
+	weight_cutoff = job_settings["weight_cutoff"]
+	n_workers = job_settings["n_workers"]
+	db_path_efficiency = job_settings["db_path_efficiency"]
+
+
 	#################################################
 	### Load the efficiency database and parse it ###
 	#################################################
@@ -46,8 +102,10 @@ if __name__ == "__main__":
 		column_names.append(tile_type + "_pre_efficiency")
 		column_types.append("FLOAT")
 
-	# Get a path from which the data should be loaded and make sure cancel wasn't clicked
-	db_path_efficiency = askOpenFilename(allowed_extensions = ["db"])
+	# Ask for a path from which the data should be loaded (if needed) and make sure cancel wasn't clicked
+	if db_path_efficiency is None:
+		from tkinter_helper import askOpenFilename
+		db_path_efficiency = askOpenFilename(allowed_extensions = ["db"])
 	assert db_path_efficiency is not None, "Unable to read db file because cancel button was clicked"
 
 	# Create a connection manager to associate with the db file
@@ -74,7 +132,7 @@ if __name__ == "__main__":
 
 	# Initialize the raw data as a list of lists as well as a hash table for the rows
 	raw_data_lists = []
-	added_row_hashes = []
+	added_row_hashes = set()
 
 	# Iterate through the db file and store the needed efficiency values
 	for row_index in tqdm(range(n_rows)):
@@ -90,7 +148,7 @@ if __name__ == "__main__":
 		# Add to the needed lists (if needed)
 		if row_hash not in added_row_hashes:
 			raw_data_lists.append(new_row)
-			added_row_hashes.append(row_hash)
+			added_row_hashes.add(row_hash)
 
 	# Convert the raw data lists to a numpy array
 	raw_data_array = array(raw_data_lists, dtype = float)
@@ -102,53 +160,57 @@ if __name__ == "__main__":
 	######################################################################
 	### Perform the needed dimensional analysis on the efficiency data ###
 	######################################################################
-	# Set the needed softmax distance settings
-	all_softmax_distances = [0.4, 0.8, 1.6]
-	min_softmax_distance = 0.1
-	max_softmax_distance = 2.5
-	n_distances = 20
-
-	# Set the needed percent variance settings
-	all_percent_variances = [60, 75, 90]
-	min_percent_variance = 50
-	max_percent_variance = 90
-
-	# General plot settings
-	round_flag = False
-	show_flag = False
-	save_flag = True
-
-	# Generate the dimensional analysis db file and display total time taken to do so
-	# Set the start time
-	start_time = time()
-	# Generate the database and get the path
-	db_path_dimensional = generateDimensionDatabase(raw_data_array = raw_data_array,
-													min_softmax_distance = min_softmax_distance,
-													max_softmax_distance = max_softmax_distance,
-													n_distances = n_distances)
-	# Set the end time and display the difference
-	end_time = time()
-	print("Time To Generate Dimension Database: " + str(round(end_time - start_time, 2)) + " seconds")
-
-	# Generate the needed figures
-	for softmax_distance in all_softmax_distances:
-		for percent_variance in all_percent_variances:
-			# Create a scatter plot of the dimension estimate of each point given a fixed softmax distance and percent variance
-			plotDimensionEstimateOfSet(db_path = db_path_dimensional,
-									   softmax_distance = softmax_distance,
-									   percent_variance = percent_variance,
-									   plot_type = "scatter3D",
-									   used_engine = "matplotlib",
-									   round_flag = round_flag,
-									   show_flag = show_flag,
-									   save_flag = save_flag)
-
-			# Create a distribution of the dimension estimates by percentile given a fixed softmax distance and percent variance
-			plotDimensionEstimateOfSet(db_path = db_path_dimensional,
-									   softmax_distance = softmax_distance,
-									   percent_variance = percent_variance,
-									   plot_type = "distribution",
-									   used_engine = "matplotlib",
-									   round_flag = round_flag,
-									   show_flag = show_flag,
-									   save_flag = save_flag)
\ No newline at end of file
+	if truncated_flag == True:
+		# Estimate the dimensions from truncated neighborhoods over the same softmax distances as the full database (along with the plotted ones) and display total time taken to do so
+		start_time = time()
+		softmax_distances = sorted(set(computeSoftmaxDistances(min_softmax_distance = min_softmax_distance, max_softmax_distance = max_softmax_distance, n_distances = n_distances).tolist() + list(all_softmax_distances)))
+		local_dimensions = estimateLocalDimensions(raw_data_array = raw_data_array, softmax_distances = softmax_distances, percent_variances = all_percent_variances,
+												   weight_cutoff = weight_cutoff, n_workers = n_workers, verbose_flag = True)
+		print("Time To Estimate Truncated Dimensions: " + str(round(time() - start_time, 2)) + " seconds")
+
+		# Save the results next to the efficiency database
+		saveLocalDimensions(results = local_dimensions, results_path = str(Path(db_path_efficiency).with_suffix("")) + "_local_dimensions.npz")
+
+		# Display the number of points of each dimension given a fixed softmax distance and percent variance, along with the largest eigenvalue error bound
+		for softmax_distance in all_softmax_distances:
+			distance_index = softmax_distances.index(softmax_distance)
+			for variance_index, percent_variance in enumerate(all_percent_variances):
+				dimension_counts = bincount(local_dimensions["dimensions"][:, distance_index, variance_index])
+				print("softmax distance = " + str(softmax_distance) + ", percent variance = " + str(percent_variance) + " ---> points per dimension: " +
+					  ", ".join([str(dimension) + ": " + str(count) for dimension, count in enumerate(dimension_counts) if count > 0]) +
+					  " (max eigenvalue error bound = " + str(local_dimensions["eigenvalue_error_bounds"][:, distance_index].max()) + ")")
+	else:
+		# Generate the dimensional analysis db file and display total time taken to do so
+		# Set the start time
+		start_time = time()
+		# Generate the database and get the path
+		db_path_dimensional = generateDimensionDatabase(raw_data_array = raw_data_array,
+														min_softmax_distance = min_softmax_distance,
+														max_softmax_distance = max_softmax_distance,
+														n_distances = n_distances)
+		# Set the end time and display the difference
+		end_time = time()
+		print("Time To Generate Dimension Database: " + str(round(end_time - start_time, 2)) + " seconds")
+
+		# Generate the needed figures
+		for softmax_distance in all_softmax_distances:
+			for percent_variance in all_percent_variances:
+				# Create a scatter plot of the dimension estimate of each point given a fixed softmax distance and percent variance
+				plotDimensionEstimateOfSet(db_path = db_path_dimensional,
+										   softmax_distance = softmax_distance,
+										   percent_variance = percent_variance,
+										   plot_type = "scatter3D",
+										   used_engine = "matplotlib",
+										   round_flag = round_flag,
+										   show_flag = show_flag,
+										   save_flag = save_flag)
+
+				# Create a distribution of the dimension estimates by percentile given a fixed softmax distance and percent variance
+				plotDimensionEstimateOfSet(db_path = db_path_dimensional,
+										   softmax_distance = softmax_distance,
+										   percent_variance = percent_variance,
+										   plot_type = "distribution",
+										   used_engine = "matplotlib",
+										   round_flag = round_flag,
+										   show_flag = show_flag,
+										   save_flag = save_flag)
\ No newline at end of file
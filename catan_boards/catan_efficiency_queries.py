@@ -0,0 +1,139 @@
+##########################################
+### Import needed general dependencies ###
+##########################################
+# Add paths for internal modules
+# Import dependencies
+from pathlib import Path
+from sys import path
+# Get the shared active projects folder
+active_projects_folder = Path(__file__).parent.parent
+# Get the shared parent folder
+parent_folder = active_projects_folder.parent
+# Get the shared infrastructure folder
+infrastructure_folder = parent_folder.joinpath("infrastructure")
+# Add the needed paths
+path.insert(0, str(infrastructure_folder.joinpath("board_games")))
+path.insert(0, str(infrastructure_folder.joinpath("common_needs")))
+
+# Built-in modules
+from math import sqrt
+from sqlite3 import Connection
+
+# Internal modules
+from catan_board_core import ALL_TILE_TYPES
+
+# External modules
+from numpy import arange, full, nan, zeros
+
+
+#################################################################
+### Define helper functions for building the analysis queries ###
+#################################################################
+# Note: every function pushes its filtering, grouping and aggregation down into SQLite so only summarized rows are returned
+#       The table is expected to have the columns written by catan_create_efficiency_database.py
+def createAnalysisIndexes(connection:Connection, table_name:str):
+	# Create the indexes used by the analysis queries (if they don't already exist)
+	with connection:
+		connection.execute("CREATE INDEX IF NOT EXISTS " + table_name + "_by_step ON " + table_name + " (sim_index, step_index)")
+		connection.execute("CREATE INDEX IF NOT EXISTS " + table_name + "_by_tile_types ON " + table_name + " (tile_type_1, tile_type_2)")
+		connection.execute("CREATE INDEX IF NOT EXISTS " + table_name + "_by_delta ON " + table_name + " (delta_mean_squared_error)")
+
+def getNormalizedErrorExpression(tile_type_column:str) -> str:
+	# Return an SQL expression selecting the normalized error column of the tile type stored in a tile type column
+	return "CASE " + tile_type_column + " " + " ".join(["WHEN '" + tile_type + "' THEN " + tile_type + "_normalized_error" for tile_type in ALL_TILE_TYPES]) + " END"
+
+
+###############################################
+### Define the summarizing analysis queries ###
+###############################################
+def computeStatisticsPerTypePair(connection:Connection, table_name:str) -> list:
+	# Return the count, mean, standard deviation, min and max of the change in MSE for every (tile_type_1, tile_type_2) pair
+	rows = connection.execute("SELECT tile_type_1, tile_type_2, COUNT(*), AVG(delta_mean_squared_error), AVG(delta_mean_squared_error * delta_mean_squared_error), "
+							  "MIN(delta_mean_squared_error), MAX(delta_mean_squared_error) FROM " + table_name + " GROUP BY tile_type_1, tile_type_2 ORDER BY tile_type_1, tile_type_2").fetchall()
+	statistics_per_pair = []
+	for tile_type_1, tile_type_2, n_swaps, mean_delta, mean_squared_delta, min_delta, max_delta in rows:
+		statistics_per_pair.append({"tile_type_1": tile_type_1, "tile_type_2": tile_type_2, "n_swaps": n_swaps, "mean_delta": mean_delta,
+									"std_delta": sqrt(max(mean_squared_delta - mean_delta**2, 0)), "min_delta": min_delta, "max_delta": max_delta})
+	return statistics_per_pair
+
+def computeConvergencePerSimulation(connection:Connection, table_name:str) -> list:
+	# Return the number of stored swaps, the initial and final MSE and the step at which the final MSE was reached for every simulation
+	rows = connection.execute("SELECT sim_index, COUNT(*), MAX(CASE WHEN first_rank = 1 THEN pre_mean_squared_error END), MAX(CASE WHEN last_rank = 1 THEN post_mean_squared_error END), "
+							  "MAX(CASE WHEN last_rank = 1 THEN step_index END) FROM (SELECT sim_index, step_index, pre_mean_squared_error, post_mean_squared_error, "
+							  "ROW_NUMBER() OVER (PARTITION BY sim_index ORDER BY step_index) AS first_rank, ROW_NUMBER() OVER (PARTITION BY sim_index ORDER BY step_index DESC) AS last_rank "
+							  "FROM " + table_name + ") GROUP BY sim_index ORDER BY sim_index").fetchall()
+	return [{"sim_index": sim_index, "n_swaps": n_swaps, "initial_mean_squared_error": initial_error, "final_mean_squared_error": final_error, "final_step_index": final_step_index}
+			for sim_index, n_swaps, initial_error, final_error, final_step_index in rows]
+
+def getBucketedSwapsQuery(table_name:str, n_buckets:int, n_bins_per_axis:int) -> str:
+	# Return a query selecting the bucket (of n_buckets equal-count buckets of the change in MSE), change in MSE, normalized errors and grid cell of every swap
+	# Note: the grid spans the range of the normalized errors within each bucket, with n_bins_per_axis equal-width cells per axis (as in catan_scatter_plots.computeCellIndices)
+	cell_expression = lambda column: "MIN(MAX(CAST((" + column + " - min_" + column + ") / MAX(max_" + column + " - min_" + column + ", 1e-300) * " + str(n_bins_per_axis) + " AS INTEGER), 0), " + str(n_bins_per_axis - 1) + ")"
+	return ("WITH swaps AS (SELECT NTILE(" + str(n_buckets) + ") OVER (ORDER BY delta_mean_squared_error) - 1 AS bucket_index, delta_mean_squared_error, "
+			+ getNormalizedErrorExpression(tile_type_column = "tile_type_1") + " AS x, " + getNormalizedErrorExpression(tile_type_column = "tile_type_2") + " AS y FROM " + table_name + "), "
+			"ranges AS (SELECT *, MIN(x) OVER buckets AS min_x, MAX(x) OVER buckets AS max_x, MIN(y) OVER buckets AS min_y, MAX(y) OVER buckets AS max_y FROM swaps WINDOW buckets AS (PARTITION BY bucket_index)) "
+			"SELECT bucket_index, delta_mean_squared_error, x, y, min_x, max_x, min_y, max_y, " + cell_expression("x") + " AS x_cell, " + cell_expression("y") + " AS y_cell FROM ranges")
+
+def computeQuantileBuckets(connection:Connection, table_name:str, n_buckets:int = 4, max_points_per_bucket:int = None, n_bins_per_axis:int = 50) -> dict:
+	# Return the change in MSE and the normalized errors of both swapped tile types for the swaps of each equal-count bucket of the change in MSE, along with the number of swaps of each bucket
+	# Note: bucket 0 holds the most negative changes (i.e. the largest improvements)
+	#       If max_points_per_bucket is provided, each larger bucket is reduced in SQLite to roughly that many swaps, stratified the same way as catan_scatter_plots.decimateStratified
+	#       (i.e. every occupied grid cell keeps a share proportional to its size, spread evenly over the cell's order of change in MSE and always including its smallest change)
+	# Verify the inputs
+	assert type(n_buckets) == int and n_buckets > 0, "computeQuantileBuckets: Provided value for 'n_buckets' must be a positive int object"
+	assert max_points_per_bucket is None or (type(max_points_per_bucket) == int and max_points_per_bucket > 0), "computeQuantileBuckets: If provided, value for 'max_points_per_bucket' must be a positive int object"
+	assert type(n_bins_per_axis) == int and n_bins_per_axis > 0, "computeQuantileBuckets: Provided value for 'n_bins_per_axis' must be a positive int object"
+
+	# Rank the swaps within their grid cells and keep only those needed (every swap if max_points_per_bucket is None)
+	ranked_query = ("SELECT bucket_index, delta_mean_squared_error, x, y, ROW_NUMBER() OVER (cells ORDER BY delta_mean_squared_error) - 1 AS rank_in_cell, COUNT(*) OVER cells AS cell_size, "
+					"COUNT(*) OVER (PARTITION BY bucket_index) AS bucket_size FROM (" + getBucketedSwapsQuery(table_name = table_name, n_buckets = n_buckets, n_bins_per_axis = n_bins_per_axis) + ") "
+					"WINDOW cells AS (PARTITION BY bucket_index, x_cell, y_cell)")
+	if max_points_per_bucket is None:
+		keep_clause = "1"
+	else:
+		keep_clause = ("bucket_size <= " + str(max_points_per_bucket) + " OR rank_in_cell = 0 OR ((rank_in_cell + 1) * quota) / cell_size > (rank_in_cell * quota) / cell_size")
+	rows = connection.execute("SELECT bucket_index, bucket_size, delta_mean_squared_error, x, y FROM (SELECT *, MIN(MAX(CAST(ROUND(cell_size * " + str(max_points_per_bucket or 1) + ".0 / bucket_size) AS INTEGER), 1), cell_size) AS quota "
+							  "FROM (" + ranked_query + ")) WHERE " + keep_clause).fetchall()
+
+	# Group the kept swaps by bucket
+	values_per_bucket = {bucket_index: {"n_swaps": 0, "delta_mean_squared_error": [], "normalized_error_1": [], "normalized_error_2": []} for bucket_index in range(n_buckets)}
+	for bucket_index, bucket_size, delta_mean_squared_error, normalized_error_1, normalized_error_2 in rows:
+		values_per_bucket[bucket_index]["n_swaps"] = bucket_size
+		values_per_bucket[bucket_index]["delta_mean_squared_error"].append(delta_mean_squared_error)
+		values_per_bucket[bucket_index]["normalized_error_1"].append(normalized_error_1)
+		values_per_bucket[bucket_index]["normalized_error_2"].append(normalized_error_2)
+	return values_per_bucket
+
+def computeQuantileBucketDensity(connection:Connection, table_name:str, n_buckets:int = 4, n_bins_per_axis:int = 100) -> dict:
+	# Return a density grid of the normalized errors of both swapped tile types for each equal-count bucket of the change in MSE, aggregated in SQLite
+	# Note: each grid has the format of catan_scatter_plots.binDensity, i.e. the bin centers along with the count and the mean change in MSE of each bin (stored as [y bin, x bin])
+	# Verify the inputs
+	assert type(n_buckets) == int and n_buckets > 0, "computeQuantileBucketDensity: Provided value for 'n_buckets' must be a positive int object"
+	assert type(n_bins_per_axis) == int and n_bins_per_axis > 0, "computeQuantileBucketDensity: Provided value for 'n_bins_per_axis' must be a positive int object"
+
+	# Count the swaps and average the change in MSE of every occupied cell
+	rows = connection.execute("SELECT bucket_index, x_cell, y_cell, COUNT(*), AVG(delta_mean_squared_error), MIN(min_x), MIN(max_x), MIN(min_y), MIN(max_y) "
+							  "FROM (" + getBucketedSwapsQuery(table_name = table_name, n_buckets = n_buckets, n_bins_per_axis = n_bins_per_axis) + ") GROUP BY bucket_index, x_cell, y_cell").fetchall()
+
+	# Fill in the grid of each bucket
+	binned_data_per_bucket = {bucket_index: {"x_centers": zeros(n_bins_per_axis), "y_centers": zeros(n_bins_per_axis), "counts": zeros((n_bins_per_axis, n_bins_per_axis), dtype = int),
+											 "mean_colors": full((n_bins_per_axis, n_bins_per_axis), nan)} for bucket_index in range(n_buckets)}
+	for bucket_index, x_cell, y_cell, n_swaps, mean_delta, min_x, max_x, min_y, max_y in rows:
+		binned_data = binned_data_per_bucket[bucket_index]
+		binned_data["x_centers"] = min_x + (arange(n_bins_per_axis) + 0.5) * max(max_x - min_x, 1e-300) / n_bins_per_axis
+		binned_data["y_centers"] = min_y + (arange(n_bins_per_axis) + 0.5) * max(max_y - min_y, 1e-300) / n_bins_per_axis
+		binned_data["counts"][y_cell, x_cell] = n_swaps
+		binned_data["mean_colors"][y_cell, x_cell] = mean_delta
+	return binned_data_per_bucket
+
+def computeDistanceCorrelation(connection:Connection, table_name:str) -> float:
+	# Return the correlation coefficient between the diagonal distance of the normalized errors of the swapped tile types and the DECREASE in MSE
+	distance_expression = "ABS(" + getNormalizedErrorExpression(tile_type_column = "tile_type_1") + " - " + getNormalizedErrorExpression(tile_type_column = "tile_type_2") + ") / " + repr(sqrt(2))
+	sum_xx, sum_yy, sum_xy = connection.execute("WITH pairs AS (SELECT " + distance_expression + " AS x, -delta_mean_squared_error AS y FROM " + table_name + "), "
+												"means AS (SELECT AVG(x) AS mean_x, AVG(y) AS mean_y FROM pairs) "
+												"SELECT SUM((x - mean_x) * (x - mean_x)), SUM((y - mean_y) * (y - mean_y)), SUM((x - mean_x) * (y - mean_y)) FROM pairs, means").fetchone()
+	return sum_xy / sqrt(sum_xx * sum_yy)
+
+def computeMaxAbsoluteDelta(connection:Connection, table_name:str) -> float:
+	# Return the largest magnitude change in MSE stored in the table
+	return connection.execute("SELECT MAX(ABS(delta_mean_squared_error)) FROM " + table_name).fetchone()[0]
@@ -0,0 +1,446 @@
+##########################################
+### Import needed general dependencies ###
+##########################################
+# Add paths for internal modules
+# Import dependencies
+from pathlib import Path
+from sys import path
+# Get the shared active projects folder
+active_projects_folder = Path(__file__).parent.parent
+# Get the shared parent folder
+parent_folder = active_projects_folder.parent
+# Get the shared infrastructure folder
+infrastructure_folder = parent_folder.joinpath("infrastructure")
+# Add the needed paths
+path.insert(0, str(infrastructure_folder.joinpath("board_games")))
+path.insert(0, str(infrastructure_folder.joinpath("common_needs")))
+
+# Built-in modules
+from itertools import combinations
+from math import comb, log2
+from multiprocessing import Lock, Pool, RawValue
+from os import cpu_count
+from time import time
+
+# Internal modules
+from catan_board_core import ALL_GAME_MODES, ALL_TILE_TYPES, ROW_COUNTS_PER_MODE, TARGET_EFFICIENCY_PER_TUPLE, TILE_COUNTS_PER_MODE, canonicalizeTiling, computeHexLayout, computeSymmetryPermutations
+from catan_board_library import CatanBoardLibrary, createBoardFromTiling
+from catan_generator_engine import CatanGeneratorEngine
+
+# External modules
+from numpy import arange, array, concatenate, flatnonzero, float64, int64, log2 as log2_array, ndarray, zeros
+
+
+##########################################
+### Define shared settings for solving ###
+##########################################
+# Define the default largest number of assignments of the last types which are scored at once with numpy rather than searched one placement at a time
+DEFAULT_MAX_TAIL_ASSIGNMENTS = 10**5
+
+
+#######################################################
+### Define the bound on the entropy of partial rows ###
+#######################################################
+def computeEntropyRange(known_counts:list, n_unknown:int, n_available_types:int) -> tuple:
+	# Return the smallest and largest entropy a neighbor distribution can reach when n_unknown more neighbors go to types which currently have no count
+	# Note: x * log2(total / x) is concave and zero at zero, so the minimum puts all unknown neighbors on one type and the maximum spreads them evenly
+	# Compute the total number of neighbors and the entropy contributed by the known counts
+	n_total = sum(known_counts) + n_unknown
+	known_entropy = 0
+	for count in known_counts:
+		if count > 0 and count < n_total:
+			known_entropy += count / n_total * log2(n_total / count)
+
+	# Return early if nothing is unknown
+	if n_unknown == 0:
+		return known_entropy, known_entropy
+
+	# Compute the smallest entropy by putting all unknown neighbors on a single type
+	min_entropy = known_entropy
+	if n_unknown < n_total:
+		min_entropy += n_unknown / n_total * log2(n_total / n_unknown)
+
+	# Compute the largest entropy by spreading the unknown neighbors as evenly as possible
+	max_entropy = known_entropy
+	quotient, remainder = divmod(n_unknown, n_available_types)
+	for count, n_types in [(quotient + 1, remainder), (quotient, n_available_types - remainder)]:
+		if count > 0 and count < n_total:
+			max_entropy += n_types * count / n_total * log2(n_total / count)
+
+	# Return the results
+	return min_entropy, max_entropy
+
+
+###################################################################
+### Define the enumeration of the assignments of the last types ###
+###################################################################
+def enumerateAssignments(count_per_code:list) -> ndarray:
+	# Return every assignment of codes 0, 1, ... to the slots 0, ..., sum(count_per_code) - 1 with the provided count of each code, one assignment per row
+	n_slots = sum(count_per_code)
+	if len(count_per_code) <= 1:
+		return zeros((1, n_slots), dtype = int64)
+
+	# Place the first code in every possible way and fill the other slots with every assignment of the remaining codes
+	other_assignments = enumerateAssignments(count_per_code = count_per_code[1:])
+	all_blocks = []
+	for slot_indices in combinations(range(n_slots), count_per_code[0]):
+		other_slot_indices = [slot_index for slot_index in range(n_slots) if slot_index not in slot_indices]
+		block = zeros((other_assignments.shape[0], n_slots), dtype = int64)
+		block[:, other_slot_indices] = other_assignments + 1
+		all_blocks.append(block)
+	return concatenate(all_blocks)
+
+def countAssignments(count_per_code:list) -> int:
+	# Return the number of rows of enumerateAssignments, i.e. the multinomial coefficient of the counts
+	n_assignments = 1
+	n_slots = 0
+	for count in count_per_code:
+		n_slots += count
+		n_assignments *= comb(n_slots, count)
+	return n_assignments
+
+
+################################################
+### Define the depth-first search over types ###
+################################################
+# Define the class which places all tiles of one type per level, pruning with a lower bound on the MSE and skipping symmetric placements
+# Note: once only the last few types remain (the most whose assignments number at most max_tail_assignments), every assignment of them to the free
+#       polygons is scored at once with numpy instead of being searched, since the bound rarely prunes there and placing types one at a time in Python
+#       is far slower; symmetric copies within these assignments aren't skipped, so duplicates are removed when canonicalizing the results
+class CatanExactSearch:
+	### Initialize the class ###
+	def __init__(self, game_mode:str, tolerance:float, max_tail_assignments:int = DEFAULT_MAX_TAIL_ASSIGNMENTS):
+		# Store the layout information
+		self.game_mode = game_mode
+		self.tolerance = tolerance
+		self.n_polygons = sum(ROW_COUNTS_PER_MODE[game_mode])
+		hex_layout = computeHexLayout(row_counts = ROW_COUNTS_PER_MODE[game_mode])
+		self.neighbor_indices_per_polygon = [hex_layout["neighbor_indices_per_polygon"][polygon_index] for polygon_index in range(self.n_polygons)]
+		self.symmetry_permutations = computeSymmetryPermutations(row_counts = ROW_COUNTS_PER_MODE[game_mode])
+
+		# Order the needed tile types by count so that the levels with the fewest placements (and the earliest exact rows) come first
+		self.type_order = sorted([tile_type for tile_type in ALL_TILE_TYPES if TILE_COUNTS_PER_MODE[game_mode][tile_type] > 0], key = lambda tile_type: (TILE_COUNTS_PER_MODE[game_mode][tile_type], ALL_TILE_TYPES.index(tile_type)))
+		self.n_types = len(self.type_order)
+		self.count_per_code = [TILE_COUNTS_PER_MODE[game_mode][tile_type] for tile_type in self.type_order]
+		self.target_per_code = [TARGET_EFFICIENCY_PER_TUPLE[(game_mode, tile_type)] for tile_type in self.type_order]
+		self.maximum_entropy = log2(self.n_types)
+
+		# Choose the first level of the types scored at once (always including the last type, whose placement is forced) and enumerate their assignments
+		self.tail_level = self.n_types - 1
+		while self.tail_level > 0 and countAssignments(count_per_code = self.count_per_code[self.tail_level - 1:]) <= max_tail_assignments:
+			self.tail_level -= 1
+		self.n_tail_types = self.n_types - self.tail_level
+		self.tail_assignments = enumerateAssignments(count_per_code = self.count_per_code[self.tail_level:])
+		self.n_tail_assignments = self.tail_assignments.shape[0]
+		self.tail_one_hot = zeros((self.n_tail_assignments, self.n_tail_types, self.tail_assignments.shape[1]), dtype = float64)
+		for tail_code in range(self.n_tail_types):
+			self.tail_one_hot[:, tail_code, :] = self.tail_assignments == tail_code
+
+		# Store the entropy terms count * log2(count) and the targets needed to score complete tilings with numpy
+		entropy_counts = arange(6 * self.n_polygons + 1, dtype = float64)
+		entropy_counts[0] = 1
+		self.entropy_terms = entropy_counts * log2_array(entropy_counts)
+		self.target_array = array(self.target_per_code, dtype = float64)
+
+		# Initialize the partial tiling state (a code of -1 means unassigned)
+		self.code_per_polygon = [-1] * self.n_polygons
+		self.neighbor_counts = [[0] * self.n_types for _ in range(self.n_types)]
+		self.n_unknown_per_code = [0] * self.n_types
+
+		# Initialize the search statistics and results
+		self.n_nodes = 0
+		self.best_mean_squared_error = float("inf")
+		self.best_codes = []
+
+	### Define functions for placing and removing a whole type ###
+	def placeType(self, code:int, polygon_indices:tuple):
+		# Assign a code to the provided polygons and update the neighbor counts and unknown neighbor slots
+		for polygon_index in polygon_indices:
+			self.code_per_polygon[polygon_index] = code
+		for polygon_index in polygon_indices:
+			for neighbor_polygon_index in self.neighbor_indices_per_polygon[polygon_index]:
+				neighbor_code = self.code_per_polygon[neighbor_polygon_index]
+				if neighbor_code == -1:
+					self.n_unknown_per_code[code] += 1
+				elif neighbor_code == code:
+					self.neighbor_counts[code][code] += 1
+				else:
+					self.neighbor_counts[code][neighbor_code] += 1
+					self.neighbor_counts[neighbor_code][code] += 1
+					self.n_unknown_per_code[neighbor_code] -= 1
+
+	def removeType(self, code:int, polygon_indices:tuple):
+		# Undo placeType
+		for polygon_index in polygon_indices:
+			for neighbor_polygon_index in self.neighbor_indices_per_polygon[polygon_index]:
+				neighbor_code = self.code_per_polygon[neighbor_polygon_index]
+				if neighbor_code == -1:
+					self.n_unknown_per_code[code] -= 1
+				elif neighbor_code == code:
+					self.neighbor_counts[code][code] -= 1
+				else:
+					self.neighbor_counts[code][neighbor_code] -= 1
+					self.neighbor_counts[neighbor_code][code] -= 1
+					self.n_unknown_per_code[neighbor_code] += 1
+		for polygon_index in polygon_indices:
+			self.code_per_polygon[polygon_index] = -1
+
+	### Define the bound and the search ###
+	def computeLowerBound(self, n_placed_types:int) -> float:
+		# Compute a lower bound on the MSE of any completion of the current partial tiling (exact once all types are placed)
+		# Note: rows of types not yet placed are only bounded below by zero error
+		n_available_types = self.n_types - n_placed_types
+		lower_bound = 0
+		for code in range(n_placed_types):
+			min_entropy, max_entropy = computeEntropyRange(known_counts = self.neighbor_counts[code][:n_placed_types], n_unknown = self.n_unknown_per_code[code], n_available_types = max(1, n_available_types))
+			target = self.target_per_code[code]
+			min_efficiency = min_entropy / self.maximum_entropy
+			max_efficiency = max_entropy / self.maximum_entropy
+			if target < min_efficiency:
+				lower_bound += (min_efficiency - target)**2 / self.n_types
+			elif target > max_efficiency:
+				lower_bound += (target - max_efficiency)**2 / self.n_types
+		return lower_bound
+
+	def getCanonicalPlacements(self, level:int, stabilizer:list) -> list:
+		# Return the placements of the type at this level which are lexicographically smallest under the stabilizer, along with their own stabilizers
+		free_polygon_indices = [polygon_index for polygon_index in range(self.n_polygons) if self.code_per_polygon[polygon_index] == -1]
+		placements = []
+		for polygon_indices in combinations(free_polygon_indices, self.count_per_code[level]):
+			# Skip the placement if a symmetry of the previous levels maps it to a smaller one
+			new_stabilizer = []
+			canonical_flag = True
+			for permutation in stabilizer:
+				mapped_indices = tuple(sorted([permutation[polygon_index] for polygon_index in polygon_indices]))
+				if mapped_indices < polygon_indices:
+					canonical_flag = False
+					break
+				if mapped_indices == polygon_indices:
+					new_stabilizer.append(permutation)
+			if canonical_flag == True:
+				placements.append((polygon_indices, new_stabilizer))
+		return placements
+
+	def search(self, level:int, stabilizer:list, shared_bound:RawValue = None):
+		# Recursively place the remaining types, recording every complete tiling within tolerance of the best MSE
+		# Score every assignment of the last types at once (if needed)
+		if level == self.tail_level:
+			self.scoreTail(shared_bound = shared_bound)
+			return
+
+		# Place the type of this level in every canonical way
+		for polygon_indices, new_stabilizer in self.getCanonicalPlacements(level = level, stabilizer = stabilizer):
+			# Place the type and bound the result
+			self.n_nodes += 1
+			self.placeType(code = level, polygon_indices = polygon_indices)
+			lower_bound = self.computeLowerBound(n_placed_types = level + 1)
+
+			# Get the best known MSE (shared across processes, if needed)
+			best_mean_squared_error = self.best_mean_squared_error
+			if shared_bound is not None:
+				best_mean_squared_error = min(best_mean_squared_error, shared_bound.value)
+
+			# Continue the search (if needed)
+			if lower_bound <= best_mean_squared_error + self.tolerance:
+				self.search(level = level + 1, stabilizer = new_stabilizer, shared_bound = shared_bound)
+
+			# Remove the type again
+			self.removeType(code = level, polygon_indices = polygon_indices)
+
+	def scoreTail(self, shared_bound:RawValue):
+		# Score every assignment of the types from the tail level on to the free polygons at once, recording those within tolerance of the best MSE
+		# Note: only the neighbor counts involving the free polygons depend on the assignment, the counts between placed types are already known
+		# Count the neighbors of each free polygon among the placed types and among the other free polygons
+		free_polygon_indices = [polygon_index for polygon_index in range(self.n_polygons) if self.code_per_polygon[polygon_index] == -1]
+		free_position_per_polygon = {polygon_index: position for position, polygon_index in enumerate(free_polygon_indices)}
+		placed_counts = zeros((len(free_polygon_indices), self.tail_level), dtype = float64)
+		free_adjacency = zeros((len(free_polygon_indices), len(free_polygon_indices)), dtype = float64)
+		for position, polygon_index in enumerate(free_polygon_indices):
+			for neighbor_polygon_index in self.neighbor_indices_per_polygon[polygon_index]:
+				neighbor_code = self.code_per_polygon[neighbor_polygon_index]
+				if neighbor_code == -1:
+					free_adjacency[position, free_position_per_polygon[neighbor_polygon_index]] = 1
+				else:
+					placed_counts[position, neighbor_code] += 1
+
+		# Get the best known MSE (shared across processes, if needed)
+		best_mean_squared_error = self.best_mean_squared_error
+		if shared_bound is not None:
+			best_mean_squared_error = min(best_mean_squared_error, shared_bound.value)
+		self.n_nodes += self.n_tail_assignments
+
+		# Compute the error of the placed types for every tiling, which only depends on their counts of each tail type (their neighbor totals are already known)
+		# Note: this error alone bounds the MSE from below, so only the tilings it doesn't rule out are scored completely
+		tail_placed_counts = (self.tail_one_hot.reshape(-1, len(free_polygon_indices)) @ placed_counts).reshape(self.n_tail_assignments, self.n_tail_types, self.tail_level).astype(int64)
+		placed_errors = zeros(self.n_tail_assignments, dtype = float64)
+		for code in range(self.tail_level):
+			n_neighbors = sum(self.neighbor_counts[code][:self.tail_level]) + self.n_unknown_per_code[code]
+			placed_terms = sum([self.entropy_terms[count] for count in self.neighbor_counts[code][:self.tail_level]])
+			entropies = log2(n_neighbors) - (placed_terms + self.entropy_terms[tail_placed_counts[:, :, code]].sum(axis = 1)) / n_neighbors
+			placed_errors += (entropies / self.maximum_entropy - self.target_per_code[code])**2 / self.n_types
+		candidate_indices = flatnonzero(placed_errors <= best_mean_squared_error + self.tolerance)
+
+		# Complete the MSEs of the remaining tilings with the errors of the tail types (counting their neighbors among the placed types and the other free polygons)
+		candidate_one_hot = self.tail_one_hot[candidate_indices]
+		tail_counts = concatenate([tail_placed_counts[candidate_indices], ((candidate_one_hot @ free_adjacency) @ candidate_one_hot.transpose(0, 2, 1)).astype(int64)], axis = 2)
+		n_neighbors = tail_counts.sum(axis = 2)
+		entropies = log2_array(n_neighbors) - self.entropy_terms[tail_counts].sum(axis = 2) / n_neighbors
+		mean_squared_errors = placed_errors[candidate_indices] + ((entropies / self.maximum_entropy - self.target_array[self.tail_level:])**2).sum(axis = 1) / self.n_types
+
+		# Record the tilings within tolerance of the best MSE, best first
+		kept_indices = flatnonzero(mean_squared_errors <= best_mean_squared_error + self.tolerance)
+		for kept_index in kept_indices[mean_squared_errors[kept_indices].argsort()]:
+			code_per_polygon = list(self.code_per_polygon)
+			for position, polygon_index in enumerate(free_polygon_indices):
+				code_per_polygon[polygon_index] = self.tail_level + int(self.tail_assignments[candidate_indices[kept_index], position])
+			self.recordTiling(mean_squared_error = float(mean_squared_errors[kept_index]), shared_bound = shared_bound, code_per_polygon = code_per_polygon)
+
+	def recordTiling(self, mean_squared_error:float, shared_bound:RawValue, code_per_polygon:list):
+		# Store a complete tiling, dropping stored tilings that are no longer within tolerance of the best
+		if mean_squared_error > self.best_mean_squared_error + self.tolerance:
+			return
+		if mean_squared_error < self.best_mean_squared_error:
+			self.best_mean_squared_error = mean_squared_error
+			self.best_codes = [codes for codes in self.best_codes if codes[0] <= mean_squared_error + self.tolerance]
+			if shared_bound is not None:
+				with SHARED_STATE["lock"]:
+					if mean_squared_error < shared_bound.value:
+						shared_bound.value = mean_squared_error
+		self.best_codes.append((mean_squared_error, code_per_polygon))
+
+
+########################################################
+### Define the functions run by the worker processes ###
+########################################################
+# Define the state shared by every task run in a worker process
+SHARED_STATE = {}
+
+def initializeWorker(game_mode:str, tolerance:float, max_tail_assignments:int, shared_bound:RawValue, lock:Lock):
+	# Store the shared state of a worker process
+	SHARED_STATE["game_mode"] = game_mode
+	SHARED_STATE["tolerance"] = tolerance
+	SHARED_STATE["max_tail_assignments"] = max_tail_assignments
+	SHARED_STATE["shared_bound"] = shared_bound
+	SHARED_STATE["lock"] = lock
+
+def searchTask(task:tuple) -> dict:
+	# Search the subtree below a fixed placement of the first types, return the best tilings found and the number of nodes visited
+	# Replay the fixed placements
+	placed_indices_per_level, stabilizer = task
+	exact_search = CatanExactSearch(game_mode = SHARED_STATE["game_mode"], tolerance = SHARED_STATE["tolerance"], max_tail_assignments = SHARED_STATE["max_tail_assignments"])
+	for level, polygon_indices in enumerate(placed_indices_per_level):
+		exact_search.placeType(code = level, polygon_indices = polygon_indices)
+
+	# Search the remaining levels
+	exact_search.search(level = len(placed_indices_per_level), stabilizer = stabilizer, shared_bound = SHARED_STATE["shared_bound"])
+
+	# Return the results
+	return {"n_nodes": exact_search.n_nodes, "best_codes": exact_search.best_codes}
+
+
+########################################
+### Define the exact solver function ###
+########################################
+def solveExactly(game_mode:str, n_workers:int = None, n_split_levels:int = 2, initial_upper_bound:float = None, n_heuristic_runs:int = 20,
+				 n_heuristic_steps:int = 3000, tolerance:float = 10**-12, max_tail_assignments:int = DEFAULT_MAX_TAIL_ASSIGNMENTS, verbose_flag:bool = True,
+				 board_library:CatanBoardLibrary = None) -> dict:
+	# Find every tiling (up to symmetry) with the provably minimal MSE for a game mode, return the results as a dictionary
+	# Note: if a board library is provided, every optimal tiling is stored in it in a single transaction
+	# Verify the inputs
+	assert game_mode in ALL_GAME_MODES, "solveExactly: Provided value for 'game_mode' must be contained in the list ALL_GAME_MODES"
+	assert type(n_split_levels) == int and n_split_levels >= 1, "solveExactly: Provided value for 'n_split_levels' must be a positive int object"
+	if n_workers is None:
+		n_workers = cpu_count()
+	start_time = time()
+
+	# Get an initial upper bound from the stochastic optimizer so that pruning is effective from the start (if needed)
+	if initial_upper_bound is None:
+		initial_upper_bound = float("inf")
+		for seed in range(n_heuristic_runs):
+			engine = CatanGeneratorEngine(game_mode = game_mode, skew_power = 2, reject_flag = True, seed = seed)
+			engine.runSwaps(n_steps = n_heuristic_steps)
+			initial_upper_bound = min(initial_upper_bound, engine.getMeanSquaredError())
+		# Allow for rounding differences between the engine and the exact search
+		initial_upper_bound += 10**-9
+	if verbose_flag == True:
+		print("solveExactly: initial upper bound = " + str(initial_upper_bound))
+
+	# Expand the first levels in this process to create the tasks (pruned with the initial upper bound)
+	splitting_search = CatanExactSearch(game_mode = game_mode, tolerance = tolerance, max_tail_assignments = max_tail_assignments)
+	splitting_search.best_mean_squared_error = initial_upper_bound
+	n_split_levels = min(n_split_levels, splitting_search.tail_level)
+	tasks = []
+	def expandLevel(level:int, stabilizer:list, placed_indices_per_level:list):
+		# Collect the tasks below a partial placement
+		for polygon_indices, new_stabilizer in splitting_search.getCanonicalPlacements(level = level, stabilizer = stabilizer):
+			splitting_search.placeType(code = level, polygon_indices = polygon_indices)
+			if splitting_search.computeLowerBound(n_placed_types = level + 1) <= initial_upper_bound + tolerance:
+				if level + 1 < n_split_levels:
+					expandLevel(level = level + 1, stabilizer = new_stabilizer, placed_indices_per_level = placed_indices_per_level + [polygon_indices])
+				else:
+					tasks.append((placed_indices_per_level + [polygon_indices], new_stabilizer))
+			splitting_search.removeType(code = level, polygon_indices = polygon_indices)
+	if n_split_levels == 0:
+		tasks.append(([], splitting_search.symmetry_permutations))
+	else:
+		expandLevel(level = 0, stabilizer = splitting_search.symmetry_permutations, placed_indices_per_level = [])
+	if verbose_flag == True:
+		print("solveExactly: searching " + str(len(tasks)) + " subtrees on " + str(n_workers) + " processes")
+
+	# Search the subtrees in parallel, sharing the best MSE found so far between processes
+	shared_bound = RawValue("d", initial_upper_bound)
+	with Pool(processes = n_workers, initializer = initializeWorker, initargs = (game_mode, tolerance, max_tail_assignments, shared_bound, Lock())) as pool:
+		all_task_results = pool.map(searchTask, tasks, chunksize = 1)
+
+	# Combine the results of all tasks
+	n_nodes = sum([task_results["n_nodes"] for task_results in all_task_results])
+	all_best_codes = [codes for task_results in all_task_results for codes in task_results["best_codes"]]
+	if len(all_best_codes) == 0:
+		best_mean_squared_error = None
+		best_tilings = []
+	else:
+		best_mean_squared_error = min([codes[0] for codes in all_best_codes])
+		best_tilings = []
+		for mean_squared_error, code_per_polygon in all_best_codes:
+			if mean_squared_error <= best_mean_squared_error + tolerance:
+				tile_per_polygon = canonicalizeTiling(game_mode = game_mode, tile_per_polygon = [splitting_search.type_order[code] for code in code_per_polygon])
+				if tile_per_polygon not in best_tilings:
+					best_tilings.append(tile_per_polygon)
+
+	# Store the optimal tilings (if needed)
+	if board_library is not None and len(best_tilings) > 0:
+		board_library.upsertBoards(boards = [createBoardFromTiling(game_mode = game_mode, tile_per_polygon = tile_per_polygon) for tile_per_polygon in best_tilings])
+
+	# Return the results
+	# Note: if no tiling was found, none beats the initial upper bound
+	results = {}
+	results["game_mode"] = game_mode
+	results["mean_squared_error"] = best_mean_squared_error
+	results["tilings"] = best_tilings
+	results["initial_upper_bound"] = initial_upper_bound
+	results["n_nodes"] = n_nodes
+	results["n_tasks"] = len(tasks)
+	results["seconds"] = time() - start_time
+	return results
+
+
+#########################################################################
+### Create the code inside __main__ so that multiprocessing will work ###
+#########################################################################
+if __name__ == "__main__":
+	# Game mode to solve exactly
+	# Note: "Original: 5 Wide" solves in about 9 minutes on a single core (359 subtrees, about 2.6e9 nodes counting the scored tail assignments), proving a minimal
+	#       MSE of about 1.1578e-4 (6 tilings up to symmetry) against the upper bound of about 1.2696e-4 from the stochastic optimizer
+	game_mode = "Original: 5 Wide"
+
+	# Board library to store the optimal tilings in (None for no library)
+	library_path = Path(__file__).parent.joinpath("catan_board_library.db")
+
+	# Solve, store and display the results
+	board_library = None if library_path is None else CatanBoardLibrary(db_path = library_path)
+	results = solveExactly(game_mode = game_mode, board_library = board_library)
+	if board_library is not None:
+		board_library.close()
+	print("Minimal MSE for '" + game_mode + "' ---> " + str(results["mean_squared_error"]) + " (" + str(len(results["tilings"])) + " tiling(s), " + str(results["n_nodes"]) + " nodes, " + str(round(results["seconds"], 1)) + " seconds)")
+	for tile_per_polygon in results["tilings"]:
+		print(tile_per_polygon)
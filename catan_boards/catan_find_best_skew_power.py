@@ -16,12 +16,15 @@ path.insert(0, str(infrastructure_folder.joinpath("board_games")))
 path.insert(0, str(infrastructure_folder.joinpath("common_needs")))
 
 # Internal modules
-from catan_board_generator import CatanGeneratorTiling
-from tkinter_helper import askSaveFilename
+from catan_board_library import CatanBoardLibrary, createBoardFromEngine
+from catan_generator_engine import CatanGeneratorEngine
+from catan_sweep_checkpoint import SweepCheckpoint
+from catan_sweep_statistics import PairedComparison, StepStatistics
+from catan_telemetry import CatanTelemetry
 
 # External modules
 import matplotlib.pyplot as plt
-from numpy import zeros
+from numpy import mean, random
 from tqdm import tqdm
 
 
@@ -40,46 +43,152 @@ reject_flag = True
 normalize_type = "static"
 
 # Number of simulations to run and number of swaps to run per simulation
-n_simulations_per_power = 100
+# Note: every skew power reuses the same initial tilings and polygon-choice uniforms (common random numbers), so far fewer simulations are needed
+n_simulations_per_power = 20
 n_steps_per_simulation = 5000
 
+# Settings for the paired comparison against a reference skew power
+reference_skew_power = 2
+report_step_indices = [99, 1999, 4999]
+confidence = 0.95
 
-######################################################################
-### Run the needed simulations and save the results to the db file ###
-######################################################################
-# Initialize the dictionary of expected MSE over time
-expected_mse_over_time_by_power = {}
+# Quantiles of the MSE to shade around the expected MSE in the plots
+lower_quantile = 0.1
+upper_quantile = 0.9
 
-# Run the simulations for each skew power
-for skew_power in all_skew_powers:
-	# Initialize the array for this skew power
-	expected_mse_over_time_by_power[skew_power] = zeros(n_steps_per_simulation, dtype = float)
+# Checkpoint settings (rerunning with identical settings resumes from the checkpoint file with bit-identical results)
+checkpoint_path = Path(__file__).parent.joinpath("catan_find_best_skew_power_checkpoint.pkl")
+checkpoint_interval_seconds = 60
+n_steps_per_snapshot = 500
 
-	# Set the first seed to use
-	if initial_seed is None:
-		seed = None
-	else:
-		seed = initial_seed
+# Telemetry settings (steps/sec, acceptance rate, current and best MSE and memory of each simulation are appended to this JSON-lines file, set to None to disable)
+# Note: the file can be followed while the sweep runs, or read with readTelemetry and summarizeTelemetry from catan_telemetry.py
+telemetry_path = Path(__file__).parent.joinpath("catan_find_best_skew_power_telemetry.jsonl")
+telemetry_interval_seconds = 5
+n_steps_per_telemetry_update = 100
 
-	# Run the simulations for this skew power
-	for sim_index in tqdm(range(n_simulations_per_power)):
-		# Create the tiling to use for this simulation
-		current_tiling = CatanGeneratorTiling(game_mode = game_mode, seed = seed)
+# Board library settings (the final tiling of every simulation is stored in it once the sweep is done, set to None to disable)
+library_path = Path(__file__).parent.joinpath("catan_board_library.db")
 
-		# Randomly swap tiles for the needed number of simulation steps
-		for step_index in range(n_steps_per_simulation):
-			# Execute a random swap and get the needed results
-			swap_results = current_tiling.swapTiles(skew_power = skew_power, reject_flag = reject_flag, normalize_type = normalize_type)
 
-			# Extract the pre-swap MSE from the swap results
-			pre_mean_squared_error = swap_results["pre_mean_squared_error"]
+######################################################################
+### Run the needed simulations and save the results to the db file ###
+######################################################################
+# Open the checkpoint file, which is only resumed when every setting which affects the results is unchanged
+checkpoint = SweepCheckpoint(checkpoint_path = checkpoint_path,
+							 settings = {"initial_seed": initial_seed, "game_mode": game_mode, "all_skew_powers": all_skew_powers, "reject_flag": reject_flag, "normalize_type": normalize_type,
+										 "n_simulations_per_power": n_simulations_per_power, "n_steps_per_simulation": n_steps_per_simulation, "reference_skew_power": reference_skew_power},
+							 save_interval_seconds = checkpoint_interval_seconds)
+
+# Initialize the accumulators of the sweep (unless they were loaded from the checkpoint file)
+state = checkpoint.state
+if checkpoint.resumed_flag == False:
+	# Draw a random initial seed (if needed), since common random numbers require every skew power to share each seed
+	state["initial_seed"] = initial_seed if initial_seed is not None else int(random.randint(2**31))
+
+	# Initialize the streaming statistics (mean, variance and quantiles) of the MSE over time
+	# Note: these are mergeable, so statistics from independent processes or resumed runs can be combined with merge
+	state["mse_statistics_by_power"] = {}
+	for skew_power in all_skew_powers:
+		state["mse_statistics_by_power"][skew_power] = StepStatistics(n_values = n_steps_per_simulation)
+
+	# Initialize the paired comparisons of the MSE at each step and of the MSE averaged over all steps
+	state["step_comparison"] = PairedComparison(all_settings = all_skew_powers, reference_setting = reference_skew_power, n_values = n_steps_per_simulation)
+	state["average_comparison"] = PairedComparison(all_settings = all_skew_powers, reference_setting = reference_skew_power, n_values = 1)
+
+	# Initialize the MSE traces of the simulation in progress
+	state["mse_over_time_by_power"] = {}
+
+# Initialize the final boards of the simulations, which are stored in the board library in bulk at the end (also for checkpoints saved before they were kept)
+state.setdefault("final_boards", [])
+
+# Open the telemetry file (if needed)
+telemetry = None if telemetry_path is None else CatanTelemetry(telemetry_path = telemetry_path, interval_seconds = telemetry_interval_seconds, run_name = "find_best_skew_power")
+
+# Run the simulations, using the same seed for every skew power within a simulation
+for sim_index in tqdm(range(n_simulations_per_power)):
+	# Get the seed for this simulation
+	seed = (state["initial_seed"] + sim_index) % 2**32
+
+	# Run the simulation for each skew power which hasn't already been completed
+	for skew_power in all_skew_powers:
+		job = (skew_power, seed)
+		if checkpoint.isCompleted(job = job) == True:
+			continue
+
+		# Create the engine to use for this simulation, resuming from its snapshot (if needed)
+		current_engine = CatanGeneratorEngine(game_mode = game_mode, skew_power = skew_power, reject_flag = reject_flag, normalize_type = normalize_type, seed = seed, common_random_flag = True)
+		job_snapshot = checkpoint.getSnapshot(job = job)
+		if job_snapshot is None:
+			mse_over_time = []
+		else:
+			current_engine.restoreSnapshot(snapshot = job_snapshot["engine"])
+			mse_over_time = job_snapshot["mse_over_time"]
+
+		# Randomly swap tiles for the needed number of simulation steps, recording the pre-swap MSE of each step and snapshotting the progress along the way
+		# Note: the swaps are run in chunks between telemetry updates, each of which is only a clock read unless a record is due
+		replica_name = "power_" + str(skew_power) + "_seed_" + str(seed)
+		while len(mse_over_time) < n_steps_per_simulation:
+			n_snapshot_steps = min(n_steps_per_snapshot, n_steps_per_simulation - len(mse_over_time))
+			while n_snapshot_steps > 0:
+				n_chunk_steps = min(n_steps_per_telemetry_update, n_snapshot_steps)
+				mse_over_time += current_engine.runSwaps(n_steps = n_chunk_steps)
+				n_snapshot_steps -= n_chunk_steps
+				if telemetry is not None:
+					telemetry.updateFromEngine(replica_name = replica_name, engine = current_engine)
+			checkpoint.updateSnapshot(job = job, snapshot = {"engine": current_engine.getSnapshot(), "mse_over_time": mse_over_time})
+		state["mse_over_time_by_power"][skew_power] = mse_over_time
+		if telemetry is not None:
+			telemetry.finishReplica(replica_name = replica_name, engine = current_engine)
+		state["final_boards"].append(createBoardFromEngine(engine = current_engine))
+
+		# Fold the simulation into the accumulators once every skew power is done
+		if len(state["mse_over_time_by_power"]) == len(all_skew_powers):
+			mse_over_time_by_power = state["mse_over_time_by_power"]
+			for power in all_skew_powers:
+				state["mse_statistics_by_power"][power].update(mse_over_time_by_power[power])
+			state["step_comparison"].update(values_per_setting = mse_over_time_by_power)
+			state["average_comparison"].update(values_per_setting = {power: [mean(mse_over_time_by_power[power])] for power in all_skew_powers})
+			state["mse_over_time_by_power"] = {}
+
+		# Mark the job as completed
+		checkpoint.completeJob(job = job)
+
+# Store the final boards of every simulation in the board library in a single transaction (if needed)
+# Note: the stored boards are cleared before the final checkpoint save, so rerunning a finished sweep doesn't count them twice
+if library_path is not None:
+	board_library = CatanBoardLibrary(db_path = library_path)
+	board_library.upsertBoards(boards = state["final_boards"])
+	board_library.close()
+state["final_boards"] = []
+
+# Save the final state of the sweep and close the telemetry file (if needed)
+checkpoint.save()
+if telemetry is not None:
+	telemetry.close()
+mse_statistics_by_power = state["mse_statistics_by_power"]
+step_comparison = state["step_comparison"]
+average_comparison = state["average_comparison"]
+
+# Extract the expected MSE over time and the needed quantiles
+expected_mse_over_time_by_power = {}
+lower_mse_over_time_by_power = {}
+upper_mse_over_time_by_power = {}
+for skew_power in all_skew_powers:
+	expected_mse_over_time_by_power[skew_power] = mse_statistics_by_power[skew_power].getMean()
+	lower_mse_over_time_by_power[skew_power] = mse_statistics_by_power[skew_power].getQuantile(quantile = lower_quantile)
+	upper_mse_over_time_by_power[skew_power] = mse_statistics_by_power[skew_power].getQuantile(quantile = upper_quantile)
 
-			# Insert the current MSE contribution to the array
-			expected_mse_over_time_by_power[skew_power][step_index] += pre_mean_squared_error / n_simulations_per_power
 
-		# Iterate the random seed (if needed)
-		if seed is not None:
-			seed += 1
+##############################################################
+### Print the paired differences relative to the reference ###
+##############################################################
+# Print the differences at each report step as well as for the MSE averaged over all steps (negative means better than the reference)
+print("PAIRED DIFFERENCES IN MSE RELATIVE TO SKEW POWER " + str(reference_skew_power) + " (" + str(round(100 * confidence)) + "% CONFIDENCE INTERVALS):")
+for label, comparison, entry_index in [("step " + str(step_index), step_comparison, step_index) for step_index in report_step_indices] + [("average over steps", average_comparison, 0)]:
+	print("    " + label + ":")
+	for skew_power, summary in comparison.getSummary(entry_index = entry_index, confidence = confidence).items():
+		print("        skew power = " + str(skew_power) + " ---> " + str(summary["mean"]) + " in [" + str(summary["lower"]) + ", " + str(summary["upper"]) + "]")
 
 
 ##########################################################
@@ -90,7 +199,8 @@ for skew_power in all_skew_powers:
 plt.figure(figsize = (10, 8), layout = "constrained")
 # Add the needed traces
 for skew_power in all_skew_powers:
-	plt.plot(expected_mse_over_time_by_power[skew_power], label = "skew power = " + str(skew_power))
+	line = plt.plot(expected_mse_over_time_by_power[skew_power], label = "skew power = " + str(skew_power))[0]
+	plt.fill_between(range(len(expected_mse_over_time_by_power[skew_power])), lower_mse_over_time_by_power[skew_power], upper_mse_over_time_by_power[skew_power], color = line.get_color(), alpha = 0.15)
 # Format the figure
 plt.title("Expected MSE Over Time As A Function Of Skew Power (5000 Steps)")
 plt.xlabel("step index")
@@ -104,7 +214,8 @@ plt.legend()
 plt.figure(figsize = (10, 8), layout = "constrained")
 # Add the needed traces
 for skew_power in all_skew_powers:
-	plt.plot(expected_mse_over_time_by_power[skew_power][:2000], label = "skew power = " + str(skew_power))
+	line = plt.plot(expected_mse_over_time_by_power[skew_power][:2000], label = "skew power = " + str(skew_power))[0]
+	plt.fill_between(range(len(expected_mse_over_time_by_power[skew_power][:2000])), lower_mse_over_time_by_power[skew_power][:2000], upper_mse_over_time_by_power[skew_power][:2000], color = line.get_color(), alpha = 0.15)
 # Format the figure
 plt.title("Expected MSE Over Time As A Function Of Skew Power (2000 Steps)")
 plt.xlabel("step index")
@@ -118,7 +229,8 @@ plt.legend()
 plt.figure(figsize = (10, 8), layout = "constrained")
 # Add the needed traces
 for skew_power in all_skew_powers:
-	plt.plot(expected_mse_over_time_by_power[skew_power][:100], label = "skew power = " + str(skew_power))
+	line = plt.plot(expected_mse_over_time_by_power[skew_power][:100], label = "skew power = " + str(skew_power))[0]
+	plt.fill_between(range(len(expected_mse_over_time_by_power[skew_power][:100])), lower_mse_over_time_by_power[skew_power][:100], upper_mse_over_time_by_power[skew_power][:100], color = line.get_color(), alpha = 0.15)
 # Format the figure
 plt.title("Expected MSE Over Time As A Function Of Skew Power (100 Steps)")
 plt.xlabel("step index")
@@ -0,0 +1,448 @@
+##########################################
+### Import needed general dependencies ###
+##########################################
+# Add paths for internal modules
+# Import dependencies
+from pathlib import Path
+from sys import path
+# Get the shared active projects folder
+active_projects_folder = Path(__file__).parent.parent
+# Get the shared parent folder
+parent_folder = active_projects_folder.parent
+# Get the shared infrastructure folder
+infrastructure_folder = parent_folder.joinpath("infrastructure")
+# Add the needed paths
+path.insert(0, str(infrastructure_folder.joinpath("board_games")))
+path.insert(0, str(infrastructure_folder.joinpath("common_needs")))
+
+# Built-in modules
+from bisect import bisect_right
+from math import log2
+from typing import Any
+
+# Internal modules
+from catan_board_core import ALL_GAME_MODES, ALL_TILE_TYPES, ROW_COUNTS_PER_MODE, TARGET_EFFICIENCY_PER_TUPLE, TILE_COUNTS_PER_MODE, computeHexLayout, getRingNeighborIndices, restoreRandomState, snapshotRandomState
+from type_helper import isListWithStringEntries, isNumeric
+
+# External modules
+from numpy import random
+
+
+#################################################
+### Define the trusted board generator engine ###
+#################################################
+# Note: this class is deliberately NOT wrapped by privacyDecorator and performs no per-call verification
+#       All parameters are verified once at construction, after which the swap loop only uses plain attribute and list access
+#       For the same seed and settings, the trajectory is identical to that of CatanGeneratorTiling.swapTiles
+#       Use CatanGeneratorTiling for interactive use and rendering, use this class for batch simulation
+#       With common_random_flag = True, polygon choices come from a separate stream using exactly two uniforms per step
+#       so that runs with the same seed but different settings share their initial tiling and polygon-choice uniforms
+#       With a CatanConstraintSet, the initial tiling is repaired to satisfy every rule and only legal swaps are proposed and accepted
+#       With ring_weights = [w_1, ..., w_k], the efficiency of a tile type is the weighted mean of its normalized neighbor entropies over rings 1 to k
+#       The neighbor counts of every ring are updated incrementally on each swap, so the per-swap cost scales with the ring sizes rather than the board size
+class CatanGeneratorEngine:
+	### Initialize the class ###
+	def __init__(self, game_mode:str, skew_power:Any = 1, reject_flag:bool = False, normalize_type:str = "static", seed:int = None, tile_per_polygon:list = None, common_random_flag:bool = False, constraint_set:Any = None,
+				 ring_weights:list = None):
+		# Verify the inputs
+		assert game_mode in ALL_GAME_MODES, "CatanGeneratorEngine::__init__: Provided value for 'game_mode' must be contained in the list ALL_GAME_MODES"
+		assert isNumeric(skew_power, include_numpy_flag = True) == True, "CatanGeneratorEngine::__init__: Provided value for 'skew_power' must be numeric"
+		assert 0 <= skew_power, "CatanGeneratorEngine::__init__: Provided value for 'skew_power' must be non-negative"
+		assert type(reject_flag) == bool, "CatanGeneratorEngine::__init__: Provided value for 'reject_flag' must be a bool object"
+		assert normalize_type in ["static", "dynamic"], "CatanGeneratorEngine::__init__: Provided value for 'normalize_type' must be 'static' or 'dynamic'"
+		if seed is not None:
+			assert type(seed) == int, "CatanGeneratorEngine::__init__: If provided, value for 'seed' must be an int object"
+			assert 0 <= seed and seed < 2**32, "CatanGeneratorEngine::__init__: If provided, value for 'seed' must be >= 0 and < 2^32"
+		if tile_per_polygon is not None:
+			assert isListWithStringEntries(tile_per_polygon, allow_empty_flag = False) == True, "CatanGeneratorEngine::__init__: If provided, value for 'tile_per_polygon' must be a list object containing non-empty str objects as entries"
+			assert len(tile_per_polygon) == sum(ROW_COUNTS_PER_MODE[game_mode]), "CatanGeneratorEngine::__init__: If provided, value for 'tile_per_polygon' must be a list of length equal to the number of polygons in the game mode"
+			for value in tile_per_polygon:
+				assert value in ALL_TILE_TYPES, "CatanGeneratorEngine::__init__: If provided, value for 'tile_per_polygon' must be a list of valid tile types"
+		assert type(common_random_flag) == bool, "CatanGeneratorEngine::__init__: Provided value for 'common_random_flag' must be a bool object"
+		if constraint_set is not None:
+			assert constraint_set.game_mode == game_mode, "CatanGeneratorEngine::__init__: If provided, value for 'constraint_set' must be a CatanConstraintSet for the same game mode"
+		if ring_weights is not None:
+			assert type(ring_weights) == list and len(ring_weights) > 0, "CatanGeneratorEngine::__init__: If provided, value for 'ring_weights' must be a non-empty list object"
+			for value in ring_weights:
+				assert isNumeric(value, include_numpy_flag = True) == True and 0 <= value, "CatanGeneratorEngine::__init__: If provided, value for 'ring_weights' must contain only non-negative numeric values"
+			assert 0 < sum(ring_weights), "CatanGeneratorEngine::__init__: If provided, value for 'ring_weights' must have a positive sum"
+
+		# Store the provided values
+		self.game_mode = game_mode
+		self.skew_power = skew_power
+		self.reject_flag = reject_flag
+		self.normalize_type = normalize_type
+		self.constraint_set = constraint_set
+		self.ring_weights = [1] if ring_weights is None else list(ring_weights)
+		self.n_rings = len(self.ring_weights)
+
+		# Create the random state used for all sampling, along with the separate polygon-choice stream (if needed)
+		self.random_state = random.RandomState(seed)
+		if common_random_flag == True:
+			self.polygon_random_state = random.RandomState(None if seed is None else [seed, 1])
+		else:
+			self.polygon_random_state = None
+
+		# Store the shared layout information
+		hex_layout = computeHexLayout(row_counts = ROW_COUNTS_PER_MODE[game_mode])
+		self.n_polygons = sum(ROW_COUNTS_PER_MODE[game_mode])
+		self.neighbor_indices_per_polygon = [hex_layout["neighbor_indices_per_polygon"][polygon_index] for polygon_index in range(self.n_polygons)]
+		self.neighbor_indices_per_ring = [self.neighbor_indices_per_polygon]
+		if self.n_rings > 1:
+			self.neighbor_indices_per_ring += getRingNeighborIndices(game_mode = game_mode, n_rings = self.n_rings)[1:]
+
+		# Randomly generate the initial tiling (using the same procedure as CatanGeneratorTiling) unless one was provided
+		if tile_per_polygon is None:
+			possible_tiles = []
+			for tile_type in TILE_COUNTS_PER_MODE[game_mode]:
+				for _ in range(TILE_COUNTS_PER_MODE[game_mode][tile_type]):
+					possible_tiles.append(tile_type)
+			tile_per_polygon = []
+			for _ in range(self.n_polygons):
+				tile_per_polygon.append(possible_tiles.pop(self.random_state.randint(len(possible_tiles))))
+
+		# Initialize all the storage derived from the tiling
+		self.setTiling(tile_per_polygon = tile_per_polygon)
+
+		# Repair the tiling until it satisfies every constraint (if needed)
+		if constraint_set is not None and constraint_set.computeViolationScore(self.code_per_polygon) > 0:
+			repaired_codes = constraint_set.repairTiling(code_per_polygon = self.code_per_polygon, random_state = self.random_state)
+			self.setTiling(tile_per_polygon = [self.needed_tile_types[code] for code in repaired_codes])
+
+		# Initialize the running counters read by telemetry
+		self.resetCounters()
+
+	### Define functions for setting and fetching the tiling ###
+	def setTiling(self, tile_per_polygon:list):
+		# Replace the current tiling and rebuild all derived storage (note: input verification not done since the engine is trusted)
+		# Get the tile types which actually appear in this tiling and encode each polygon as an index into this list
+		self.needed_tile_types = [tile_type for tile_type in ALL_TILE_TYPES if tile_type in tile_per_polygon]
+		self.n_types = len(self.needed_tile_types)
+		code_per_tile = {tile_type: code for code, tile_type in enumerate(self.needed_tile_types)}
+		self.code_per_polygon = [code_per_tile[tile_type] for tile_type in tile_per_polygon]
+
+		# Store the constants used by the objective
+		self.maximum_entropy = log2(self.n_types)
+		self.target_per_code = [TARGET_EFFICIENCY_PER_TUPLE[(self.game_mode, tile_type)] for tile_type in self.needed_tile_types]
+
+		# Count the number of neighbors of each tile code belonging to each tile code within each ring (ring 1 is also kept as neighbor_counts)
+		self.neighbor_counts_per_ring = []
+		for neighbor_indices_per_polygon in self.neighbor_indices_per_ring:
+			neighbor_counts = [[0 for _ in range(self.n_types)] for _ in range(self.n_types)]
+			for polygon_index_1 in range(self.n_polygons):
+				code_1 = self.code_per_polygon[polygon_index_1]
+				for polygon_index_2 in neighbor_indices_per_polygon[polygon_index_1]:
+					neighbor_counts[code_1][self.code_per_polygon[polygon_index_2]] += 1
+			self.neighbor_counts_per_ring.append(neighbor_counts)
+		self.neighbor_counts = self.neighbor_counts_per_ring[0]
+
+		# Store the indices of the polygons holding each tile code, along with where each polygon sits in its list
+		self.polygon_indices_per_code = [[] for _ in range(self.n_types)]
+		self.list_position_per_polygon = []
+		for polygon_index in range(self.n_polygons):
+			code = self.code_per_polygon[polygon_index]
+			self.list_position_per_polygon.append(len(self.polygon_indices_per_code[code]))
+			self.polygon_indices_per_code[code].append(polygon_index)
+
+		# Cache the efficiency of each tile code and the resulting mean squared error
+		self.efficiency_per_code = [self.computeEfficiencyOfCode(code) for code in range(self.n_types)]
+		self.mean_squared_error = self.computeMeanSquaredError(self.efficiency_per_code)
+
+		# Bind the constraints to the tile codes of this tiling (if needed)
+		if self.constraint_set is not None:
+			self.constraint_set.attach(needed_tile_types = self.needed_tile_types, code_per_polygon = self.code_per_polygon)
+
+	def getSnapshot(self) -> dict:
+		# Return a JSON-serializable snapshot of the tiling, all cached storage and the random streams
+		snapshot = {}
+		snapshot["game_mode"] = self.game_mode
+		snapshot["ring_weights"] = list(self.ring_weights)
+		snapshot["needed_tile_types"] = list(self.needed_tile_types)
+		snapshot["code_per_polygon"] = list(self.code_per_polygon)
+		snapshot["neighbor_counts"] = [list(counts) for counts in self.neighbor_counts]
+		snapshot["polygon_indices_per_code"] = [list(polygon_indices) for polygon_indices in self.polygon_indices_per_code]
+		snapshot["efficiency_per_code"] = list(self.efficiency_per_code)
+		snapshot["mean_squared_error"] = self.mean_squared_error
+		snapshot["random_state"] = snapshotRandomState(random_state = self.random_state)
+		snapshot["polygon_random_state"] = None if self.polygon_random_state is None else snapshotRandomState(random_state = self.polygon_random_state)
+		snapshot["candidate_indices"] = None if self.constraint_set is None else [[list(candidates) for candidates in candidates_per_code] for candidates_per_code in self.constraint_set.candidate_indices]
+		snapshot["counters"] = self.getCounters()
+		return snapshot
+
+	def restoreSnapshot(self, snapshot:dict):
+		# Restore a snapshot created by getSnapshot (of an engine with the same settings), after which steps continue bit-identically
+		assert snapshot["game_mode"] == self.game_mode, "CatanGeneratorEngine::restoreSnapshot: Provided value for 'snapshot' must come from an engine of the same game mode"
+		assert snapshot.get("ring_weights", [1]) == self.ring_weights, "CatanGeneratorEngine::restoreSnapshot: Provided value for 'snapshot' must come from an engine with the same ring weights"
+		assert (snapshot["polygon_random_state"] is None) == (self.polygon_random_state is None), "CatanGeneratorEngine::restoreSnapshot: Provided value for 'snapshot' must come from an engine with the same value of 'common_random_flag'"
+		self.setTiling(tile_per_polygon = [snapshot["needed_tile_types"][code] for code in snapshot["code_per_polygon"]])
+		assert self.neighbor_counts == snapshot["neighbor_counts"], "CatanGeneratorEngine::restoreSnapshot: Provided value for 'snapshot' has neighbor counts inconsistent with its tiling"
+		self.polygon_indices_per_code = [list(polygon_indices) for polygon_indices in snapshot["polygon_indices_per_code"]]
+		for polygon_indices in self.polygon_indices_per_code:
+			for list_position, polygon_index in enumerate(polygon_indices):
+				self.list_position_per_polygon[polygon_index] = list_position
+		self.efficiency_per_code = list(snapshot["efficiency_per_code"])
+		self.mean_squared_error = snapshot["mean_squared_error"]
+		self.resetCounters()
+		if "counters" in snapshot:
+			self.n_applied_swaps = snapshot["counters"]["n_steps"]
+			self.n_accepted_swaps = snapshot["counters"]["n_acceptances"]
+			self.best_mean_squared_error = snapshot["counters"]["best_mean_squared_error"]
+		self.random_state = restoreRandomState(random_snapshot = snapshot["random_state"])
+		if self.polygon_random_state is not None:
+			self.polygon_random_state = restoreRandomState(random_snapshot = snapshot["polygon_random_state"])
+		if self.constraint_set is not None:
+			self.constraint_set.restoreCandidates(candidate_indices = snapshot["candidate_indices"])
+
+	def getGameMode(self) -> str:
+		# Return the game mode of the engine
+		return self.game_mode
+
+	def getTilePerPolygon(self) -> list:
+		# Return the tile type assigned to each polygon
+		return [self.needed_tile_types[code] for code in self.code_per_polygon]
+
+	def getEfficiencyPerTileType(self) -> dict:
+		# Return the current efficiency (i.e. normalized entropy) of each tile type
+		return {self.needed_tile_types[code]: self.efficiency_per_code[code] for code in range(self.n_types)}
+
+	def getMeanSquaredError(self) -> float:
+		# Return the current mean squared error between actual and target efficiency values
+		return self.mean_squared_error
+
+	### Define functions for the running counters ###
+	def resetCounters(self):
+		# Reset the number of swaps applied and accepted, along with the best MSE seen, to the current state
+		self.n_applied_swaps = 0
+		self.n_accepted_swaps = 0
+		self.best_mean_squared_error = self.mean_squared_error
+
+	def getCounters(self) -> dict:
+		# Return the running counters along with the current MSE (e.g. for CatanTelemetry)
+		return {"n_steps": self.n_applied_swaps, "n_acceptances": self.n_accepted_swaps, "mean_squared_error": self.mean_squared_error, "best_mean_squared_error": self.best_mean_squared_error}
+
+	### Define the functions used by the objective ###
+	def computeEfficiencyOfCode(self, code:int) -> float:
+		# Compute the efficiency of a single tile code, i.e. its normalized entropy (weighted over the rings if more than one ring is used)
+		if self.n_rings == 1:
+			return self.computeEntropyOfCode(code) / self.maximum_entropy
+		weighted_entropy = 0
+		for ring_index in range(self.n_rings):
+			if self.ring_weights[ring_index] != 0:
+				weighted_entropy += self.ring_weights[ring_index] * self.computeEntropyOfCode(code, ring_index)
+		return weighted_entropy / (sum(self.ring_weights) * self.maximum_entropy)
+
+	def computeEntropyOfCode(self, code:int, ring_index:int = 0) -> float:
+		# Compute the Shannon entropy of the neighbor distribution of a single tile code within a ring (in the same order of operations as computeEntropyPerTileType)
+		counts = self.neighbor_counts_per_ring[ring_index][code]
+		n_neighbors = sum(counts)
+		if n_neighbors == 0:
+			return 0
+		entropy = 0
+		for count in counts:
+			prob_value = count / n_neighbors
+			if prob_value != 0 and prob_value != 1:
+				entropy += prob_value * log2(1 / prob_value)
+		return entropy
+
+	def computeMeanSquaredError(self, efficiency_per_code:list) -> float:
+		# Compute the mean squared error between the provided and target efficiency values
+		mean_squared_error = 0
+		for code in range(self.n_types):
+			mean_squared_error += (self.target_per_code[code] - efficiency_per_code[code])**2 / self.n_types
+		return mean_squared_error
+
+	def computeProbabilities(self) -> tuple:
+		# Compute the cumulative distributions used to select the 1st and 2nd tile codes given the current efficiency values
+		# Compute the normalized errors using the needed method
+		raw_errors = [self.efficiency_per_code[code] - self.target_per_code[code] for code in range(self.n_types)]
+		if self.normalize_type == "static":
+			normalized_errors = [0.5 + raw_error / 2 for raw_error in raw_errors]
+		else:
+			max_abs_raw_error = max([abs(raw_error) for raw_error in raw_errors])
+			normalized_errors = [0.5 + raw_error / (2 * max_abs_raw_error) for raw_error in raw_errors]
+
+		# Compute the pseudo-probabilities for the needed skew power
+		skew_power = self.skew_power
+		if skew_power < float("inf"):
+			pseudo_probabilities_1 = [normalized_error**skew_power for normalized_error in normalized_errors]
+			pseudo_probabilities_2 = [(1 - normalized_error)**skew_power for normalized_error in normalized_errors]
+		else:
+			max_normalized_error = max(normalized_errors)
+			min_normalized_error = min(normalized_errors)
+			pseudo_probabilities_1 = [1 if normalized_error == max_normalized_error else 0 for normalized_error in normalized_errors]
+			pseudo_probabilities_2 = [1 if normalized_error == min_normalized_error else 0 for normalized_error in normalized_errors]
+
+		# Normalize and accumulate the probabilities (matching the arithmetic of numpy's weighted choice)
+		cumulative_probabilities = []
+		for pseudo_probabilities in [pseudo_probabilities_1, pseudo_probabilities_2]:
+			normalizer = sum(pseudo_probabilities)
+			cumulative = []
+			running_total = 0.0
+			for pseudo_probability in pseudo_probabilities:
+				running_total += pseudo_probability / normalizer
+				cumulative.append(running_total)
+			cumulative_probabilities.append([value / running_total for value in cumulative])
+
+		# Return the results
+		return cumulative_probabilities[0], cumulative_probabilities[1]
+
+	### Define the functions used for swapping ###
+	def updateStorageDueToSwap(self, polygon_index_1:int, polygon_index_2:int) -> set:
+		# Swap the tile codes of two polygons and update all storage, return the set of codes whose neighbor counts changed
+		# Bind the needed attributes locally
+		code_per_polygon = self.code_per_polygon
+		ring_storage = list(zip(self.neighbor_indices_per_ring, self.neighbor_counts_per_ring))
+		code_1 = code_per_polygon[polygon_index_1]
+		code_2 = code_per_polygon[polygon_index_2]
+		changed_codes = {code_1, code_2}
+
+		# Remove the links of both polygons within every ring before changing them
+		for neighbor_indices_per_polygon, neighbor_counts in ring_storage:
+			for polygon_index, code in [(polygon_index_1, code_1), (polygon_index_2, code_2)]:
+				for neighbor_polygon_index in neighbor_indices_per_polygon[polygon_index]:
+					neighbor_code = code_per_polygon[neighbor_polygon_index]
+					neighbor_counts[neighbor_code][code] -= 1
+					neighbor_counts[code][neighbor_code] -= 1
+					changed_codes.add(neighbor_code)
+
+		# Swap the codes for the selected polygons
+		code_per_polygon[polygon_index_1] = code_2
+		code_per_polygon[polygon_index_2] = code_1
+
+		# Add the links of both polygons within every ring after changing them
+		for neighbor_indices_per_polygon, neighbor_counts in ring_storage:
+			for polygon_index, code in [(polygon_index_1, code_2), (polygon_index_2, code_1)]:
+				for neighbor_polygon_index in neighbor_indices_per_polygon[polygon_index]:
+					neighbor_code = code_per_polygon[neighbor_polygon_index]
+					neighbor_counts[neighbor_code][code] += 1
+					neighbor_counts[code][neighbor_code] += 1
+					changed_codes.add(neighbor_code)
+
+		# Swap the polygons between the per-code index lists by exchanging their list slots
+		position_1 = self.list_position_per_polygon[polygon_index_1]
+		position_2 = self.list_position_per_polygon[polygon_index_2]
+		self.polygon_indices_per_code[code_1][position_1] = polygon_index_2
+		self.polygon_indices_per_code[code_2][position_2] = polygon_index_1
+		self.list_position_per_polygon[polygon_index_1] = position_2
+		self.list_position_per_polygon[polygon_index_2] = position_1
+
+		# Return the results
+		return changed_codes
+
+	def proposeSwap(self) -> tuple:
+		# Randomly select two polygons of distinct tile codes to swap (using the same random draws as CatanGeneratorTiling.swapTiles)
+		if self.constraint_set is not None:
+			return self.proposeConstrainedSwap()
+
+		# Select the tile codes and make sure they are distinct
+		cumulative_1, cumulative_2 = self.computeProbabilities()
+		random_sample = self.random_state.random_sample
+		while True:
+			code_1 = bisect_right(cumulative_1, random_sample())
+			code_2 = bisect_right(cumulative_2, random_sample())
+			if code_1 != code_2:
+				break
+
+		# Select the polygon indices
+		possible_indices_1 = self.polygon_indices_per_code[code_1]
+		possible_indices_2 = self.polygon_indices_per_code[code_2]
+		if self.polygon_random_state is None:
+			polygon_index_1 = possible_indices_1[self.random_state.randint(len(possible_indices_1))]
+			polygon_index_2 = possible_indices_2[self.random_state.randint(len(possible_indices_2))]
+		else:
+			uniform_1, uniform_2 = self.polygon_random_state.random_sample(2)
+			polygon_index_1 = possible_indices_1[int(uniform_1 * len(possible_indices_1))]
+			polygon_index_2 = possible_indices_2[int(uniform_2 * len(possible_indices_2))]
+
+		# Return the results
+		return polygon_index_1, polygon_index_2
+
+	def proposeConstrainedSwap(self, max_attempts:int = 100) -> tuple:
+		# Randomly select two polygons of distinct tile codes to swap such that each polygon is allowed to receive the other's code
+		# Note: a pair of tile codes without any allowed polygons is redrawn, and the same polygon twice (i.e. a skipped step) is returned if no pair is found
+		cumulative_1, cumulative_2 = self.computeProbabilities()
+		random_sample = self.random_state.random_sample
+		candidate_indices = self.constraint_set.candidate_indices
+		for _ in range(max_attempts):
+			code_1 = bisect_right(cumulative_1, random_sample())
+			code_2 = bisect_right(cumulative_2, random_sample())
+			if code_1 != code_2:
+				possible_indices_1 = candidate_indices[code_1][code_2]
+				possible_indices_2 = candidate_indices[code_2][code_1]
+				if len(possible_indices_1) > 0 and len(possible_indices_2) > 0:
+					return possible_indices_1[self.random_state.randint(len(possible_indices_1))], possible_indices_2[self.random_state.randint(len(possible_indices_2))]
+		return 0, 0
+
+	def applySwap(self, polygon_index_1:int, polygon_index_2:int) -> bool:
+		# Perform the swap of two polygons (undoing it if it must be rejected) and return whether the swap was accepted
+		# Count the swap and reject it if it breaks any constraint before touching the storage (if needed)
+		self.n_applied_swaps += 1
+		constraint_set = self.constraint_set
+		if constraint_set is not None:
+			if polygon_index_1 == polygon_index_2:
+				return False
+			separation_delta = constraint_set.computeSeparationDelta(self.code_per_polygon, polygon_index_1, polygon_index_2)
+			if separation_delta > 0 or constraint_set.breaksLandConnectivity(self.code_per_polygon, polygon_index_1, polygon_index_2) == True:
+				return False
+
+		# Perform the swap
+		changed_codes = self.updateStorageDueToSwap(polygon_index_1, polygon_index_2)
+
+		# Recompute the efficiency values only for the tile codes whose neighbor counts changed
+		post_efficiency_per_code = list(self.efficiency_per_code)
+		for code in changed_codes:
+			post_efficiency_per_code[code] = self.computeEfficiencyOfCode(code)
+		post_mean_squared_error = self.computeMeanSquaredError(post_efficiency_per_code)
+
+		# Reject the change if it raised the mean squared error (if needed)
+		if self.reject_flag == True and post_mean_squared_error > self.mean_squared_error:
+			self.updateStorageDueToSwap(polygon_index_1, polygon_index_2)
+			return False
+
+		# Otherwise keep the new values
+		self.efficiency_per_code = post_efficiency_per_code
+		self.mean_squared_error = post_mean_squared_error
+		self.n_accepted_swaps += 1
+		if post_mean_squared_error < self.best_mean_squared_error:
+			self.best_mean_squared_error = post_mean_squared_error
+		if constraint_set is not None:
+			constraint_set.updateDueToSwap(self.code_per_polygon, polygon_index_1, polygon_index_2, separation_delta)
+		return True
+
+	def step(self) -> bool:
+		# Perform a single swap step and return whether the swap was accepted
+		polygon_index_1, polygon_index_2 = self.proposeSwap()
+		return self.applySwap(polygon_index_1, polygon_index_2)
+
+	def runSwaps(self, n_steps:int) -> list:
+		# Perform the needed number of swap steps and return the pre-swap mean squared error of each step
+		# Initialize the list of values
+		pre_mean_squared_errors = []
+
+		# Run the steps
+		step = self.step
+		for _ in range(n_steps):
+			pre_mean_squared_errors.append(self.mean_squared_error)
+			step()
+
+		# Return the results
+		return pre_mean_squared_errors
+
+	def recordSwaps(self, n_steps:int) -> tuple:
+		# Perform the needed number of swap steps and return the lists of polygon indices swapped and whether each swap was accepted
+		# Initialize the lists of values
+		polygon_indices_1 = []
+		polygon_indices_2 = []
+		accepted_flags = []
+
+		# Run the steps
+		propose_swap = self.proposeSwap
+		apply_swap = self.applySwap
+		for _ in range(n_steps):
+			polygon_index_1, polygon_index_2 = propose_swap()
+			polygon_indices_1.append(polygon_index_1)
+			polygon_indices_2.append(polygon_index_2)
+			accepted_flags.append(apply_swap(polygon_index_1, polygon_index_2))
+
+		# Return the results
+		return polygon_indices_1, polygon_indices_2, accepted_flags
@@ -0,0 +1,421 @@
+##########################################
+### Import needed general dependencies ###
+##########################################
+# Add paths for internal modules
+# Import dependencies
+from pathlib import Path
+from sys import path
+# Get the shared active projects folder
+active_projects_folder = Path(__file__).parent.parent
+# Get the shared parent folder
+parent_folder = active_projects_folder.parent
+# Get the shared infrastructure folder
+infrastructure_folder = parent_folder.joinpath("infrastructure")
+# Add the needed paths
+path.insert(0, str(infrastructure_folder.joinpath("board_games")))
+path.insert(0, str(infrastructure_folder.joinpath("common_needs")))
+
+# Built-in modules
+from multiprocessing import Pool
+from os import cpu_count
+from time import process_time
+from typing import Any
+
+# Internal modules
+from catan_board_core import ALL_GAME_MODES, ROW_COUNTS_PER_MODE, TILE_COUNTS_PER_MODE, computeHexLayout, restoreRandomState, snapshotRandomState
+from catan_board_library import CatanBoardLibrary, createBoardFromEngine, createBoardFromTiling
+from catan_generator_engine import CatanGeneratorEngine
+from catan_tiling_record import CatanModeTopology, getModeTopology
+
+# External modules
+from numpy import arange, argmax, argmin, argsort, array, bincount, concatenate, cumsum, flatnonzero, full, int64, log2, ndarray, random, repeat, uint8, where
+
+
+###########################################################
+### Define shared settings and functions for the search ###
+###########################################################
+# Define the number of times the second polygon of a random swap is redrawn when it holds the same code as the first
+N_SWAP_REDRAWS = 3
+
+def computePopulationScores(topology:CatanModeTopology, population:ndarray) -> tuple:
+	# Compute the efficiency per tile code and the MSE of every tiling in a population at once, return both as arrays
+	# Note: population[individual_index, polygon_index] = tile code, scored in the same way as CatanTilingRecord.computeScores
+	# Count the neighbor pairs of every individual with a single bincount, offsetting each individual into its own block of counts
+	n_individuals = population.shape[0]
+	n_types = topology.n_types
+	pair_codes = population[:, topology.edge_indices_1].astype(int64) * n_types + population[:, topology.edge_indices_2]
+	pair_codes += arange(n_individuals, dtype = int64)[:, None] * n_types**2
+	neighbor_counts = bincount(pair_codes.ravel(), minlength = n_individuals * n_types**2).reshape(n_individuals, n_types, n_types)
+
+	# Compute the efficiencies and MSE values
+	prob_values = neighbor_counts / neighbor_counts.sum(axis = 2, keepdims = True)
+	marginal_entropies = where((prob_values > 0) & (prob_values < 1), -prob_values * log2(where(prob_values > 0, prob_values, 1)), 0)
+	efficiencies = marginal_entropies.sum(axis = 2) / topology.maximum_entropy
+	mean_squared_errors = ((efficiencies - topology.target_efficiencies)**2).mean(axis = 1)
+	return efficiencies, mean_squared_errors
+
+def computeDistanceMatrix(game_mode:str) -> ndarray:
+	# Return the number of steps between every pair of polygons of a game mode (found by a breadth-first search from each polygon)
+	neighbor_indices_per_polygon = computeHexLayout(row_counts = ROW_COUNTS_PER_MODE[game_mode])["neighbor_indices_per_polygon"]
+	n_polygons = len(neighbor_indices_per_polygon)
+	distances = full((n_polygons, n_polygons), n_polygons, dtype = int64)
+	for start_index in range(n_polygons):
+		distances[start_index, start_index] = 0
+		frontier = [start_index]
+		while len(frontier) > 0:
+			next_frontier = []
+			for polygon_index in frontier:
+				for neighbor_index in neighbor_indices_per_polygon[polygon_index]:
+					if distances[start_index, neighbor_index] > distances[start_index, polygon_index] + 1:
+						distances[start_index, neighbor_index] = distances[start_index, polygon_index] + 1
+						next_frontier.append(neighbor_index)
+			frontier = next_frontier
+	return distances
+
+
+##############################################
+### Define the genetic search class itself ###
+##############################################
+# Note: the population is held as an integer array of tile codes (one row per tiling), so every operation below acts on all individuals at once
+#       Each generation keeps the elites, picks parents by tournament, transplants a random hex region of one parent into the other (repairing the
+#       tiles outside the region so the child keeps the tile counts of TILE_COUNTS_PER_MODE) and applies random swap mutations
+#       Each child then takes a short rejecting swap walk, where every step proposes one guided swap per child and scores the whole batch at once,
+#       which costs a few microseconds per proposal rather than the ~100 of a CatanGeneratorEngine step
+#       Swaps and the repair both preserve the multiset of tiles, so every individual is always a valid tiling of the game mode
+class CatanGeneticSearch:
+	### Initialize the class ###
+	def __init__(self, game_mode:str, population_size:int = 48, n_elites:int = 2, tournament_size:int = 3, crossover_rate:float = 0.5, max_region_radius:int = 2,
+				 n_mutation_swaps:int = 1, n_local_steps:int = 300, skew_power:float = 2, seed:int = None):
+		# Verify the inputs
+		assert game_mode in ALL_GAME_MODES, "CatanGeneticSearch::__init__: Provided value for 'game_mode' must be contained in the list ALL_GAME_MODES"
+		assert type(population_size) == int and population_size >= 2, "CatanGeneticSearch::__init__: Provided value for 'population_size' must be an int object >= 2"
+		assert type(n_elites) == int and 0 <= n_elites and n_elites < population_size, "CatanGeneticSearch::__init__: Provided value for 'n_elites' must be a non-negative int object < population_size"
+		assert type(tournament_size) == int and tournament_size >= 1, "CatanGeneticSearch::__init__: Provided value for 'tournament_size' must be a positive int object"
+		assert 0 <= crossover_rate and crossover_rate <= 1, "CatanGeneticSearch::__init__: Provided value for 'crossover_rate' must be >= 0 and <= 1"
+		assert type(max_region_radius) == int and max_region_radius >= 0, "CatanGeneticSearch::__init__: Provided value for 'max_region_radius' must be a non-negative int object"
+		assert type(n_mutation_swaps) == int and n_mutation_swaps >= 0, "CatanGeneticSearch::__init__: Provided value for 'n_mutation_swaps' must be a non-negative int object"
+		assert type(n_local_steps) == int and n_local_steps >= 0, "CatanGeneticSearch::__init__: Provided value for 'n_local_steps' must be a non-negative int object"
+		assert 0 <= skew_power and skew_power < float("inf"), "CatanGeneticSearch::__init__: Provided value for 'skew_power' must be non-negative and finite"
+
+		# Store the provided values
+		self.game_mode = game_mode
+		self.population_size = population_size
+		self.n_elites = n_elites
+		self.tournament_size = tournament_size
+		self.crossover_rate = crossover_rate
+		self.max_region_radius = max_region_radius
+		self.n_mutation_swaps = n_mutation_swaps
+		self.n_local_steps = n_local_steps
+		self.skew_power = skew_power
+		self.random_state = random.RandomState(seed = seed)
+
+		# Store the shared topology, the distances used for regions and the tile count of each code
+		self.topology = getModeTopology(game_mode = game_mode)
+		self.n_polygons = self.topology.n_polygons
+		self.distances = computeDistanceMatrix(game_mode = game_mode)
+		self.count_per_code = array([TILE_COUNTS_PER_MODE[game_mode][tile_type] for tile_type in self.topology.tile_types], dtype = int64)
+
+		# Create a random initial population (i.e. random permutations of the tile multiset) and score it
+		base_codes = repeat(arange(self.topology.n_types), self.count_per_code).astype(uint8)
+		self.population = base_codes[argsort(self.random_state.random_sample((population_size, self.n_polygons)), axis = 1)]
+		self.mean_squared_errors = computePopulationScores(topology = self.topology, population = self.population)[1]
+		self.n_generations = 0
+
+	### Define functions for fetching the results ###
+	def getBestIndividual(self) -> tuple:
+		# Return the MSE and the tile type per polygon of the best individual in the population
+		best_index = int(argmin(self.mean_squared_errors))
+		tile_types = self.topology.tile_types
+		return float(self.mean_squared_errors[best_index]), [tile_types[code] for code in self.population[best_index]]
+
+	def getState(self) -> dict:
+		# Return the population, its scores and the random state (e.g. to move the search between processes)
+		return {"population": self.population.copy(), "mean_squared_errors": self.mean_squared_errors.copy(), "n_generations": self.n_generations,
+				"random_state": snapshotRandomState(random_state = self.random_state)}
+
+	def setState(self, state:dict):
+		# Restore the population, its scores and the random state saved with getState
+		self.population = state["population"].copy()
+		self.mean_squared_errors = state["mean_squared_errors"].copy()
+		self.n_generations = state["n_generations"]
+		self.random_state = restoreRandomState(random_snapshot = state["random_state"])
+
+	### Define the genetic operators ###
+	def selectParents(self, n_parents:int) -> ndarray:
+		# Return the population indices of the parents picked by tournament selection (the lowest MSE of each tournament wins)
+		contestants = self.random_state.randint(self.population_size, size = (n_parents, self.tournament_size))
+		winners = argmin(self.mean_squared_errors[contestants], axis = 1)
+		return contestants[arange(n_parents), winners]
+
+	def crossover(self, parents_1:ndarray, parents_2:ndarray) -> ndarray:
+		# Return children made by transplanting a random hex region of each second parent into the matching first parent, repaired to keep the tile counts
+		# Transplant the regions of all children at once
+		n_children = parents_1.shape[0]
+		centers = self.random_state.randint(self.n_polygons, size = n_children)
+		radii = self.random_state.randint(self.max_region_radius + 1, size = n_children)
+		region_masks = self.distances[centers] <= radii[:, None]
+		children = where(region_masks, parents_2, parents_1)
+
+		# Repair each child by giving the surplus tiles outside its region the codes which are now missing
+		# Note: the first parent has every tile of the region elsewhere, so a surplus can always be removed outside of the region
+		n_types = self.topology.n_types
+		for child_index in range(n_children):
+			child = children[child_index]
+			surplus_per_code = bincount(child, minlength = n_types) - self.count_per_code
+			if not surplus_per_code.any():
+				continue
+			outside_indices = flatnonzero(~region_masks[child_index])
+			outside_indices = outside_indices[self.random_state.permutation(len(outside_indices))]
+			repaired_indices = []
+			for code in flatnonzero(surplus_per_code > 0):
+				repaired_indices += outside_indices[child[outside_indices] == code][:surplus_per_code[code]].tolist()
+			missing_codes = repeat(arange(n_types), where(surplus_per_code < 0, -surplus_per_code, 0))
+			child[repaired_indices] = missing_codes[self.random_state.permutation(len(missing_codes))]
+		return children
+
+	def swapRandomly(self, individuals:ndarray):
+		# Swap a random pair of polygons in every individual in place, redrawing the second polygon a few times where both hold the same code (i.e. a wasted swap)
+		rows = arange(individuals.shape[0])
+		polygon_indices_1 = self.random_state.randint(self.n_polygons, size = len(rows))
+		codes_1 = individuals[rows, polygon_indices_1]
+		polygon_indices_2 = self.random_state.randint(self.n_polygons, size = len(rows))
+		for _ in range(N_SWAP_REDRAWS):
+			same_rows = flatnonzero(individuals[rows, polygon_indices_2] == codes_1)
+			if len(same_rows) == 0:
+				break
+			polygon_indices_2[same_rows] = self.random_state.randint(self.n_polygons, size = len(same_rows))
+		individuals[rows, polygon_indices_1] = individuals[rows, polygon_indices_2]
+		individuals[rows, polygon_indices_2] = codes_1
+
+	def mutate(self, children:ndarray):
+		# Apply the needed number of random swaps to every child in place
+		for _ in range(self.n_mutation_swaps):
+			self.swapRandomly(individuals = children)
+
+	def swapGuided(self, individuals:ndarray, efficiencies:ndarray):
+		# Swap a pair of polygons in every individual in place, choosing their tile codes in the same way as CatanGeneratorEngine.proposeSwap (with static normalization)
+		# Note: the 1st code is drawn with weight (0.5 + error / 2)**skew_power and the 2nd with weight (0.5 - error / 2)**skew_power, where error = efficiency - target
+		# Compute the cumulative distributions of both codes for every individual
+		normalized_errors = 0.5 + (efficiencies - self.topology.target_efficiencies) / 2
+		cumulative_1 = cumsum(normalized_errors**self.skew_power, axis = 1)
+		cumulative_2 = cumsum((1 - normalized_errors)**self.skew_power, axis = 1)
+
+		# Draw the codes, redrawing the 2nd code a few times where it matches the 1st
+		n_individuals = individuals.shape[0]
+		rows = arange(n_individuals)
+		codes_1 = (cumulative_1 < self.random_state.random_sample(n_individuals)[:, None] * cumulative_1[:, -1:]).sum(axis = 1)
+		codes_2 = (cumulative_2 < self.random_state.random_sample(n_individuals)[:, None] * cumulative_2[:, -1:]).sum(axis = 1)
+		for _ in range(N_SWAP_REDRAWS):
+			same_rows = flatnonzero(codes_1 == codes_2)
+			if len(same_rows) == 0:
+				break
+			codes_2[same_rows] = (cumulative_2[same_rows] < self.random_state.random_sample(len(same_rows))[:, None] * cumulative_2[same_rows, -1:]).sum(axis = 1)
+
+		# Pick a uniformly random polygon holding each code (i.e. the largest random key among the polygons of the code)
+		polygon_indices_1 = argmax(where(individuals == codes_1[:, None], self.random_state.random_sample(individuals.shape), -1), axis = 1)
+		polygon_indices_2 = argmax(where(individuals == codes_2[:, None], self.random_state.random_sample(individuals.shape), -1), axis = 1)
+		individuals[rows, polygon_indices_1] = codes_2
+		individuals[rows, polygon_indices_2] = codes_1
+
+	def improveLocally(self, children:ndarray, efficiencies:ndarray, mean_squared_errors:ndarray) -> tuple:
+		# Run the needed number of rejecting swap steps on every child at once (i.e. one guided swap per child per step, kept if it doesn't raise its MSE), return the new children and scores
+		# Note: this is the same walk as CatanGeneratorEngine with reject_flag = True, but each step scores the whole batch of children in a single call
+		for _ in range(self.n_local_steps):
+			candidates = children.copy()
+			self.swapGuided(individuals = candidates, efficiencies = efficiencies)
+			candidate_efficiencies, candidate_errors = computePopulationScores(topology = self.topology, population = candidates)
+			accepted_rows = flatnonzero(candidate_errors <= mean_squared_errors)
+			children[accepted_rows] = candidates[accepted_rows]
+			efficiencies[accepted_rows] = candidate_efficiencies[accepted_rows]
+			mean_squared_errors[accepted_rows] = candidate_errors[accepted_rows]
+		return children, mean_squared_errors
+
+	### Define the functions which run the search ###
+	def step(self):
+		# Run a single generation
+		# Keep the elites unchanged
+		elite_indices = argsort(self.mean_squared_errors, kind = "stable")[:self.n_elites]
+		n_children = self.population_size - self.n_elites
+
+		# Create the children from the selected parents (only some of which are crossed over)
+		parents_1 = self.population[self.selectParents(n_parents = n_children)]
+		parents_2 = self.population[self.selectParents(n_parents = n_children)]
+		crossover_flags = self.random_state.random_sample(n_children) < self.crossover_rate
+		children = parents_1.copy()
+		if crossover_flags.any():
+			children[crossover_flags] = self.crossover(parents_1 = parents_1[crossover_flags], parents_2 = parents_2[crossover_flags])
+		self.mutate(children = children)
+
+		# Score the children, improve them locally and form the next population
+		child_efficiencies, child_errors = computePopulationScores(topology = self.topology, population = children)
+		children, child_errors = self.improveLocally(children = children, efficiencies = child_efficiencies, mean_squared_errors = child_errors)
+		self.population = concatenate([self.population[elite_indices], children])
+		self.mean_squared_errors = concatenate([self.mean_squared_errors[elite_indices], child_errors])
+		self.n_generations += 1
+
+	def run(self, n_generations:int = None, cpu_seconds:float = None) -> list:
+		# Run generations until either limit is reached (at least one must be provided), return the best MSE after each generation
+		# Verify the inputs
+		assert n_generations is not None or cpu_seconds is not None, "CatanGeneticSearch::run: At least one of 'n_generations' and 'cpu_seconds' must be provided"
+
+		# Run the generations
+		best_mean_squared_errors = []
+		start_time = process_time()
+		generation_index = 0
+		while (n_generations is None or generation_index < n_generations) and (cpu_seconds is None or process_time() - start_time < cpu_seconds):
+			self.step()
+			best_mean_squared_errors.append(float(self.mean_squared_errors.min()))
+			generation_index += 1
+
+		# Return the results
+		return best_mean_squared_errors
+
+	def replaceWorst(self, immigrants:ndarray, immigrant_errors:ndarray):
+		# Replace the worst individuals of the population with the provided ones (used for migration between islands)
+		worst_indices = argsort(self.mean_squared_errors, kind = "stable")[::-1][:len(immigrants)]
+		self.population[worst_indices] = immigrants
+		self.mean_squared_errors[worst_indices] = immigrant_errors
+
+
+########################################################
+### Define the functions run by the worker processes ###
+########################################################
+def evolveIsland(task:tuple) -> tuple:
+	# Run an island for a fixed number of generations starting from its saved state, return its new state and the CPU seconds used
+	game_mode, search_settings, state, n_generations = task
+	start_time = process_time()
+	genetic_search = CatanGeneticSearch(game_mode = game_mode, **search_settings)
+	genetic_search.setState(state = state)
+	genetic_search.run(n_generations = n_generations)
+	return genetic_search.getState(), process_time() - start_time
+
+
+##########################################
+### Define the search driver functions ###
+##########################################
+def runGeneticSearch(game_mode:str, n_islands:int = 1, n_rounds:int = 5, n_generations_per_round:int = 10, n_migrants:int = 2, n_workers:int = None, seed:int = None,
+					 search_settings:dict = None, board_library:CatanBoardLibrary = None) -> dict:
+	# Run a genetic search on one or more islands, migrating the best individuals of each island to the next one after every round, return the results as a dictionary
+	# Note: islands run in separate processes (up to n_workers at a time) between migrations, so the search scales with the number of cores
+	#       If a board library is provided, the best board of every island is stored in it at the end in a single transaction
+	# Verify the inputs
+	assert game_mode in ALL_GAME_MODES, "runGeneticSearch: Provided value for 'game_mode' must be contained in the list ALL_GAME_MODES"
+	assert type(n_islands) == int and n_islands >= 1, "runGeneticSearch: Provided value for 'n_islands' must be a positive int object"
+	assert type(n_rounds) == int and n_rounds >= 1, "runGeneticSearch: Provided value for 'n_rounds' must be a positive int object"
+	assert type(n_generations_per_round) == int and n_generations_per_round >= 1, "runGeneticSearch: Provided value for 'n_generations_per_round' must be a positive int object"
+	assert type(n_migrants) == int and n_migrants >= 0, "runGeneticSearch: Provided value for 'n_migrants' must be a non-negative int object"
+	search_settings = {} if search_settings is None else dict(search_settings)
+	if n_workers is None:
+		n_workers = min(n_islands, cpu_count())
+
+	# Create the islands, each with its own seed
+	seed_sequence = random.RandomState(seed = seed)
+	all_islands = []
+	for _ in range(n_islands):
+		island_settings = dict(search_settings)
+		island_settings["seed"] = int(seed_sequence.randint(2**31))
+		all_islands.append(CatanGeneticSearch(game_mode = game_mode, **island_settings))
+	search_settings.pop("seed", None)
+
+	# Run the rounds, in this process if only one worker is used
+	pool = Pool(processes = n_workers) if n_workers > 1 else None
+	best_mean_squared_errors = []
+	cpu_seconds = 0
+	try:
+		for _ in range(n_rounds):
+			# Evolve every island
+			tasks = [(game_mode, search_settings, island.getState(), n_generations_per_round) for island in all_islands]
+			if pool is None:
+				start_time = process_time()
+				for island in all_islands:
+					island.run(n_generations = n_generations_per_round)
+				cpu_seconds += process_time() - start_time
+			else:
+				for island, (state, island_seconds) in zip(all_islands, pool.map(evolveIsland, tasks, chunksize = 1)):
+					island.setState(state = state)
+					cpu_seconds += island_seconds
+
+			# Migrate the best individuals of each island to the next one (in a ring)
+			if n_islands > 1 and n_migrants > 0:
+				all_migrants = []
+				for island in all_islands:
+					best_indices = argsort(island.mean_squared_errors, kind = "stable")[:n_migrants]
+					all_migrants.append((island.population[best_indices].copy(), island.mean_squared_errors[best_indices].copy()))
+				for island_index, island in enumerate(all_islands):
+					immigrants, immigrant_errors = all_migrants[island_index - 1]
+					island.replaceWorst(immigrants = immigrants, immigrant_errors = immigrant_errors)
+			best_mean_squared_errors.append(min([island.getBestIndividual()[0] for island in all_islands]))
+	finally:
+		if pool is not None:
+			pool.close()
+			pool.join()
+
+	# Store the best board of every island (if needed)
+	if board_library is not None:
+		board_library.upsertBoards(boards = [createBoardFromTiling(game_mode = game_mode, tile_per_polygon = island.getBestIndividual()[1]) for island in all_islands])
+
+	# Return the results
+	best_mean_squared_error, best_tile_per_polygon = min([island.getBestIndividual() for island in all_islands], key = lambda result: result[0])
+	results = {}
+	results["game_mode"] = game_mode
+	results["mean_squared_error"] = best_mean_squared_error
+	results["tile_per_polygon"] = best_tile_per_polygon
+	results["best_mean_squared_error_per_round"] = best_mean_squared_errors
+	results["n_generations"] = n_rounds * n_generations_per_round
+	results["cpu_seconds"] = cpu_seconds
+	return results
+
+def runRestartedSwaps(game_mode:str, cpu_seconds:float, n_steps_per_restart:int = 3000, skew_power:Any = 2, seed:int = None, board_library:CatanBoardLibrary = None) -> dict:
+	# Run restarted rejecting swap runs of CatanGeneratorEngine (the baseline of the genetic search) until the CPU budget is used, return the results as a dictionary
+	# Note: if a board library is provided, the final board of every restart is stored in it at the end in a single transaction
+	# Verify the inputs
+	assert game_mode in ALL_GAME_MODES, "runRestartedSwaps: Provided value for 'game_mode' must be contained in the list ALL_GAME_MODES"
+	assert 0 < cpu_seconds, "runRestartedSwaps: Provided value for 'cpu_seconds' must be positive"
+
+	# Run the restarts
+	seed_sequence = random.RandomState(seed = seed)
+	best_mean_squared_error = float("inf")
+	best_tile_per_polygon = None
+	final_boards = []
+	n_restarts = 0
+	start_time = process_time()
+	while process_time() - start_time < cpu_seconds:
+		engine = CatanGeneratorEngine(game_mode = game_mode, skew_power = skew_power, reject_flag = True, seed = int(seed_sequence.randint(2**31)))
+		engine.runSwaps(n_steps = n_steps_per_restart)
+		n_restarts += 1
+		if board_library is not None:
+			final_boards.append(createBoardFromEngine(engine = engine))
+		if engine.getMeanSquaredError() < best_mean_squared_error:
+			best_mean_squared_error = engine.getMeanSquaredError()
+			best_tile_per_polygon = engine.getTilePerPolygon()
+	cpu_seconds_used = process_time() - start_time
+
+	# Store the final board of every restart (if needed)
+	if board_library is not None:
+		board_library.upsertBoards(boards = final_boards)
+
+	# Return the results
+	results = {}
+	results["game_mode"] = game_mode
+	results["mean_squared_error"] = best_mean_squared_error
+	results["tile_per_polygon"] = best_tile_per_polygon
+	results["n_restarts"] = n_restarts
+	results["cpu_seconds"] = cpu_seconds_used
+	return results
+
+
+#########################################################################
+### Create the code inside __main__ so that multiprocessing will work ###
+#########################################################################
+if __name__ == "__main__":
+	# Game modes to compare on and the number of seeds per game mode
+	all_game_modes = ["Seafarers: 8 Wide", "Seafarers: 9 Wide", "Seafarers: 10 Wide"]
+	n_seeds = 3
+
+	# Compare the best MSE of the genetic search with that of restarted swaps given the same CPU time
+	for game_mode in all_game_modes:
+		for seed in range(n_seeds):
+			genetic_results = runGeneticSearch(game_mode = game_mode, n_workers = 1, seed = seed)
+			restart_results = runRestartedSwaps(game_mode = game_mode, cpu_seconds = genetic_results["cpu_seconds"], seed = seed)
+			print(game_mode + " (seed " + str(seed) + ", " + str(round(genetic_results["cpu_seconds"], 1)) + " CPU seconds): genetic search ---> " + str(genetic_results["mean_squared_error"]) +
+				  ", restarted swaps ---> " + str(restart_results["mean_squared_error"]) + " (" + str(restart_results["n_restarts"]) + " restarts)")
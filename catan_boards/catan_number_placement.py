@@ -0,0 +1,258 @@
+##########################################
+### Import needed general dependencies ###
+##########################################
+# Add paths for internal modules
+# Import dependencies
+from pathlib import Path
+from sys import path
+# Get the shared active projects folder
+active_projects_folder = Path(__file__).parent.parent
+# Get the shared parent folder
+parent_folder = active_projects_folder.parent
+# Get the shared infrastructure folder
+infrastructure_folder = parent_folder.joinpath("infrastructure")
+# Add the needed paths
+path.insert(0, str(infrastructure_folder.joinpath("board_games")))
+path.insert(0, str(infrastructure_folder.joinpath("common_needs")))
+
+# Built-in modules
+from typing import Any
+
+# Internal modules
+from catan_board_core import ALL_GAME_MODES, ALL_TILE_TYPES, NUMBER_COUNTS_PER_MODE, ROW_COUNTS_PER_MODE, computeHexLayout
+from catan_generator_engine import CatanGeneratorEngine
+
+# External modules
+from numpy import random
+
+
+################################################
+### Define shared settings for number tokens ###
+################################################
+# Define the tile types which never receive a number token
+UNNUMBERED_TILE_TYPES = ["desert", "water"]
+
+# Define the number of pips (i.e. ways to roll with two dice, out of 36) on each number token
+PIPS_PER_NUMBER = {number: 6 - abs(7 - number) for number in [2, 3, 4, 5, 6, 8, 9, 10, 11, 12]}
+
+# Define the order in which surplus tokens are left out when a game mode has more tokens than numbered tiles (least likely first)
+SURPLUS_NUMBER_ORDER = [2, 12, 3, 11, 4, 10, 5, 9, 6, 8]
+
+# Define the pairs of numbers which may not sit on adjacent tiles by default (i.e. no two red numbers touch)
+DEFAULT_SEPARATED_NUMBER_PAIRS = [(6, 6), (6, 8), (8, 8)]
+
+def selectNumberTokens(game_mode:str, n_numbered_tiles:int) -> list:
+	# Return the list of number tokens to place for a game mode, leaving out the least likely surplus tokens if there are more tokens than numbered tiles
+	# Verify the inputs
+	assert game_mode in ALL_GAME_MODES, "selectNumberTokens: Provided value for 'game_mode' must be contained in the list ALL_GAME_MODES"
+	number_counts = dict(NUMBER_COUNTS_PER_MODE[game_mode])
+	n_surplus = sum(list(number_counts.values())) - n_numbered_tiles
+	assert n_surplus >= 0, "selectNumberTokens: The game mode '" + game_mode + "' has fewer number tokens than numbered tiles"
+
+	# Leave out the surplus tokens, cycling through the least likely numbers
+	while n_surplus > 0:
+		for number in SURPLUS_NUMBER_ORDER:
+			if n_surplus > 0 and number_counts.get(number, 0) > 0:
+				number_counts[number] -= 1
+				n_surplus -= 1
+
+	# Return the tokens in increasing order
+	return [number for number in sorted(number_counts) for _ in range(number_counts[number])]
+
+
+######################################################
+### Define the number token placement engine class ###
+######################################################
+# Note: like CatanGeneratorEngine, this class is trusted and keeps all of its scoring incremental
+#       The score balances the mean pips per tile of each resource and the pip totals of the vertices where three numbered tiles meet,
+#       while the separated number pairs are hard rules tracked by a violation counter which no accepted swap may raise
+class CatanNumberPlacement:
+	### Initialize the class ###
+	def __init__(self, game_mode:str, tile_per_polygon:list, seed:int = None, separated_number_pairs:list = None, resource_weight:float = 1, vertex_weight:float = 1):
+		# Verify the inputs
+		assert game_mode in ALL_GAME_MODES, "CatanNumberPlacement::__init__: Provided value for 'game_mode' must be contained in the list ALL_GAME_MODES"
+		assert len(tile_per_polygon) == sum(ROW_COUNTS_PER_MODE[game_mode]), "CatanNumberPlacement::__init__: Provided value for 'tile_per_polygon' must be a list of length equal to the number of polygons in the game mode"
+		for value in tile_per_polygon:
+			assert value in ALL_TILE_TYPES, "CatanNumberPlacement::__init__: Provided value for 'tile_per_polygon' must be a list of valid tile types"
+		assert 0 <= resource_weight and 0 <= vertex_weight, "CatanNumberPlacement::__init__: Provided values for 'resource_weight' and 'vertex_weight' must be non-negative"
+
+		# Store the provided values
+		self.game_mode = game_mode
+		self.tile_per_polygon = list(tile_per_polygon)
+		self.random_state = random.RandomState(seed)
+		self.resource_weight = resource_weight
+		self.vertex_weight = vertex_weight
+		separated_number_pairs = DEFAULT_SEPARATED_NUMBER_PAIRS if separated_number_pairs is None else separated_number_pairs
+		self.separated_numbers_per_number = {number: set() for number in PIPS_PER_NUMBER}
+		for number_1, number_2 in separated_number_pairs:
+			self.separated_numbers_per_number[number_1].add(number_2)
+			self.separated_numbers_per_number[number_2].add(number_1)
+
+		# Store the shared adjacency along with the polygons which receive numbers
+		self.n_polygons = len(tile_per_polygon)
+		neighbor_indices_per_polygon = computeHexLayout(row_counts = ROW_COUNTS_PER_MODE[game_mode])["neighbor_indices_per_polygon"]
+		self.numbered_polygons = [polygon_index for polygon_index in range(self.n_polygons) if tile_per_polygon[polygon_index] not in UNNUMBERED_TILE_TYPES]
+		numbered_flags = [tile_type not in UNNUMBERED_TILE_TYPES for tile_type in tile_per_polygon]
+		self.numbered_neighbors_per_polygon = [[neighbor_index for neighbor_index in neighbor_indices_per_polygon[polygon_index] if numbered_flags[neighbor_index] == True] for polygon_index in range(self.n_polygons)]
+
+		# Find the vertices where three numbered tiles meet (i.e. triangles of mutually adjacent numbered polygons)
+		self.vertex_polygons = []
+		self.vertex_indices_per_polygon = [[] for _ in range(self.n_polygons)]
+		for polygon_index_1 in self.numbered_polygons:
+			for polygon_index_2 in self.numbered_neighbors_per_polygon[polygon_index_1]:
+				for polygon_index_3 in self.numbered_neighbors_per_polygon[polygon_index_2]:
+					if polygon_index_1 < polygon_index_2 and polygon_index_2 < polygon_index_3 and polygon_index_3 in self.numbered_neighbors_per_polygon[polygon_index_1]:
+						for polygon_index in [polygon_index_1, polygon_index_2, polygon_index_3]:
+							self.vertex_indices_per_polygon[polygon_index].append(len(self.vertex_polygons))
+						self.vertex_polygons.append((polygon_index_1, polygon_index_2, polygon_index_3))
+		self.n_vertices = len(self.vertex_polygons)
+
+		# Store the resource groups and the targets of the score
+		self.resource_types = [tile_type for tile_type in ALL_TILE_TYPES if tile_type not in UNNUMBERED_TILE_TYPES and tile_type in tile_per_polygon]
+		self.tile_count_per_resource = {tile_type: tile_per_polygon.count(tile_type) for tile_type in self.resource_types}
+
+		# Randomly deal the number tokens to the numbered polygons
+		tokens = selectNumberTokens(game_mode = game_mode, n_numbered_tiles = len(self.numbered_polygons))
+		self.mean_pips = sum([PIPS_PER_NUMBER[number] for number in tokens]) / len(tokens)
+		self.target_vertex_pips = 3 * self.mean_pips
+		self.number_per_polygon = [None for _ in range(self.n_polygons)]
+		for polygon_index, token_index in zip(self.numbered_polygons, self.random_state.permutation(len(tokens))):
+			self.number_per_polygon[polygon_index] = tokens[token_index]
+		self.initializeStorage()
+
+		# Repair the placement until no separated numbers touch
+		self.repairPlacement()
+
+	### Define functions for the cached storage and the score ###
+	def initializeStorage(self):
+		# Compute the pip totals, the violation counter and the score from scratch
+		self.pips_per_polygon = [0 if number is None else PIPS_PER_NUMBER[number] for number in self.number_per_polygon]
+		self.pips_per_resource = {tile_type: 0 for tile_type in self.resource_types}
+		for polygon_index in self.numbered_polygons:
+			self.pips_per_resource[self.tile_per_polygon[polygon_index]] += self.pips_per_polygon[polygon_index]
+		self.pips_per_vertex = [sum([self.pips_per_polygon[polygon_index] for polygon_index in polygons]) for polygons in self.vertex_polygons]
+		self.n_violations = sum([self.countViolationsAt(polygon_index, self.number_per_polygon[polygon_index]) for polygon_index in self.numbered_polygons]) // 2
+		self.resource_error = self.computeResourceError(self.pips_per_resource)
+		self.vertex_error = sum([(vertex_pips - self.target_vertex_pips)**2 for vertex_pips in self.pips_per_vertex])
+
+	def countViolationsAt(self, polygon_index:int, number:int) -> int:
+		# Count the numbered neighbors of a polygon holding numbers which may not sit next to the provided number
+		separated_numbers = self.separated_numbers_per_number[number]
+		return sum([1 for neighbor_index in self.numbered_neighbors_per_polygon[polygon_index] if self.number_per_polygon[neighbor_index] in separated_numbers])
+
+	def computeResourceError(self, pips_per_resource:dict) -> float:
+		# Compute the mean squared difference between the mean pips per tile of each resource and the overall mean pips per tile
+		return sum([(pips_per_resource[tile_type] / self.tile_count_per_resource[tile_type] - self.mean_pips)**2 for tile_type in self.resource_types]) / len(self.resource_types)
+
+	def getScore(self) -> float:
+		# Return the weighted score being minimized
+		return self.resource_weight * self.resource_error + self.vertex_weight * self.vertex_error / max(self.n_vertices, 1)
+
+	def getNumberPerPolygon(self) -> list:
+		# Return the number token on each polygon (None for polygons without a number)
+		return list(self.number_per_polygon)
+
+	### Define the functions used for swapping ###
+	def swapNumbers(self, polygon_index_1:int, polygon_index_2:int):
+		# Swap the numbers of two polygons and update the pip totals of their resources and vertices
+		number_1 = self.number_per_polygon[polygon_index_1]
+		number_2 = self.number_per_polygon[polygon_index_2]
+		pip_change = PIPS_PER_NUMBER[number_2] - PIPS_PER_NUMBER[number_1]
+		self.number_per_polygon[polygon_index_1] = number_2
+		self.number_per_polygon[polygon_index_2] = number_1
+		self.pips_per_polygon[polygon_index_1] += pip_change
+		self.pips_per_polygon[polygon_index_2] -= pip_change
+		self.pips_per_resource[self.tile_per_polygon[polygon_index_1]] += pip_change
+		self.pips_per_resource[self.tile_per_polygon[polygon_index_2]] -= pip_change
+		for vertex_index in self.vertex_indices_per_polygon[polygon_index_1]:
+			self.pips_per_vertex[vertex_index] += pip_change
+		for vertex_index in self.vertex_indices_per_polygon[polygon_index_2]:
+			self.pips_per_vertex[vertex_index] -= pip_change
+
+	def computeSwapChanges(self, polygon_index_1:int, polygon_index_2:int) -> tuple:
+		# Return the change in the violation count and the new resource and vertex errors if two polygons swapped numbers (in O(degree))
+		# Get the affected vertices before the swap
+		affected_vertices = set(self.vertex_indices_per_polygon[polygon_index_1]) | set(self.vertex_indices_per_polygon[polygon_index_2])
+		old_vertex_terms = sum([(self.pips_per_vertex[vertex_index] - self.target_vertex_pips)**2 for vertex_index in affected_vertices])
+		old_violations = self.countViolationsAt(polygon_index_1, self.number_per_polygon[polygon_index_1]) + self.countViolationsAt(polygon_index_2, self.number_per_polygon[polygon_index_2])
+
+		# Tentatively swap, measure and swap back
+		self.swapNumbers(polygon_index_1, polygon_index_2)
+		new_vertex_terms = sum([(self.pips_per_vertex[vertex_index] - self.target_vertex_pips)**2 for vertex_index in affected_vertices])
+		new_violations = self.countViolationsAt(polygon_index_1, self.number_per_polygon[polygon_index_1]) + self.countViolationsAt(polygon_index_2, self.number_per_polygon[polygon_index_2])
+		new_resource_error = self.resource_error if self.tile_per_polygon[polygon_index_1] == self.tile_per_polygon[polygon_index_2] else self.computeResourceError(self.pips_per_resource)
+		self.swapNumbers(polygon_index_1, polygon_index_2)
+
+		# Return the results
+		return new_violations - old_violations, new_resource_error, self.vertex_error + new_vertex_terms - old_vertex_terms
+
+	def proposeSwap(self) -> tuple:
+		# Randomly select two numbered polygons holding different numbers
+		numbered_polygons = self.numbered_polygons
+		while True:
+			polygon_index_1 = numbered_polygons[self.random_state.randint(len(numbered_polygons))]
+			polygon_index_2 = numbered_polygons[self.random_state.randint(len(numbered_polygons))]
+			if self.number_per_polygon[polygon_index_1] != self.number_per_polygon[polygon_index_2]:
+				return polygon_index_1, polygon_index_2
+
+	def step(self) -> bool:
+		# Perform a single swap step (keeping it only if it adds no violations and doesn't raise the score), return whether the swap was accepted
+		polygon_index_1, polygon_index_2 = self.proposeSwap()
+		violation_change, new_resource_error, new_vertex_error = self.computeSwapChanges(polygon_index_1, polygon_index_2)
+		new_score = self.resource_weight * new_resource_error + self.vertex_weight * new_vertex_error / max(self.n_vertices, 1)
+		if violation_change > 0 or (violation_change == 0 and new_score > self.getScore()):
+			return False
+		self.swapNumbers(polygon_index_1, polygon_index_2)
+		self.n_violations += violation_change
+		self.resource_error = new_resource_error
+		self.vertex_error = new_vertex_error
+		return True
+
+	def runSwaps(self, n_steps:int) -> list:
+		# Perform the needed number of swap steps and return the pre-swap score of each step
+		scores = []
+		for _ in range(n_steps):
+			scores.append(self.getScore())
+			self.step()
+		return scores
+
+	def repairPlacement(self, max_attempts:int = 100000):
+		# Randomly swap numbers, keeping any swap which doesn't raise the violation count, until no separated numbers touch
+		for _ in range(max_attempts):
+			if self.n_violations == 0:
+				return
+			polygon_index_1, polygon_index_2 = self.proposeSwap()
+			violation_change, new_resource_error, new_vertex_error = self.computeSwapChanges(polygon_index_1, polygon_index_2)
+			if violation_change <= 0:
+				self.swapNumbers(polygon_index_1, polygon_index_2)
+				self.n_violations += violation_change
+				self.resource_error = new_resource_error
+				self.vertex_error = new_vertex_error
+		assert self.n_violations == 0, "CatanNumberPlacement::repairPlacement: Unable to separate the needed numbers within the allowed number of attempts"
+
+
+############################################################
+### Define the function which generates a complete board ###
+############################################################
+def generateCompleteBoard(game_mode:str, seed:int = None, n_tile_steps:int = 5000, n_number_steps:int = 2000, skew_power:Any = 2, normalize_type:str = "static",
+						  constraint_set:Any = None, ring_weights:list = None, separated_number_pairs:list = None) -> dict:
+	# Optimize the tiles and then place the number tokens in a single pass, return the complete board
+	# Optimize the tiles with the trusted engine
+	engine = CatanGeneratorEngine(game_mode = game_mode, skew_power = skew_power, reject_flag = True, normalize_type = normalize_type, seed = seed, constraint_set = constraint_set, ring_weights = ring_weights)
+	engine.runSwaps(n_steps = n_tile_steps)
+	tile_per_polygon = engine.getTilePerPolygon()
+
+	# Place the numbers on the optimized tiles
+	number_seed = None if seed is None else [seed, 2]
+	placement = CatanNumberPlacement(game_mode = game_mode, tile_per_polygon = tile_per_polygon, seed = number_seed, separated_number_pairs = separated_number_pairs)
+	placement.runSwaps(n_steps = n_number_steps)
+
+	# Return the results
+	board = {}
+	board["game_mode"] = game_mode
+	board["tile_per_polygon"] = tile_per_polygon
+	board["number_per_polygon"] = placement.getNumberPerPolygon()
+	board["mean_squared_error"] = engine.getMeanSquaredError()
+	board["efficiency_per_tile_type"] = engine.getEfficiencyPerTileType()
+	board["number_score"] = placement.getScore()
+	return board
@@ -0,0 +1,152 @@
+##########################################
+### Import needed general dependencies ###
+##########################################
+# Built-in modules
+from pathlib import Path
+from threading import Thread
+from typing import Any
+from webbrowser import open as openInBrowser
+
+# External modules
+from numpy import arange, asarray, bincount, clip, floor, lexsort, maximum, minimum, nan, round as np_round, sort, where, zeros
+import plotly.graph_objects as go
+
+
+########################################################
+### Define functions for reducing large scatter data ###
+########################################################
+def decimateStratified(x_values:Any, y_values:Any, color_values:Any, max_points:int, n_bins_per_axis:int = 50) -> Any:
+	# Return the sorted indices of a subset of at most roughly max_points points which keeps every occupied region of the plane
+	# Note: points are stratified by a grid over the x and y ranges, and within each cell the kept points are spread evenly over the cell's color order
+	#       so that the extremes and the distribution of the color values survive in every region
+	# Verify the inputs
+	assert type(max_points) == int and max_points > 0, "decimateStratified: Provided value for 'max_points' must be a positive int object"
+	assert type(n_bins_per_axis) == int and n_bins_per_axis > 0, "decimateStratified: Provided value for 'n_bins_per_axis' must be a positive int object"
+	x_values = asarray(x_values, dtype = float)
+	y_values = asarray(y_values, dtype = float)
+	color_values = asarray(color_values, dtype = float)
+	n_points = len(x_values)
+	if n_points <= max_points:
+		return arange(n_points)
+
+	# Assign each point to its grid cell
+	cell_indices = computeCellIndices(values = x_values, n_bins = n_bins_per_axis) * n_bins_per_axis + computeCellIndices(values = y_values, n_bins = n_bins_per_axis)
+
+	# Sort the points by cell and then by color, and get the rank of each point within its cell
+	order = lexsort((color_values, cell_indices))
+	sorted_cells = cell_indices[order]
+	points_per_cell = bincount(sorted_cells, minlength = n_bins_per_axis**2)
+	first_position_per_cell = zeros(len(points_per_cell), dtype = int)
+	first_position_per_cell[1:] = points_per_cell.cumsum()[:-1]
+	rank_in_cell = arange(n_points) - first_position_per_cell[sorted_cells]
+
+	# Keep a number of points proportional to the size of each cell spread evenly over the color ranks, always including the smallest and largest color of each cell
+	size_per_point = points_per_cell[sorted_cells]
+	quota_per_point = minimum(maximum(np_round(size_per_point * max_points / n_points), 1), size_per_point)
+	keep_flags = floor((rank_in_cell + 1) * quota_per_point / size_per_point) > floor(rank_in_cell * quota_per_point / size_per_point)
+	keep_flags |= rank_in_cell == 0
+	return sort(order[keep_flags])
+
+def binDensity(x_values:Any, y_values:Any, color_values:Any, n_bins_per_axis:int = 100) -> dict:
+	# Bin the points on a grid over the x and y ranges, returning the bin centers along with the count and the mean color value of each bin
+	# Verify the inputs
+	assert type(n_bins_per_axis) == int and n_bins_per_axis > 0, "binDensity: Provided value for 'n_bins_per_axis' must be a positive int object"
+	x_values = asarray(x_values, dtype = float)
+	y_values = asarray(y_values, dtype = float)
+	color_values = asarray(color_values, dtype = float)
+
+	# Accumulate the counts and color sums of each bin (stored as [y bin, x bin] for plotting)
+	x_bins = computeCellIndices(values = x_values, n_bins = n_bins_per_axis)
+	y_bins = computeCellIndices(values = y_values, n_bins = n_bins_per_axis)
+	flat_bins = y_bins * n_bins_per_axis + x_bins
+	counts = bincount(flat_bins, minlength = n_bins_per_axis**2)
+	color_sums = bincount(flat_bins, weights = color_values, minlength = n_bins_per_axis**2)
+
+	# Return the results (empty bins get no color)
+	binned_data = {}
+	binned_data["x_centers"] = computeBinCenters(values = x_values, n_bins = n_bins_per_axis)
+	binned_data["y_centers"] = computeBinCenters(values = y_values, n_bins = n_bins_per_axis)
+	binned_data["counts"] = counts.reshape(n_bins_per_axis, n_bins_per_axis)
+	binned_data["mean_colors"] = where(counts > 0, color_sums / maximum(counts, 1), nan).reshape(n_bins_per_axis, n_bins_per_axis)
+	return binned_data
+
+def computeCellIndices(values:Any, n_bins:int) -> Any:
+	# Return the index of the equal-width bin (over the range of the values) containing each value
+	min_value = values.min()
+	width = max(values.max() - min_value, 1e-300) / n_bins
+	return clip(floor((values - min_value) / width).astype(int), 0, n_bins - 1)
+
+def computeBinCenters(values:Any, n_bins:int) -> Any:
+	# Return the centers of the equal-width bins used by computeCellIndices
+	min_value = values.min()
+	width = max(values.max() - min_value, 1e-300) / n_bins
+	return min_value + (arange(n_bins) + 0.5) * width
+
+
+###########################################################
+### Define functions for creating and rendering figures ###
+###########################################################
+def createColoredScatterFigure(x_values:Any, y_values:Any, color_values:Any, color_scale:list, c_min:float, c_max:float, hover_labels:list, reduction_type:str = "decimate",
+							   webgl_threshold:int = 5000, max_points:int = 50000, n_bins_per_axis:int = 100, n_total_points:int = None) -> go.Figure:
+	# Create a scatter figure of points colored by a value, switching to WebGL and reducing the data once there are too many points for SVG
+	# Note: hover_labels holds the names of x, y and the color value
+	#       If the points were already reduced (e.g. sampled in SQLite), n_total_points is the number of points they stand for, which is shown on the figure, and they aren't decimated again
+	# Verify the inputs
+	assert len(x_values) == len(y_values) and len(x_values) == len(color_values), "createColoredScatterFigure: Provided values for 'x_values', 'y_values' and 'color_values' must have equal lengths"
+	assert reduction_type in ["decimate", "density"], "createColoredScatterFigure: Provided value for 'reduction_type' must be 'decimate' or 'density'"
+	assert type(webgl_threshold) == int and webgl_threshold > 0, "createColoredScatterFigure: Provided value for 'webgl_threshold' must be a positive int object"
+	n_points = len(x_values)
+	n_total_points = n_points if n_total_points is None else n_total_points
+	marker = {"colorscale": color_scale, "showscale": True, "cmin": c_min, "cmax": c_max}
+	hover_template = ("<b>" + hover_labels[0] + ":</b> %{x}<br>"
+					  "<b>" + hover_labels[1] + ":</b> %{y}<br>"
+					  "<b>" + hover_labels[2] + ":</b> %{marker.color}<br>"
+					  "<extra></extra>")
+
+	# Create the figure, using the plain SVG scatter trace for small data
+	fig = go.Figure()
+	if n_points <= webgl_threshold:
+		fig.add_trace(go.Scatter(x = list(x_values), y = list(y_values), showlegend = False, hovertemplate = hover_template, mode = "markers", marker = dict(marker, color = list(color_values))))
+	elif reduction_type == "decimate":
+		kept_indices = arange(n_points) if n_total_points > n_points else decimateStratified(x_values = x_values, y_values = y_values, color_values = color_values, max_points = max_points)
+		x_values = asarray(x_values, dtype = float)
+		y_values = asarray(y_values, dtype = float)
+		color_values = asarray(color_values, dtype = float)
+		fig.add_trace(go.Scattergl(x = x_values[kept_indices], y = y_values[kept_indices], showlegend = False, hovertemplate = hover_template, mode = "markers", marker = dict(marker, color = color_values[kept_indices])))
+	else:
+		binned_data = binDensity(x_values = x_values, y_values = y_values, color_values = color_values, n_bins_per_axis = n_bins_per_axis)
+		return createDensityFigure(binned_data = binned_data, color_scale = color_scale, c_min = c_min, c_max = c_max, hover_labels = hover_labels)
+	if n_total_points > len(fig.data[0].x):
+		fig.add_annotation(text = "showing " + str(len(fig.data[0].x)) + " of " + str(n_total_points) + " points", xref = "paper", yref = "paper", x = 1, y = 1.02, showarrow = False)
+
+	# Return the figure
+	return fig
+
+def createDensityFigure(binned_data:dict, color_scale:list, c_min:float, c_max:float, hover_labels:list) -> go.Figure:
+	# Create a heatmap figure of binned points (in the format of binDensity) colored by the mean value of each bin
+	# Note: hover_labels holds the names of x, y and the color value
+	fig = go.Figure()
+	fig.add_trace(go.Heatmap(x = binned_data["x_centers"], y = binned_data["y_centers"], z = binned_data["mean_colors"], customdata = binned_data["counts"], colorscale = color_scale, zmin = c_min, zmax = c_max,
+							 hovertemplate = ("<b>" + hover_labels[0] + ":</b> %{x}<br>"
+											  "<b>" + hover_labels[1] + ":</b> %{y}<br>"
+											  "<b>Mean " + hover_labels[2] + ":</b> %{z}<br>"
+											  "<b>Number Of Points:</b> %{customdata}<br>"
+											  "<extra></extra>")))
+	return fig
+
+def writeFiguresInBackground(figures:list, html_paths:list, open_flag:bool = True) -> Thread:
+	# Write the figures to html files (loading plotly.js from its CDN to keep each file small) on a background thread, return the started thread
+	# Verify the inputs
+	assert len(figures) == len(html_paths), "writeFiguresInBackground: Provided values for 'figures' and 'html_paths' must have equal lengths"
+
+	# Define the work done on the thread
+	def writeFigures():
+		for fig, html_path in zip(figures, html_paths):
+			fig.write_html(str(html_path), include_plotlyjs = "cdn")
+			if open_flag == True:
+				openInBrowser(Path(html_path).resolve().as_uri())
+
+	# Start and return the thread
+	writer_thread = Thread(target = writeFigures, daemon = False)
+	writer_thread.start()
+	return writer_thread
@@ -0,0 +1,165 @@
+##########################################
+### Import needed general dependencies ###
+##########################################
+# Add paths for internal modules
+# Import dependencies
+from pathlib import Path
+from sys import path
+# Get the shared active projects folder
+active_projects_folder = Path(__file__).parent.parent
+# Get the shared parent folder
+parent_folder = active_projects_folder.parent
+# Get the shared infrastructure folder
+infrastructure_folder = parent_folder.joinpath("infrastructure")
+# Add the needed paths
+path.insert(0, str(infrastructure_folder.joinpath("board_games")))
+path.insert(0, str(infrastructure_folder.joinpath("common_needs")))
+
+# Built-in modules
+from json import dumps, loads
+from typing import Any
+
+# Internal modules
+from catan_board_core import ALL_TILE_TYPES, ROW_COUNTS_PER_MODE, TARGET_EFFICIENCY_PER_TUPLE, computeHexLayout
+from catan_generator_engine import CatanGeneratorEngine
+
+# External modules
+from numpy import abs as np_abs, array, cumsum, int32, load, log2, savez_compressed, uint16, where, zeros
+
+
+#########################################################
+### Define functions for recording and storing traces ###
+#########################################################
+# Note: a trace holds only the settings, the initial tiling and one (polygon_index_1, polygon_index_2, accepted) triple per step
+#       Every derived value (efficiencies, normalized errors, mean squared errors) is recomputed on demand by CatanSwapTraceReplayer
+def recordSwapTrace(game_mode:str, seed:int, n_steps:int, skew_power:Any = 1, reject_flag:bool = False, normalize_type:str = "static") -> dict:
+	# Run a simulation with the generator engine and return its compact trace
+	# Verify the inputs (leaving the remaining checks to the engine)
+	assert type(n_steps) == int and n_steps > 0, "recordSwapTrace: Provided value for 'n_steps' must be a positive int object"
+
+	# Run the simulation
+	engine = CatanGeneratorEngine(game_mode = game_mode, skew_power = skew_power, reject_flag = reject_flag, normalize_type = normalize_type, seed = seed)
+	tile_per_polygon = engine.getTilePerPolygon()
+	polygon_indices_1, polygon_indices_2, accepted_flags = engine.recordSwaps(n_steps = n_steps)
+
+	# Create and return the trace
+	trace = {}
+	trace["game_mode"] = game_mode
+	trace["seed"] = seed
+	trace["skew_power"] = skew_power
+	trace["reject_flag"] = reject_flag
+	trace["normalize_type"] = normalize_type
+	trace["tile_per_polygon"] = tile_per_polygon
+	trace["polygon_indices"] = array([polygon_indices_1, polygon_indices_2], dtype = uint16).T
+	trace["accepted_flags"] = array(accepted_flags, dtype = bool)
+	return trace
+
+def saveSwapTraces(traces:list, trace_path:str):
+	# Save a list of traces to a single compressed npz file
+	arrays = {}
+	for trace_index, trace in enumerate(traces):
+		settings = {key: value for key, value in trace.items() if key not in ["polygon_indices", "accepted_flags"]}
+		arrays["settings_" + str(trace_index)] = array(dumps(settings))
+		arrays["polygon_indices_" + str(trace_index)] = trace["polygon_indices"]
+		arrays["accepted_flags_" + str(trace_index)] = trace["accepted_flags"]
+	with open(trace_path, "wb") as trace_file:
+		savez_compressed(trace_file, n_traces = array(len(traces)), **arrays)
+
+def loadSwapTraces(trace_path:str) -> list:
+	# Load the list of traces saved with saveSwapTraces
+	traces = []
+	with load(trace_path) as stored_arrays:
+		for trace_index in range(int(stored_arrays["n_traces"])):
+			trace = loads(str(stored_arrays["settings_" + str(trace_index)]))
+			trace["polygon_indices"] = stored_arrays["polygon_indices_" + str(trace_index)]
+			trace["accepted_flags"] = stored_arrays["accepted_flags_" + str(trace_index)]
+			traces.append(trace)
+	return traces
+
+
+############################################
+### Define the swap trace replayer class ###
+############################################
+class CatanSwapTraceReplayer:
+	### Initialize the class ###
+	def __init__(self, trace:dict):
+		# Replay the swaps once to get the change in neighbor counts proposed by every step, from which all metrics are derived
+		# Store the settings and encode the tiling using the tile types which actually appear in it
+		self.trace = trace
+		self.game_mode = trace["game_mode"]
+		self.n_steps = len(trace["accepted_flags"])
+		self.needed_tile_types = [tile_type for tile_type in ALL_TILE_TYPES if tile_type in trace["tile_per_polygon"]]
+		self.n_types = len(self.needed_tile_types)
+		code_per_polygon = [self.needed_tile_types.index(tile_type) for tile_type in trace["tile_per_polygon"]]
+		self.target_per_code = array([TARGET_EFFICIENCY_PER_TUPLE[(self.game_mode, tile_type)] for tile_type in self.needed_tile_types])
+
+		# Count the initial number of neighbors of each tile code belonging to each tile code
+		neighbor_indices_per_polygon = computeHexLayout(row_counts = ROW_COUNTS_PER_MODE[self.game_mode])["neighbor_indices_per_polygon"]
+		self.initial_neighbor_counts = zeros((self.n_types, self.n_types), dtype = int32)
+		for polygon_index_1, neighbor_indices in neighbor_indices_per_polygon.items():
+			for polygon_index_2 in neighbor_indices:
+				self.initial_neighbor_counts[code_per_polygon[polygon_index_1], code_per_polygon[polygon_index_2]] += 1
+
+		# Compute the change in neighbor counts proposed by each step as well as the tile codes swapped (applying only the accepted swaps)
+		self.proposed_deltas = zeros((self.n_steps, self.n_types, self.n_types), dtype = int32)
+		self.code_pairs = zeros((self.n_steps, 2), dtype = int32)
+		for step_index, ((polygon_index_1, polygon_index_2), accepted_flag) in enumerate(zip(trace["polygon_indices"].tolist(), trace["accepted_flags"].tolist())):
+			# Get the codes being swapped
+			delta = self.proposed_deltas[step_index]
+			code_1 = code_per_polygon[polygon_index_1]
+			code_2 = code_per_polygon[polygon_index_2]
+			self.code_pairs[step_index] = [code_1, code_2]
+
+			# Remove the links of both polygons, swap their codes and add the links back (in the same order as the engine)
+			for polygon_index, code in [(polygon_index_1, code_1), (polygon_index_2, code_2)]:
+				for neighbor_polygon_index in neighbor_indices_per_polygon[polygon_index]:
+					neighbor_code = code_per_polygon[neighbor_polygon_index]
+					delta[neighbor_code, code] -= 1
+					delta[code, neighbor_code] -= 1
+			code_per_polygon[polygon_index_1] = code_2
+			code_per_polygon[polygon_index_2] = code_1
+			for polygon_index, code in [(polygon_index_1, code_2), (polygon_index_2, code_1)]:
+				for neighbor_polygon_index in neighbor_indices_per_polygon[polygon_index]:
+					neighbor_code = code_per_polygon[neighbor_polygon_index]
+					delta[neighbor_code, code] += 1
+					delta[code, neighbor_code] += 1
+
+			# Undo the swap if it was rejected
+			if accepted_flag == False:
+				code_per_polygon[polygon_index_1] = code_1
+				code_per_polygon[polygon_index_2] = code_2
+
+	### Define external functions for reconstructing metrics for all steps at once ###
+	def getNeighborCounts(self, stage:str = "pre") -> Any:
+		# Return the neighbor counts before ("pre") or after ("post") the proposed swap of each step as an array of shape (n_steps, n_types, n_types)
+		# Verify the inputs
+		assert stage in ["pre", "post"], "CatanSwapTraceReplayer::getNeighborCounts: Provided value for 'stage' must be 'pre' or 'post'"
+
+		# Accumulate the changes of the accepted swaps made before each step
+		accepted_deltas = self.proposed_deltas * self.trace["accepted_flags"][:, None, None]
+		pre_neighbor_counts = self.initial_neighbor_counts + cumsum(accepted_deltas, axis = 0) - accepted_deltas
+		if stage == "pre":
+			return pre_neighbor_counts
+		return pre_neighbor_counts + self.proposed_deltas
+
+	def getEfficiencies(self, stage:str = "pre") -> Any:
+		# Return the efficiency (i.e. normalized entropy) of each tile code before or after the proposed swap of each step as an array of shape (n_steps, n_types)
+		neighbor_counts = self.getNeighborCounts(stage = stage)
+		prob_values = neighbor_counts / neighbor_counts.sum(axis = 2, keepdims = True)
+		marginal_entropies = where((prob_values > 0) & (prob_values < 1), -prob_values * log2(where(prob_values > 0, prob_values, 1)), 0)
+		return marginal_entropies.sum(axis = 2) / log2(self.n_types)
+
+	def getMeanSquaredErrors(self, stage:str = "pre") -> Any:
+		# Return the mean squared error between actual and target efficiency values before or after the proposed swap of each step
+		return ((self.target_per_code - self.getEfficiencies(stage = stage))**2).mean(axis = 1)
+
+	def getNormalizedErrors(self) -> Any:
+		# Return the pre-swap normalized error of each tile code at each step (as used for selecting tile types) as an array of shape (n_steps, n_types)
+		raw_errors = self.getEfficiencies(stage = "pre") - self.target_per_code
+		if self.trace["normalize_type"] == "static":
+			return 0.5 + raw_errors / 2
+		return 0.5 + raw_errors / (2 * np_abs(raw_errors).max(axis = 1, keepdims = True))
+
+	def getSwappedTileTypes(self) -> tuple:
+		# Return the lists of the 1st and 2nd tile types proposed for swapping at each step
+		return [self.needed_tile_types[code] for code in self.code_pairs[:, 0]], [self.needed_tile_types[code] for code in self.code_pairs[:, 1]]
@@ -0,0 +1,88 @@
+##########################################
+### Import needed general dependencies ###
+##########################################
+# Built-in modules
+from os import fsync, replace
+from pathlib import Path
+from pickle import dump, load
+from tempfile import NamedTemporaryFile
+from time import monotonic
+
+
+###################################################
+### Define the resumable sweep checkpoint class ###
+###################################################
+# Note: the checkpoint file holds the settings of the sweep, the ordered list of completed jobs (e.g. (setting, seed) tuples),
+#       the partial accumulators of the sweep and the snapshot of at most one job in progress
+#       It is always rewritten as a whole to a temporary file which then replaces the old one, so an interruption never leaves a partial file
+class SweepCheckpoint:
+	### Initialize the class ###
+	def __init__(self, checkpoint_path:str, settings:dict, save_interval_seconds:float = 60):
+		# Load the checkpoint file (if it exists) or start a new sweep
+		# Verify the inputs
+		assert type(settings) == dict, "SweepCheckpoint::__init__: Provided value for 'settings' must be a dict object"
+		assert 0 <= save_interval_seconds, "SweepCheckpoint::__init__: Provided value for 'save_interval_seconds' must be non-negative"
+
+		# Store the provided values
+		self.checkpoint_path = Path(checkpoint_path)
+		self.save_interval_seconds = save_interval_seconds
+		self.last_save_time = monotonic()
+
+		# Load the existing progress, making sure it belongs to a sweep with identical settings
+		if self.checkpoint_path.exists():
+			with open(self.checkpoint_path, "rb") as checkpoint_file:
+				contents = load(checkpoint_file)
+			assert contents["settings"] == settings, "SweepCheckpoint::__init__: Existing checkpoint file at '" + str(self.checkpoint_path) + "' was created with different settings"
+			self.resumed_flag = True
+		else:
+			contents = {"settings": settings, "completed_jobs": [], "state": {}, "active_job": None, "active_snapshot": None}
+			self.resumed_flag = False
+
+		# Store the progress
+		self.settings = contents["settings"]
+		self.completed_jobs = contents["completed_jobs"]
+		self.completed_job_set = set(self.completed_jobs)
+		self.state = contents["state"]
+		self.active_job = contents["active_job"]
+		self.active_snapshot = contents["active_snapshot"]
+
+	### Define external functions for tracking jobs ###
+	def isCompleted(self, job:tuple) -> bool:
+		# Return whether a job has already been completed
+		return job in self.completed_job_set
+
+	def getSnapshot(self, job:tuple) -> object:
+		# Return the snapshot saved for a job in progress (or None if the job wasn't the one in progress)
+		return self.active_snapshot if job == self.active_job else None
+
+	def updateSnapshot(self, job:tuple, snapshot:object):
+		# Record the snapshot of the job in progress and save the checkpoint file if enough time has passed
+		self.active_job = job
+		self.active_snapshot = snapshot
+		self.saveIfDue()
+
+	def completeJob(self, job:tuple):
+		# Mark a job as completed (the caller should have folded its results into the state first) and save if enough time has passed
+		assert job not in self.completed_job_set, "SweepCheckpoint::completeJob: Provided value for 'job' has already been completed"
+		self.completed_jobs.append(job)
+		self.completed_job_set.add(job)
+		self.active_job = None
+		self.active_snapshot = None
+		self.saveIfDue()
+
+	### Define external functions for writing the checkpoint file ###
+	def saveIfDue(self):
+		# Save the checkpoint file if the save interval has passed since the last save
+		if monotonic() - self.last_save_time >= self.save_interval_seconds:
+			self.save()
+
+	def save(self):
+		# Atomically write the checkpoint file
+		contents = {"settings": self.settings, "completed_jobs": self.completed_jobs, "state": self.state, "active_job": self.active_job, "active_snapshot": self.active_snapshot}
+		self.checkpoint_path.parent.mkdir(parents = True, exist_ok = True)
+		with NamedTemporaryFile(mode = "wb", dir = self.checkpoint_path.parent, prefix = self.checkpoint_path.name + ".", suffix = ".tmp", delete = False) as temporary_file:
+			dump(contents, temporary_file)
+			temporary_file.flush()
+			fsync(temporary_file.fileno())
+		replace(temporary_file.name, self.checkpoint_path)
+		self.last_save_time = monotonic()
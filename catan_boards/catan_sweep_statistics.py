@@ -0,0 +1,178 @@
+##########################################
+### Import needed general dependencies ###
+##########################################
+# Built-in modules
+from statistics import NormalDist
+
+# External modules
+from numpy import arange, asarray, clip, cumsum, floor, log10, maximum, sqrt, zeros
+
+
+######################################################
+### Define the online mergeable statistics classes ###
+######################################################
+# Define a class which tracks the running mean and variance of a fixed-length array of values (e.g. one value per step index)
+class WelfordAccumulator:
+	### Initialize the class ###
+	def __init__(self, n_values:int):
+		# Verify the inputs
+		assert type(n_values) == int and n_values > 0, "WelfordAccumulator::__init__: Provided value for 'n_values' must be a positive int object"
+
+		# Initialize the storage
+		self.n_samples = 0
+		self.mean = zeros(n_values, dtype = float)
+		self.sum_squared_deviations = zeros(n_values, dtype = float)
+
+	### Define external functions for adding samples and reading results ###
+	def update(self, values:list):
+		# Add a single sample (one value per entry) using Welford's update
+		values = asarray(values, dtype = float)
+		assert values.shape == self.mean.shape, "WelfordAccumulator::update: Provided value for 'values' must have the same length as the accumulator"
+		self.n_samples += 1
+		delta = values - self.mean
+		self.mean += delta / self.n_samples
+		self.sum_squared_deviations += delta * (values - self.mean)
+
+	def merge(self, other:"WelfordAccumulator"):
+		# Combine the samples of another accumulator (e.g. from a worker process or an earlier run) into this one using Chan's parallel update
+		assert other.mean.shape == self.mean.shape, "WelfordAccumulator::merge: Provided value for 'other' must have the same length as the accumulator"
+		if other.n_samples == 0:
+			return
+		n_total = self.n_samples + other.n_samples
+		delta = other.mean - self.mean
+		self.mean += delta * (other.n_samples / n_total)
+		self.sum_squared_deviations += other.sum_squared_deviations + delta**2 * (self.n_samples * other.n_samples / n_total)
+		self.n_samples = n_total
+
+	def getVariance(self) -> list:
+		# Return the unbiased sample variance of each entry (zero until two samples have been added)
+		if self.n_samples < 2:
+			return zeros(self.mean.shape, dtype = float)
+		return maximum(self.sum_squared_deviations / (self.n_samples - 1), 0)
+
+	def getConfidenceInterval(self, confidence:float = 0.95) -> tuple:
+		# Return the lower and upper bounds of the normal-approximation confidence interval of each mean
+		assert 0 < confidence and confidence < 1, "WelfordAccumulator::getConfidenceInterval: Provided value for 'confidence' must be > 0 and < 1"
+		z_value = NormalDist().inv_cdf(0.5 + confidence / 2)
+		half_width = z_value * sqrt(self.getVariance() / max(1, self.n_samples))
+		return self.mean - half_width, self.mean + half_width
+
+
+# Define a class which tracks approximate quantiles of a fixed-length array of positive values using log-spaced histogram bins
+# Note: counts simply add when merging, and any quantile is accurate to within the relative width of a single bin
+class LogHistogramSketch:
+	### Initialize the class ###
+	def __init__(self, n_values:int, min_value:float = 1e-8, max_value:float = 1, n_bins_per_decade:int = 20):
+		# Verify the inputs
+		assert type(n_values) == int and n_values > 0, "LogHistogramSketch::__init__: Provided value for 'n_values' must be a positive int object"
+		assert 0 < min_value and min_value < max_value, "LogHistogramSketch::__init__: Provided values for 'min_value' and 'max_value' must satisfy 0 < min_value < max_value"
+		assert type(n_bins_per_decade) == int and n_bins_per_decade > 0, "LogHistogramSketch::__init__: Provided value for 'n_bins_per_decade' must be a positive int object"
+
+		# Store the bin settings (values outside the range are clipped into the first and last bins)
+		self.min_value = min_value
+		self.max_value = max_value
+		self.n_bins_per_decade = n_bins_per_decade
+		self.n_bins = int(round(n_bins_per_decade * log10(max_value / min_value)))
+
+		# Initialize the storage
+		self.n_samples = 0
+		self.counts = zeros((n_values, self.n_bins), dtype = int)
+
+	### Define external functions for adding samples and reading results ###
+	def update(self, values:list):
+		# Add a single sample (one value per entry) to the histograms
+		values = asarray(values, dtype = float)
+		assert values.shape == (self.counts.shape[0],), "LogHistogramSketch::update: Provided value for 'values' must have the same length as the sketch"
+		bin_indices = floor(self.n_bins_per_decade * log10(clip(values, self.min_value, self.max_value) / self.min_value)).astype(int)
+		self.counts[arange(len(values)), clip(bin_indices, 0, self.n_bins - 1)] += 1
+		self.n_samples += 1
+
+	def merge(self, other:"LogHistogramSketch"):
+		# Combine the samples of another sketch with identical settings into this one
+		assert other.counts.shape == self.counts.shape and other.min_value == self.min_value and other.n_bins_per_decade == self.n_bins_per_decade, \
+			"LogHistogramSketch::merge: Provided value for 'other' must have the same settings as the sketch"
+		self.counts += other.counts
+		self.n_samples += other.n_samples
+
+	def getQuantile(self, quantile:float) -> list:
+		# Return the approximate quantile of each entry (interpolating geometrically within the bin that contains it)
+		assert 0 <= quantile and quantile <= 1, "LogHistogramSketch::getQuantile: Provided value for 'quantile' must be >= 0 and <= 1"
+		assert self.n_samples > 0, "LogHistogramSketch::getQuantile: At least one sample must be added before reading quantiles"
+		cumulative_counts = cumsum(self.counts, axis = 1)
+		target_count = quantile * self.n_samples
+		bin_indices = clip((cumulative_counts < target_count).sum(axis = 1), 0, self.n_bins - 1)
+		entry_indices = arange(self.counts.shape[0])
+		counts_in_bin = maximum(self.counts[entry_indices, bin_indices], 1)
+		counts_before_bin = cumulative_counts[entry_indices, bin_indices] - self.counts[entry_indices, bin_indices]
+		fraction_in_bin = clip((target_count - counts_before_bin) / counts_in_bin, 0, 1)
+		return self.min_value * 10**((bin_indices + fraction_in_bin) / self.n_bins_per_decade)
+
+
+# Define a class which tracks the mean, variance and approximate quantiles of a fixed-length array of positive values (e.g. the MSE at each step index)
+class StepStatistics:
+	### Initialize the class ###
+	def __init__(self, n_values:int, min_value:float = 1e-8, max_value:float = 1, n_bins_per_decade:int = 20):
+		# Create the underlying accumulator and sketch
+		self.moments = WelfordAccumulator(n_values = n_values)
+		self.sketch = LogHistogramSketch(n_values = n_values, min_value = min_value, max_value = max_value, n_bins_per_decade = n_bins_per_decade)
+
+	### Define external functions for adding samples and reading results ###
+	def update(self, values:list):
+		# Add a single sample (one value per entry)
+		self.moments.update(values)
+		self.sketch.update(values)
+
+	def merge(self, other:"StepStatistics"):
+		# Combine the samples of another set of statistics with identical settings into this one
+		self.moments.merge(other.moments)
+		self.sketch.merge(other.sketch)
+
+	def getSampleCount(self) -> int:
+		# Return the number of samples added so far
+		return self.moments.n_samples
+
+	def getMean(self) -> list:
+		# Return the mean of each entry
+		return self.moments.mean.copy()
+
+	def getVariance(self) -> list:
+		# Return the unbiased sample variance of each entry
+		return self.moments.getVariance()
+
+	def getQuantile(self, quantile:float) -> list:
+		# Return the approximate quantile of each entry
+		return self.sketch.getQuantile(quantile = quantile)
+
+
+# Define a class which compares a set of settings against a reference setting using paired samples (e.g. common random numbers)
+class PairedComparison:
+	### Initialize the class ###
+	def __init__(self, all_settings:list, reference_setting:object, n_values:int):
+		# Verify the inputs
+		assert reference_setting in all_settings, "PairedComparison::__init__: Provided value for 'reference_setting' must be contained in 'all_settings'"
+
+		# Store the provided values and create one accumulator of differences per setting
+		self.all_settings = list(all_settings)
+		self.reference_setting = reference_setting
+		self.difference_accumulator_per_setting = {setting: WelfordAccumulator(n_values = n_values) for setting in self.all_settings if setting != reference_setting}
+
+	### Define external functions for adding samples and reading results ###
+	def update(self, values_per_setting:dict):
+		# Add one paired sample, i.e. the values of every setting obtained with the same random numbers
+		reference_values = asarray(values_per_setting[self.reference_setting], dtype = float)
+		for setting, accumulator in self.difference_accumulator_per_setting.items():
+			accumulator.update(asarray(values_per_setting[setting], dtype = float) - reference_values)
+
+	def merge(self, other:"PairedComparison"):
+		# Combine the paired samples of another comparison of the same settings into this one
+		assert other.reference_setting == self.reference_setting and other.all_settings == self.all_settings, "PairedComparison::merge: Provided value for 'other' must compare the same settings"
+		for setting, accumulator in self.difference_accumulator_per_setting.items():
+			accumulator.merge(other.difference_accumulator_per_setting[setting])
+
+	def getSummary(self, entry_index:int, confidence:float = 0.95) -> dict:
+		# Return the mean paired difference (setting minus reference) and its confidence interval at a single entry for every setting
+		summary = {}
+		for setting, accumulator in self.difference_accumulator_per_setting.items():
+			lower_bounds, upper_bounds = accumulator.getConfidenceInterval(confidence = confidence)
+			summary[setting] = {"mean": float(accumulator.mean[entry_index]), "lower": float(lower_bounds[entry_index]), "upper": float(upper_bounds[entry_index])}
+		return summary
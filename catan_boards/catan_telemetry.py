@@ -0,0 +1,205 @@
+##########################################
+### Import needed general dependencies ###
+##########################################
+# Built-in modules
+from json import dumps, loads
+from os import O_APPEND, O_CREAT, O_WRONLY, close, getpid, open as openFile, write
+from pathlib import Path
+from socket import gethostname
+from sys import platform
+from time import perf_counter, time
+from typing import Any
+
+
+############################################
+### Define shared settings for telemetry ###
+############################################
+# Define the default number of seconds between records of the same replica
+DEFAULT_INTERVAL_SECONDS = 5
+
+# Define the default number of seconds without a record after which an unfinished replica is considered stalled
+DEFAULT_STALL_SECONDS = 60
+
+
+#################################################
+### Define the functions for measuring memory ###
+#################################################
+def getMemoryFootprint() -> dict:
+	# Return the current and peak resident memory of this process in bytes (None for any value not available on this platform)
+	# Read the current resident memory (Linux only, reading /proc is far cheaper than any other approach)
+	rss_bytes = None
+	try:
+		from os import sysconf
+		with open("/proc/self/statm", "r") as statm_file:
+			rss_bytes = int(statm_file.read().split()[1]) * sysconf("SC_PAGE_SIZE")
+	except (ImportError, OSError, ValueError, IndexError):
+		pass
+
+	# Read the peak resident memory (the resource module is unavailable on Windows, and reports bytes rather than kilobytes on macOS)
+	peak_rss_bytes = None
+	try:
+		from resource import RUSAGE_SELF, getrusage
+		peak_rss_bytes = getrusage(RUSAGE_SELF).ru_maxrss * (1 if platform == "darwin" else 1024)
+	except ImportError:
+		pass
+
+	# Return the results
+	return {"rss_bytes": rss_bytes, "peak_rss_bytes": peak_rss_bytes}
+
+
+##################################
+### Define the telemetry class ###
+##################################
+# Note: each replica (i.e. a single engine run) reports its counters through update, which is only a clock read unless a record is due
+#       Records are appended to a JSON-lines file as single writes to a file opened in append mode, so any number of worker processes on
+#       the same machine can write to the same file without interleaving (or each to its own file), and readTelemetry merges them afterwards
+#       Each record holds the rates over the interval since the previous record of its replica as well as the totals since the replica started
+class CatanTelemetry:
+	### Initialize the class ###
+	def __init__(self, telemetry_path:str, interval_seconds:float = DEFAULT_INTERVAL_SECONDS, run_name:str = None):
+		# Verify the inputs
+		assert 0 <= interval_seconds, "CatanTelemetry::__init__: Provided value for 'interval_seconds' must be non-negative"
+		assert run_name is None or type(run_name) == str, "CatanTelemetry::__init__: Provided value for 'run_name' must be None or a str object"
+
+		# Store the provided values
+		self.telemetry_path = Path(telemetry_path)
+		self.interval_seconds = interval_seconds
+		self.run_name = run_name
+
+		# Open the file for appending (creating its folder if needed)
+		self.telemetry_path.parent.mkdir(parents = True, exist_ok = True)
+		self.file_descriptor = openFile(str(self.telemetry_path), O_WRONLY | O_CREAT | O_APPEND, 0o644)
+
+		# Initialize the storage
+		self.host = gethostname()
+		self.pid = getpid()
+		self.state_per_replica = {}
+
+	### Define functions for reporting progress ###
+	def update(self, replica_name:str, n_steps:int, n_acceptances:int, mean_squared_error:float, best_mean_squared_error:float, force_flag:bool = False) -> bool:
+		# Report the running counters of a replica, writing a record if the interval has passed (or force_flag is True), return whether one was written
+		# Start tracking the replica (if needed)
+		current_time = perf_counter()
+		if replica_name not in self.state_per_replica:
+			self.trackReplica(replica_name = replica_name, n_steps = n_steps, n_acceptances = n_acceptances, current_time = current_time)
+			force_flag = True
+
+		# Write a record only if one is due
+		replica_state = self.state_per_replica[replica_name]
+		if force_flag == False and current_time - replica_state["last_time"] < self.interval_seconds:
+			return False
+		self.emit(replica_name = replica_name, n_steps = n_steps, n_acceptances = n_acceptances, mean_squared_error = mean_squared_error,
+				  best_mean_squared_error = best_mean_squared_error, current_time = current_time, finished_flag = False)
+		return True
+
+	def updateFromEngine(self, replica_name:str, engine:Any, force_flag:bool = False) -> bool:
+		# Report the running counters of a CatanGeneratorEngine (see update)
+		counters = engine.getCounters()
+		return self.update(replica_name = replica_name, n_steps = counters["n_steps"], n_acceptances = counters["n_acceptances"], mean_squared_error = counters["mean_squared_error"],
+						   best_mean_squared_error = counters["best_mean_squared_error"], force_flag = force_flag)
+
+	def finishReplica(self, replica_name:str, engine:Any):
+		# Write the final record of a replica run by a CatanGeneratorEngine and stop tracking it
+		# Note: a replica which was never reported is only tracked (not recorded) first, so that it gets a single record rather than one with a near-zero interval
+		counters = engine.getCounters()
+		current_time = perf_counter()
+		if replica_name not in self.state_per_replica:
+			self.trackReplica(replica_name = replica_name, n_steps = counters["n_steps"], n_acceptances = counters["n_acceptances"], current_time = current_time)
+		self.emit(replica_name = replica_name, n_steps = counters["n_steps"], n_acceptances = counters["n_acceptances"], mean_squared_error = counters["mean_squared_error"],
+				  best_mean_squared_error = counters["best_mean_squared_error"], current_time = current_time, finished_flag = True)
+		del self.state_per_replica[replica_name]
+
+	def trackReplica(self, replica_name:str, n_steps:int, n_acceptances:int, current_time:float):
+		# Start tracking a replica from its current counters without writing a record
+		self.state_per_replica[replica_name] = {"start_time": current_time, "last_time": current_time, "last_n_steps": n_steps, "last_n_acceptances": n_acceptances,
+												"first_n_steps": n_steps, "first_n_acceptances": n_acceptances}
+
+	def emit(self, replica_name:str, n_steps:int, n_acceptances:int, mean_squared_error:float, best_mean_squared_error:float, current_time:float, finished_flag:bool):
+		# Write a single record for a tracked replica and move its interval forward
+		# Compute the rates over the last interval and since the start
+		replica_state = self.state_per_replica[replica_name]
+		interval_seconds = current_time - replica_state["last_time"]
+		interval_steps = n_steps - replica_state["last_n_steps"]
+		interval_acceptances = n_acceptances - replica_state["last_n_acceptances"]
+		total_steps = n_steps - replica_state["first_n_steps"]
+		total_acceptances = n_acceptances - replica_state["first_n_acceptances"]
+
+		# Create the record
+		record = {}
+		record["time"] = time()
+		record["host"] = self.host
+		record["pid"] = self.pid
+		record["run_name"] = self.run_name
+		record["replica"] = replica_name
+		record["finished_flag"] = finished_flag
+		record["elapsed_seconds"] = current_time - replica_state["start_time"]
+		record["n_steps"] = n_steps
+		record["n_acceptances"] = n_acceptances
+		record["steps_per_second"] = interval_steps / interval_seconds if interval_seconds > 0 else None
+		record["acceptance_rate"] = interval_acceptances / interval_steps if interval_steps > 0 else None
+		record["total_acceptance_rate"] = total_acceptances / total_steps if total_steps > 0 else None
+		record["mean_squared_error"] = mean_squared_error
+		record["best_mean_squared_error"] = best_mean_squared_error
+		record.update(getMemoryFootprint())
+
+		# Append the record as a single write (so that records of different processes never interleave)
+		write(self.file_descriptor, (dumps(record) + "\n").encode("utf-8"))
+
+		# Move the interval forward
+		replica_state["last_time"] = current_time
+		replica_state["last_n_steps"] = n_steps
+		replica_state["last_n_acceptances"] = n_acceptances
+
+	def close(self):
+		# Close the telemetry file (records already written stay valid)
+		if self.file_descriptor is not None:
+			close(self.file_descriptor)
+			self.file_descriptor = None
+
+
+########################################################
+### Define the functions for reading telemetry files ###
+########################################################
+def readTelemetry(telemetry_paths:list) -> list:
+	# Return every record of the provided JSON-lines files in time order, skipping any partially written last line
+	all_records = []
+	for telemetry_path in telemetry_paths:
+		with open(telemetry_path, "r") as telemetry_file:
+			for line in telemetry_file:
+				try:
+					all_records.append(loads(line))
+				except ValueError:
+					continue
+	all_records.sort(key = lambda record: record["time"])
+	return all_records
+
+def summarizeTelemetry(all_records:list, stall_seconds:float = DEFAULT_STALL_SECONDS, current_time:float = None) -> dict:
+	# Aggregate the records of any number of processes, return the latest record of each replica, the combined throughput of the unfinished replicas and those which look stalled
+	# Note: a replica is stalled if it hasn't finished and hasn't written a record in the last stall_seconds, which usually means its process died or hung
+	current_time = time() if current_time is None else current_time
+
+	# Keep the latest record of each replica (replicas are told apart by host and process as well as name)
+	latest_record_per_replica = {}
+	for record in all_records:
+		latest_record_per_replica[(record["host"], record["pid"], record["replica"])] = record
+
+	# Aggregate the results
+	active_records = [record for record in latest_record_per_replica.values() if record["finished_flag"] == False]
+	stalled_records = [record for record in active_records if current_time - record["time"] > stall_seconds]
+	summary = {}
+	summary["n_replicas"] = len(latest_record_per_replica)
+	summary["n_finished_replicas"] = len(latest_record_per_replica) - len(active_records)
+	summary["n_processes"] = len(set([(record["host"], record["pid"]) for record in latest_record_per_replica.values()]))
+	summary["total_steps"] = sum([record["n_steps"] for record in latest_record_per_replica.values()])
+	summary["steps_per_second"] = sum([record["steps_per_second"] for record in active_records if record not in stalled_records and record["steps_per_second"] is not None])
+	summary["best_mean_squared_error"] = min([record["best_mean_squared_error"] for record in latest_record_per_replica.values()], default = None)
+	summary["peak_rss_bytes_per_process"] = {}
+	for record in all_records:
+		if record["peak_rss_bytes"] is not None:
+			process_key = record["host"] + ":" + str(record["pid"])
+			summary["peak_rss_bytes_per_process"][process_key] = max(summary["peak_rss_bytes_per_process"].get(process_key, 0), record["peak_rss_bytes"])
+	summary["stalled_replicas"] = [record["replica"] for record in stalled_records]
+	summary["latest_record_per_replica"] = list(latest_record_per_replica.values())
+
+	# Return the results
+	return summary
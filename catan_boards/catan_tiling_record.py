@@ -0,0 +1,144 @@
+##########################################
+### Import needed general dependencies ###
+##########################################
+# Add paths for internal modules
+# Import dependencies
+from pathlib import Path
+from sys import path
+# Get the shared active projects folder
+active_projects_folder = Path(__file__).parent.parent
+# Get the shared parent folder
+parent_folder = active_projects_folder.parent
+# Get the shared infrastructure folder
+infrastructure_folder = parent_folder.joinpath("infrastructure")
+# Add the needed paths
+path.insert(0, str(infrastructure_folder.joinpath("board_games")))
+path.insert(0, str(infrastructure_folder.joinpath("common_needs")))
+
+# Built-in modules
+from typing import Any
+
+# Internal modules
+from catan_board_core import ALL_GAME_MODES, ALL_TILE_TYPES, ROW_COUNTS_PER_MODE, TARGET_EFFICIENCY_PER_TUPLE, TILE_COUNTS_PER_MODE, computeHexLayout
+
+# External modules
+from numpy import array, bincount, float64, frombuffer, log2, uint8, uint16, where
+
+
+#####################################################
+### Define the topology shared by every game mode ###
+#####################################################
+# Define the cache of shared topologies for each game mode (filled on first use)
+TOPOLOGY_PER_MODE = {}
+
+# Define a class holding everything about a game mode which doesn't depend on the tiling, created once and shared by all of its records
+class CatanModeTopology:
+	__slots__ = ("game_mode", "n_polygons", "tile_types", "code_per_tile", "n_types", "edge_indices_1", "edge_indices_2", "target_efficiencies", "maximum_entropy")
+
+	### Initialize the class ###
+	def __init__(self, game_mode:str):
+		# Verify the inputs
+		assert game_mode in ALL_GAME_MODES, "CatanModeTopology::__init__: Provided value for 'game_mode' must be contained in the list ALL_GAME_MODES"
+
+		# Store the tile types of the game mode and the code used for each
+		self.game_mode = game_mode
+		self.n_polygons = sum(ROW_COUNTS_PER_MODE[game_mode])
+		self.tile_types = [tile_type for tile_type in ALL_TILE_TYPES if TILE_COUNTS_PER_MODE[game_mode].get(tile_type, 0) > 0]
+		self.code_per_tile = {tile_type: code for code, tile_type in enumerate(self.tile_types)}
+		self.n_types = len(self.tile_types)
+
+		# Store the adjacency as a list of directed edges (each neighboring pair appears in both directions, as in the full class)
+		neighbor_indices_per_polygon = computeHexLayout(row_counts = ROW_COUNTS_PER_MODE[game_mode])["neighbor_indices_per_polygon"]
+		self.edge_indices_1 = array([polygon_index for polygon_index in range(self.n_polygons) for _ in neighbor_indices_per_polygon[polygon_index]], dtype = int)
+		self.edge_indices_2 = array([neighbor_index for polygon_index in range(self.n_polygons) for neighbor_index in neighbor_indices_per_polygon[polygon_index]], dtype = int)
+
+		# Store the constants used by the objective
+		self.target_efficiencies = array([TARGET_EFFICIENCY_PER_TUPLE[(game_mode, tile_type)] for tile_type in self.tile_types], dtype = float64)
+		self.maximum_entropy = float(log2(self.n_types))
+
+def getModeTopology(game_mode:str) -> CatanModeTopology:
+	# Return the shared topology of a game mode, creating it on first use
+	if game_mode not in TOPOLOGY_PER_MODE:
+		TOPOLOGY_PER_MODE[game_mode] = CatanModeTopology(game_mode = game_mode)
+	return TOPOLOGY_PER_MODE[game_mode]
+
+
+##############################################
+### Define the compact tiling record class ###
+##############################################
+# Note: a record holds only what differs between tilings of the same game mode, packed into bytes objects
+#       i.e. one uint8 code per polygon, the uint16 neighbor count matrix and the float64 efficiency per tile type, along with the cached MSE
+#       Everything else is shared through the topology of the game mode, so a record takes a few hundred bytes rather than a full tiling with its Board
+#       Records are immutable, so they can be held by the hundreds of thousands in populations, libraries and caches
+class CatanTilingRecord:
+	__slots__ = ("topology", "tile_codes", "neighbor_counts", "efficiencies", "mean_squared_error")
+
+	### Initialize the class ###
+	def __init__(self, game_mode:str, tile_per_polygon:list):
+		# Verify the inputs
+		topology = getModeTopology(game_mode = game_mode)
+		assert type(tile_per_polygon) == list and len(tile_per_polygon) == topology.n_polygons, "CatanTilingRecord::__init__: Provided value for 'tile_per_polygon' must be a list of length equal to the number of polygons in the game mode"
+		for value in tile_per_polygon:
+			assert value in topology.code_per_tile, "CatanTilingRecord::__init__: Provided value for 'tile_per_polygon' must contain only tile types used by the game mode"
+
+		# Encode the tiling and compute its cached values
+		code_per_tile = topology.code_per_tile
+		self.topology = topology
+		self.tile_codes = bytes([code_per_tile[tile_type] for tile_type in tile_per_polygon])
+		self.computeScores()
+
+	def computeScores(self):
+		# Compute the neighbor counts, efficiencies and MSE of the stored tile codes (in the same way as CatanGeneratorTiling.computeEntropyPerTileType)
+		topology = self.topology
+		n_types = topology.n_types
+		tile_codes = frombuffer(self.tile_codes, dtype = uint8).astype(int)
+		neighbor_counts = bincount(tile_codes[topology.edge_indices_1] * n_types + tile_codes[topology.edge_indices_2], minlength = n_types**2).reshape(n_types, n_types)
+		prob_values = neighbor_counts / neighbor_counts.sum(axis = 1, keepdims = True)
+		marginal_entropies = where((prob_values > 0) & (prob_values < 1), -prob_values * log2(where(prob_values > 0, prob_values, 1)), 0)
+		efficiencies = marginal_entropies.sum(axis = 1) / topology.maximum_entropy
+		self.neighbor_counts = neighbor_counts.astype(uint16).tobytes()
+		self.efficiencies = efficiencies.astype(float64).tobytes()
+		self.mean_squared_error = float(((topology.target_efficiencies - efficiencies)**2).mean())
+
+	### Define external functions for reading the record ###
+	def getGameMode(self) -> str:
+		# Return the game mode of the record
+		return self.topology.game_mode
+
+	def getTilePerPolygon(self) -> list:
+		# Return the tile type assigned to each polygon
+		tile_types = self.topology.tile_types
+		return [tile_types[code] for code in self.tile_codes]
+
+	def getNeighborCounts(self) -> Any:
+		# Return the matrix of neighbor counts, i.e. result[code_1, code_2] = number of neighbors of code_2 around tiles of code_1 (a read-only view)
+		n_types = self.topology.n_types
+		return frombuffer(self.neighbor_counts, dtype = uint16).reshape(n_types, n_types)
+
+	def getEfficiencyPerTileType(self) -> dict:
+		# Return the cached efficiency (i.e. normalized entropy) of each tile type
+		return dict(zip(self.topology.tile_types, frombuffer(self.efficiencies, dtype = float64).tolist()))
+
+	def getMeanSquaredError(self) -> float:
+		# Return the cached mean squared error between actual and target efficiency values
+		return self.mean_squared_error
+
+	### Define external functions for converting to and from the full classes ###
+	def toTiling(self, seed:int = None) -> Any:
+		# Create a full CatanGeneratorTiling (with its Board) holding this tiling, e.g. for rendering or interactive use
+		from catan_board_generator import CatanGeneratorTiling
+		tiling = CatanGeneratorTiling(game_mode = self.topology.game_mode, seed = seed)
+		tiling.overwriteTiling(tile_per_polygon = self.getTilePerPolygon())
+		return tiling
+
+	def __eq__(self, other:Any) -> bool:
+		# Records are equal if they hold the same tiling of the same game mode
+		return isinstance(other, CatanTilingRecord) and self.topology is other.topology and self.tile_codes == other.tile_codes
+
+	def __hash__(self) -> int:
+		# Hash the game mode and the tile codes (so that records can be used as set members and dictionary keys)
+		return hash((self.topology.game_mode, self.tile_codes))
+
+def createRecordFromTiling(tiling:Any) -> CatanTilingRecord:
+	# Create a compact record from a CatanGeneratorTiling or a CatanGeneratorEngine
+	return CatanTilingRecord(game_mode = tiling.getGameMode(), tile_per_polygon = tiling.getTilePerPolygon())
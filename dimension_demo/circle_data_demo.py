@@ -14,15 +14,10 @@ infrastructure_folder = parent_folder.joinpath("infrastructure")
 # Add the needed paths
 path.insert(0, str(infrastructure_folder.joinpath("dimensional_analysis")))
 
-# Built-in modules
-from math import sqrt
-
 # Internal modules
+from manifold_datasets import generateDataset
 from persistent_dimension import estimatePointwiseDimension, generateDimensionDatabase, plotDimensionEstimateOfPoint, plotDimensionEstimateOfSet
 
-# External modules
-from numpy import random
-
 
 #################################
 ### Set the needed parameters ###
@@ -77,24 +72,8 @@ if __name__ == "__main__":
 	#####################################################################################
 	### Generate the raw data and processed data from which figures will be generated ###
 	#####################################################################################
-	# Set the random seed (if needed)
-	if seed is not None:
-		random.seed(seed = seed)
-
-	# Generate the raw random data
-	raw_data_array = (2 * random.rand(n_points, n_parameters) - 1) * noise_level
-	for point_index in range(n_points):
-		# Generate the raw x-value and y-value
-		raw_x_value = random.randn()
-		raw_y_value = random.randn()
-
-		# Normalize to get the correct final values
-		x_value = circle_radius * raw_x_value / sqrt(raw_x_value**2 + raw_y_value**2)
-		y_value = circle_radius * raw_y_value / sqrt(raw_x_value**2 + raw_y_value**2)
-
-		# Store the computed values
-		raw_data_array[point_index, 0] += x_value
-		raw_data_array[point_index, 1] += y_value
+	# Generate the raw data, i.e. points on a circle padded with uniform noise (seeded by the random seed, if provided)
+	raw_data_array = generateDataset(shape = "circle", n_points = n_points, n_parameters = n_parameters, noise_level = noise_level, seed = seed, radius = circle_radius)
 
 	# Generate the dimension database and get the corresponding db file path
 	db_path = generateDimensionDatabase(raw_data_array = raw_data_array,
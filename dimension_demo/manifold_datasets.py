@@ -0,0 +1,136 @@
+##########################################
+### Import needed general dependencies ###
+##########################################
+# Built-in modules
+from typing import Any
+
+# External modules
+from numpy import array, cos, empty, float64, ndarray, pi, random, sin, sqrt, zeros
+
+
+###########################################
+### Define shared settings for datasets ###
+###########################################
+# Define the number of coordinates used by each shape before any noise padding
+N_COORDINATES_PER_SHAPE = {"circle": 2, "disk": 2, "sphere": 3, "ball": 3, "torus": 3}
+
+
+##################################################
+### Define the functions for random generators ###
+##################################################
+def createGenerator(seed:Any = None) -> random.Generator:
+	# Return a numpy Generator for the provided seed (an existing Generator is returned unchanged so that calls can share a stream)
+	if isinstance(seed, random.Generator):
+		return seed
+	return random.default_rng(seed = seed)
+
+
+##################################################
+### Define the generators for single manifolds ###
+##################################################
+def generateSpherePoints(n_points:int, n_coordinates:int, radius:float = 1, random_generator:random.Generator = None) -> ndarray:
+	# Return points drawn uniformly from the sphere of the provided radius in n_coordinates dimensions (i.e. a circle for 2 and the usual sphere for 3)
+	# Verify the inputs
+	assert type(n_points) == int and n_points >= 0, "generateSpherePoints: Provided value for 'n_points' must be a non-negative int object"
+	assert type(n_coordinates) == int and n_coordinates >= 1, "generateSpherePoints: Provided value for 'n_coordinates' must be a positive int object"
+	random_generator = createGenerator(seed = random_generator)
+
+	# Normalize standard normal draws, which are uniform in direction
+	points = random_generator.standard_normal((n_points, n_coordinates))
+	points *= radius / sqrt((points**2).sum(axis = 1, keepdims = True))
+	return points
+
+def generateBallPoints(n_points:int, n_coordinates:int, radius:float = 1, random_generator:random.Generator = None) -> ndarray:
+	# Return points drawn uniformly from the solid ball of the provided radius in n_coordinates dimensions (i.e. a disk for 2)
+	random_generator = createGenerator(seed = random_generator)
+	points = generateSpherePoints(n_points = n_points, n_coordinates = n_coordinates, radius = radius, random_generator = random_generator)
+	points *= random_generator.random((n_points, 1))**(1 / n_coordinates)
+	return points
+
+def generateTorusPoints(n_points:int, major_radius:float = 1, minor_radius:float = 0.25, random_generator:random.Generator = None) -> ndarray:
+	# Return points drawn uniformly (by area) from the surface of a torus in 3 dimensions, centered at the origin and symmetric about the z-axis
+	# Note: the tube angle is drawn by rejection, since the outer side of the tube has more area than the inner side, and every round is vectorized
+	# Verify the inputs
+	assert type(n_points) == int and n_points >= 0, "generateTorusPoints: Provided value for 'n_points' must be a non-negative int object"
+	assert 0 <= minor_radius and minor_radius <= major_radius, "generateTorusPoints: Provided value for 'minor_radius' must be >= 0 and <= major_radius"
+	random_generator = createGenerator(seed = random_generator)
+
+	# Draw the tube angles, keeping each with probability proportional to its distance from the axis
+	tube_angles = empty(n_points, dtype = float64)
+	n_accepted = 0
+	while n_accepted < n_points:
+		n_needed = n_points - n_accepted
+		candidate_angles = 2 * pi * random_generator.random(2 * n_needed)
+		accepted_flags = random_generator.random(2 * n_needed) * (major_radius + minor_radius) < major_radius + minor_radius * cos(candidate_angles)
+		accepted_angles = candidate_angles[accepted_flags][:n_needed]
+		tube_angles[n_accepted:n_accepted + len(accepted_angles)] = accepted_angles
+		n_accepted += len(accepted_angles)
+
+	# Draw the angles around the axis and convert to coordinates
+	axis_angles = 2 * pi * random_generator.random(n_points)
+	points = empty((n_points, 3), dtype = float64)
+	points[:, 0] = (major_radius + minor_radius * cos(tube_angles)) * cos(axis_angles)
+	points[:, 1] = (major_radius + minor_radius * cos(tube_angles)) * sin(axis_angles)
+	points[:, 2] = minor_radius * sin(tube_angles)
+	return points
+
+def generateShapePoints(shape:str, n_points:int, random_generator:random.Generator = None, radius:float = 1, minor_radius:float = 0.25) -> ndarray:
+	# Return points drawn uniformly from one of the shapes of N_COORDINATES_PER_SHAPE (the radius is the major radius for a torus)
+	assert shape in N_COORDINATES_PER_SHAPE, "generateShapePoints: Provided value for 'shape' must be one of " + ", ".join(N_COORDINATES_PER_SHAPE)
+	if shape == "torus":
+		return generateTorusPoints(n_points = n_points, major_radius = radius, minor_radius = minor_radius, random_generator = random_generator)
+	if shape in ["circle", "sphere"]:
+		return generateSpherePoints(n_points = n_points, n_coordinates = N_COORDINATES_PER_SHAPE[shape], radius = radius, random_generator = random_generator)
+	return generateBallPoints(n_points = n_points, n_coordinates = N_COORDINATES_PER_SHAPE[shape], radius = radius, random_generator = random_generator)
+
+
+##################################################
+### Define the functions for complete datasets ###
+##################################################
+def padWithNoise(points:ndarray, n_parameters:int, noise_level:float, random_generator:random.Generator = None) -> ndarray:
+	# Return the points placed in the first coordinates of n_parameters dimensions, with uniform noise in [-noise_level, noise_level] added to every coordinate
+	# Verify the inputs
+	assert type(n_parameters) == int and n_parameters >= points.shape[1], "padWithNoise: Provided value for 'n_parameters' must be an int object >= the number of coordinates of the points"
+	assert 0 <= noise_level, "padWithNoise: Provided value for 'noise_level' must be non-negative"
+	random_generator = createGenerator(seed = random_generator)
+
+	# Add the noise and the points
+	raw_data_array = (2 * random_generator.random((points.shape[0], n_parameters)) - 1) * noise_level
+	raw_data_array[:, :points.shape[1]] += points
+	return raw_data_array
+
+def generateMixturePoints(components:list, n_points:int, random_generator:random.Generator = None) -> ndarray:
+	# Return points drawn from a mixture of shapes, each point belonging to a random component chosen by weight
+	# Note: each component is a dict holding 'shape' along with the optional 'weight' (default 1), 'radius', 'minor_radius' and 'center' (list of coordinates)
+	#       Points keep the random order of their components, and the result has as many coordinates as the largest component (or center) needs
+	# Verify the inputs
+	assert type(components) == list and len(components) > 0, "generateMixturePoints: Provided value for 'components' must be a non-empty list object"
+	for component in components:
+		assert type(component) == dict and component.get("shape") in N_COORDINATES_PER_SHAPE, "generateMixturePoints: Provided value for 'components' must contain only dicts with a 'shape' from N_COORDINATES_PER_SHAPE"
+	random_generator = createGenerator(seed = random_generator)
+
+	# Assign every point to a component
+	weights = array([component.get("weight", 1) for component in components], dtype = float64)
+	component_indices = random_generator.choice(len(components), size = n_points, p = weights / weights.sum())
+
+	# Fill in the points of each component
+	n_coordinates = max([max(N_COORDINATES_PER_SHAPE[component["shape"]], len(component.get("center", []))) for component in components])
+	points = zeros((n_points, n_coordinates), dtype = float64)
+	for component_index, component in enumerate(components):
+		point_flags = component_indices == component_index
+		component_points = generateShapePoints(shape = component["shape"], n_points = int(point_flags.sum()), random_generator = random_generator,
+											   radius = component.get("radius", 1), minor_radius = component.get("minor_radius", 0.25))
+		points[point_flags, :component_points.shape[1]] = component_points
+		center = component.get("center", [])
+		points[point_flags, :len(center)] += array(center, dtype = float64)
+	return points
+
+def generateDataset(shape:str, n_points:int, n_parameters:int, noise_level:float = 0.05, seed:Any = None, **shape_settings) -> ndarray:
+	# Return a raw data array (ready for generateDimensionDatabase) of points from a shape (or "mixture"), padded with uniform noise into n_parameters dimensions
+	# Note: the shape settings are those of generateShapePoints (radius, minor_radius), or 'components' for a mixture
+	random_generator = createGenerator(seed = seed)
+	if shape == "mixture":
+		points = generateMixturePoints(components = shape_settings["components"], n_points = n_points, random_generator = random_generator)
+	else:
+		points = generateShapePoints(shape = shape, n_points = n_points, random_generator = random_generator, **shape_settings)
+	return padWithNoise(points = points, n_parameters = n_parameters, noise_level = noise_level, random_generator = random_generator)
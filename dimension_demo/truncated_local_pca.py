@@ -0,0 +1,155 @@
+##########################################
+### Import needed general dependencies ###
+##########################################
+# Built-in modules
+from math import log
+
+# External modules
+from numpy import argsort, array, clip, empty, exp as exp_array, float64, inf, int64, isinf, linalg, linspace, matmul, maximum, median, minimum, ndarray, savez_compressed, where, zeros
+from scipy.spatial import cKDTree
+
+
+######################################################
+### Define shared settings for truncated local PCA ###
+######################################################
+# Define the default softmax weight (relative to the point itself) below which neighbors are dropped
+DEFAULT_WEIGHT_CUTOFF = 10**-6
+
+# Define the default number of neighbor slots (points times neighbors per point) processed at once, which bounds the memory used
+DEFAULT_MAX_NEIGHBOR_SLOTS = 2**20
+
+
+###########################################################
+### Define the functions used by the truncated estimate ###
+###########################################################
+def computeSoftmaxDistances(min_softmax_distance:float, max_softmax_distance:float, n_distances:int) -> ndarray:
+	# Return the evenly spaced softmax distances (i.e. scales) at which the dimension is estimated
+	assert 0 < min_softmax_distance and min_softmax_distance <= max_softmax_distance, "computeSoftmaxDistances: Provided values must satisfy 0 < min_softmax_distance <= max_softmax_distance"
+	assert type(n_distances) == int and n_distances >= 1, "computeSoftmaxDistances: Provided value for 'n_distances' must be a positive int object"
+	return linspace(min_softmax_distance, max_softmax_distance, n_distances)
+
+def computeDroppedMomentBound(min_dropped_distance:ndarray, softmax_distance:float) -> ndarray:
+	# Return the largest value of weight * distance**2 = exp(-distance / softmax_distance) * distance**2 over all distances >= min_dropped_distance
+	# Note: the function increases up to distance = 2 * softmax_distance and decreases afterwards
+	bounded_distance = maximum(min_dropped_distance, 2 * softmax_distance)
+	return exp_array(-bounded_distance / softmax_distance) * bounded_distance**2
+
+def countDimensions(eigenvalues:ndarray, percent_variances:list) -> ndarray:
+	# Return the number of principal components needed to explain each percent variance, given ascending eigenvalues of shape (..., n_parameters)
+	# Note: a neighborhood with no variance (e.g. a point with no neighbors within the cutoff, or only duplicates of itself) has dimension 0
+	descending_eigenvalues = clip(eigenvalues[..., ::-1], 0, None)
+	total_variances = descending_eigenvalues.sum(axis = -1, keepdims = True)
+	explained_fractions = descending_eigenvalues.cumsum(axis = -1) / maximum(total_variances, 10**-300)
+	dimensions = empty(eigenvalues.shape[:-1] + (len(percent_variances),), dtype = int64)
+	for variance_index, percent_variance in enumerate(percent_variances):
+		dimensions[..., variance_index] = minimum((explained_fractions < percent_variance / 100 - 10**-12).sum(axis = -1) + 1, eigenvalues.shape[-1])
+	dimensions[total_variances[..., 0] <= 0] = 0
+	return dimensions
+
+def splitIntoChunks(sorted_counts:ndarray, max_neighbor_slots:int) -> list:
+	# Return (start, end) pairs splitting points sorted by neighbor count into chunks whose largest count times length fits in max_neighbor_slots
+	all_chunks = []
+	start_index = 0
+	while start_index < len(sorted_counts):
+		end_index = min(len(sorted_counts), start_index + max(1, max_neighbor_slots // sorted_counts[start_index]))
+		while end_index > start_index + 1 and sorted_counts[end_index - 1] * (end_index - start_index) > max_neighbor_slots:
+			end_index = start_index + (end_index - start_index) // 2
+		all_chunks.append((start_index, end_index))
+		start_index = end_index
+	return all_chunks
+
+
+#############################################
+### Define the truncated estimator itself ###
+#############################################
+# Note: the neighborhood of each point at a softmax distance s weights every point x_j by exp(-|x_j - x_i| / s), i.e. a softmax over negative distances
+#       The local covariance is the weighted second moment about x_i, and the dimension is the number of its principal components needed to explain
+#       a percent variance (0 where the neighborhood has no variance, which is flagged in zero_variance_flags)
+#       This weighting is this module's own definition and hasn't been checked against generateDimensionDatabase (whose module isn't part of this
+#       repository), so the results are a separate estimate, only verified against the same weighting evaluated over every point
+#       Here only the neighbors whose weight is at least weight_cutoff (i.e. within s * log(1 / weight_cutoff)) are found, using a KD-tree, so sparse
+#       scales cost about O(n_points * log(n_points)) rather than O(n_points**2); points are processed in order of neighbor count so memory stays bounded
+#       Every dropped point has weight below the cutoff and lies beyond the cutoff radius, which gives two bounds per point and scale:
+#       - weight_error_bounds: the largest fraction of the total softmax weight which could have been dropped
+#       - eigenvalue_error_bounds: the largest change of any covariance eigenvalue (by Weyl's inequality) relative to the trace of the truncated covariance
+#       If the dimension at a point changes only when an eigenvalue moves by more than the bound, the truncated estimate equals the full one
+#       Both bounds grow with the number of dropped points, so a weight_cutoff of about the wanted tolerance divided by n_points keeps them tight
+#       Scales comparable to the diameter of the set make every neighborhood nearly global, in which case the cost approaches the full computation
+def estimateLocalDimensions(raw_data_array:ndarray, softmax_distances:list, percent_variances:list, weight_cutoff:float = DEFAULT_WEIGHT_CUTOFF,
+							max_neighbor_slots:int = DEFAULT_MAX_NEIGHBOR_SLOTS, n_workers:int = -1, verbose_flag:bool = False) -> dict:
+	# Estimate the pointwise dimension of every point at every softmax distance and percent variance from truncated neighborhoods, return the results as a dictionary
+	# Verify the inputs
+	raw_data_array = array(raw_data_array, dtype = float64)
+	assert raw_data_array.ndim == 2 and raw_data_array.shape[0] > 0, "estimateLocalDimensions: Provided value for 'raw_data_array' must be a non-empty 2D array"
+	assert len(softmax_distances) > 0 and min(softmax_distances) > 0, "estimateLocalDimensions: Provided value for 'softmax_distances' must be a non-empty list of positive values"
+	assert len(percent_variances) > 0 and min(percent_variances) > 0 and max(percent_variances) <= 100, "estimateLocalDimensions: Provided value for 'percent_variances' must be a non-empty list of values in (0, 100]"
+	assert 0 < weight_cutoff and weight_cutoff < 1, "estimateLocalDimensions: Provided value for 'weight_cutoff' must be > 0 and < 1"
+	assert type(max_neighbor_slots) == int and max_neighbor_slots >= 1, "estimateLocalDimensions: Provided value for 'max_neighbor_slots' must be a positive int object"
+	n_points = raw_data_array.shape[0]
+	softmax_distances = array(softmax_distances, dtype = float64)
+	n_distances = len(softmax_distances)
+
+	# Build the tree, get the cutoff radius of each scale (i.e. where the weight falls to weight_cutoff) and count the neighbors of each point
+	tree = cKDTree(raw_data_array)
+	cutoff_radii = softmax_distances * log(1 / weight_cutoff)
+	neighbor_counts = tree.query_ball_point(raw_data_array, r = cutoff_radii.max(), return_length = True, workers = n_workers)
+	point_order = argsort(neighbor_counts, kind = "stable")
+	all_chunks = splitIntoChunks(sorted_counts = neighbor_counts[point_order], max_neighbor_slots = max_neighbor_slots)
+	if verbose_flag == True:
+		print("estimateLocalDimensions: " + str(n_points) + " points with " + str(int(median(neighbor_counts))) + " neighbors (median) in " + str(len(all_chunks)) + " chunks")
+
+	# Initialize the storage
+	dimensions = empty((n_points, n_distances, len(percent_variances)), dtype = int64)
+	weight_error_bounds = zeros((n_points, n_distances), dtype = float64)
+	eigenvalue_error_bounds = zeros((n_points, n_distances), dtype = float64)
+	zero_variance_flags = zeros((n_points, n_distances), dtype = bool)
+
+	# Process the chunks of points with similar neighbor counts
+	for start_index, end_index in all_chunks:
+		# Find the neighbors within the largest cutoff radius (padding with infinite distances for points with fewer neighbors than the chunk's largest)
+		point_indices = point_order[start_index:end_index]
+		n_neighbors = int(neighbor_counts[point_indices].max())
+		chunk_points = raw_data_array[point_indices]
+		distances, indices = tree.query(chunk_points, k = n_neighbors, distance_upper_bound = cutoff_radii.max(), workers = n_workers)
+		distances = distances.reshape(len(point_indices), n_neighbors)
+		found_flags = ~isinf(distances)
+		offsets = raw_data_array[where(found_flags, indices.reshape(len(point_indices), n_neighbors), 0)] - chunk_points[:, None, :]
+
+		for distance_index, softmax_distance in enumerate(softmax_distances):
+			# Weight the neighbors within the cutoff radius of this scale and compute the local covariances
+			# Note: the neighbors are sorted by distance, so only the leading columns up to the largest number kept are needed at smaller scales
+			kept_flags = found_flags & (distances <= cutoff_radii[distance_index])
+			n_kept = kept_flags.sum(axis = 1)
+			n_columns = int(n_kept.max())
+			weights = where(kept_flags[:, :n_columns], exp_array(-where(kept_flags[:, :n_columns], distances[:, :n_columns], 0) / softmax_distance), 0)
+			total_weights = weights.sum(axis = 1)
+			covariances = matmul((offsets[:, :n_columns] * weights[:, :, None]).transpose(0, 2, 1), offsets[:, :n_columns]) / total_weights[:, None, None]
+			eigenvalues = linalg.eigvalsh(covariances)
+
+			# Bound the effect of the dropped points, each of which is beyond the cutoff radius of this scale
+			n_dropped = n_points - n_kept
+			dropped_weights = n_dropped * exp_array(-cutoff_radii[distance_index] / softmax_distance)
+			dropped_moments = n_dropped * computeDroppedMomentBound(min_dropped_distance = cutoff_radii[distance_index], softmax_distance = softmax_distance)
+			traces = clip(eigenvalues, 0, None).sum(axis = 1)
+			weight_error_bounds[point_indices, distance_index] = dropped_weights / (total_weights + dropped_weights)
+			eigenvalue_error_bounds[point_indices, distance_index] = where(traces > 0, (dropped_moments + dropped_weights * eigenvalues[:, -1]) / total_weights / maximum(traces, 10**-300), inf)
+			zero_variance_flags[point_indices, distance_index] = traces <= 0
+
+			# Count the dimensions
+			dimensions[point_indices, distance_index] = countDimensions(eigenvalues = eigenvalues, percent_variances = percent_variances)
+
+	# Return the results
+	results = {}
+	results["softmax_distances"] = softmax_distances
+	results["percent_variances"] = array(percent_variances, dtype = float64)
+	results["dimensions"] = dimensions
+	results["weight_error_bounds"] = weight_error_bounds
+	results["eigenvalue_error_bounds"] = eigenvalue_error_bounds
+	results["zero_variance_flags"] = zero_variance_flags
+	results["n_neighbors"] = neighbor_counts
+	results["weight_cutoff"] = weight_cutoff
+	return results
+
+def saveLocalDimensions(results:dict, results_path:str):
+	# Save the results of estimateLocalDimensions to a compressed npz file (readable with numpy.load)
+	savez_compressed(results_path, **results)